@@ -29,7 +29,7 @@ gcloud run deploy $SERVICE_NAME \
     --max-instances 10 \
     --min-instances 1 \
     --timeout 300 \
-    --set-env-vars="PORT=8080" \
+    --set-env-vars="PORT=8080,TORCH_NUM_THREADS=2" \
     --quiet
 
 # 3. 배포된 URL 확인
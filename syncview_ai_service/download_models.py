@@ -0,0 +1,48 @@
+"""
+모델 다운로드 스크립트 (Docker 빌드 시 1회 실행)
+- Hugging Face Hub에서 모델을 받아 MODEL_DIR/<저장소 이름>에 safetensors 형식으로 저장
+  (pytorch_model.bin은 pickle 역직렬화로 전체를 메모리에 읽어야 하지만,
+   safetensors는 메모리 매핑으로 바로 읽어 콜드 스타트가 빨라짐)
+- 토크나이저/설정 파일도 같은 디렉터리에 저장해 실행 시 Hub 접속 없이 로딩
+- 사용법: python download_models.py [모델 이름 ...]  (기본: 전체)
+"""
+import os
+import sys
+import shutil
+
+from model_loader import MODEL_DIR, MODEL_REPOS
+
+
+def download(name: str) -> None:
+    from transformers import AutoTokenizer, AutoModelForSequenceClassification, AutoModelForSeq2SeqLM
+
+    repo_id = MODEL_REPOS[name]
+    target = os.path.join(MODEL_DIR, repo_id.replace("/", "--"))
+    model_class = AutoModelForSequenceClassification if name == "sentiment" else AutoModelForSeq2SeqLM
+
+    print(f"📥 {name}: {repo_id}")
+    tokenizer = AutoTokenizer.from_pretrained(repo_id)
+    model = model_class.from_pretrained(repo_id)
+
+    shutil.rmtree(target, ignore_errors=True)
+    tokenizer.save_pretrained(target)
+    model.save_pretrained(target, safe_serialization=True)
+    print(f"✅ {name}: {target}")
+
+
+def main() -> int:
+    names = sys.argv[1:] or list(MODEL_REPOS)
+    unknown = [name for name in names if name not in MODEL_REPOS]
+    if unknown:
+        print(f"❌ 알 수 없는 모델: {', '.join(unknown)} (가능: {', '.join(MODEL_REPOS)})")
+        return 1
+
+    os.makedirs(MODEL_DIR, exist_ok=True)
+    for name in names:
+        download(name)
+    print("✅ 모든 모델 다운로드 완료!")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
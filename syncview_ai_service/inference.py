@@ -0,0 +1,221 @@
+"""
+모델별 추론 실행기 모듈
+- 모델마다 정해진 수의 워커 스레드에서만 추론을 실행
+  (스레드풀에서 여러 요청이 동시에 generate를 돌려 CPU를 나눠 쓰면 모든 요청이 같이 느려짐)
+- 대기열 길이를 제한하고, 가득 차면 기다리지 않고 InferenceBusyError 발생 (→ 503 + Retry-After)
+- 대기 시간/처리 시간을 모아 /health, /metrics에서 확인
+- MicroBatcher: 동시에 들어온 단건 요청을 모아 실행기에서 배치 1회로 추론
+"""
+import math
+import time
+import asyncio
+import threading
+import contextvars
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from metrics import registry
+
+queue_wait = registry.histogram(
+    "inference_queue_wait_seconds", "추론 대기열에서 기다린 시간 (모델별)", ("model",),
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+rejected = registry.counter(
+    "inference_rejected", "대기열이 가득 차 거절된 요청 수 (모델별)", ("model",)
+)
+
+# Retry-After 상한 (초)
+MAX_RETRY_AFTER = 30
+# 대기 시간 통계에 사용할 최근 표본 수
+WAIT_SAMPLES = 200
+
+
+class InferenceBusyError(Exception):
+    """추론 대기열이 가득 참"""
+
+    def __init__(self, model: str, retry_after: int):
+        super().__init__(f"{model} 모델 요청이 많습니다. {retry_after}초 후 다시 시도해주세요.")
+        self.model = model
+        self.retry_after = retry_after
+
+
+class InferenceExecutor:
+    """
+    모델 1개 전용 추론 실행기
+    - workers: 동시에 실행할 추론 수
+    - max_queue: 워커를 기다릴 수 있는 요청 수 (초과하면 바로 거절)
+    """
+
+    def __init__(self, name: str, workers: int = 1, max_queue: int = 16):
+        self.name = name
+        self.workers = workers
+        self.max_queue = max_queue
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"infer-{name}")
+        self._lock = threading.Lock()
+        self._pending = 0  # 대기 중 + 실행 중
+        self._running = 0
+        self._completed = 0
+        self._rejected = 0
+        self._waits: Deque[float] = deque(maxlen=WAIT_SAMPLES)
+        self._avg_run = 0.0  # 1건 처리 시간 이동 평균 (초)
+
+    def _retry_after(self) -> int:
+        """지금 대기열이 빠지는 데 걸릴 예상 시간 (초)"""
+        estimate = self._avg_run * (self._pending - self._running + 1) / self.workers
+        return max(1, min(MAX_RETRY_AFTER, math.ceil(estimate)))
+
+    def busy_error(self) -> InferenceBusyError:
+        """거절 수를 기록하고 호출자에게 돌려줄 오류 생성"""
+        with self._lock:
+            self._rejected += 1
+            retry_after = self._retry_after()
+        rejected.inc(model=self.name)
+        return InferenceBusyError(self.name, retry_after)
+
+    async def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """워커 스레드에서 fn 실행 (대기열이 가득 차면 InferenceBusyError)"""
+        with self._lock:
+            full = self._pending >= self.workers + self.max_queue
+            if not full:
+                self._pending += 1
+        if full:
+            raise self.busy_error()
+        enqueued = time.perf_counter()
+        # 호출한 요청의 contextvars를 워커 스레드에서도 사용 (asyncio.to_thread와 같은 방식, 프로파일러가 스레드 구분에 사용)
+        context = contextvars.copy_context()
+
+        def job():
+            started = time.perf_counter()
+            with self._lock:
+                self._running += 1
+                self._waits.append(started - enqueued)
+            queue_wait.observe(started - enqueued, model=self.name)
+            try:
+                return context.run(fn, *args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - started
+                with self._lock:
+                    self._running -= 1
+                    self._pending -= 1
+                    self._completed += 1
+                    self._avg_run = elapsed if self._completed == 1 else 0.8 * self._avg_run + 0.2 * elapsed
+
+        try:
+            future = self._pool.submit(job)
+        except RuntimeError:
+            # 종료 중인 실행기
+            with self._lock:
+                self._pending -= 1
+            raise
+        return await asyncio.wrap_future(future)
+
+    def stats(self) -> Dict[str, Any]:
+        """대기열 상태 (/health용)"""
+        with self._lock:
+            waits = sorted(self._waits)
+            pending, running = self._pending, self._running
+            completed, rejected_count, avg_run = self._completed, self._rejected, self._avg_run
+        return {
+            "workers": self.workers,
+            "running": running,
+            "queued": pending - running,
+            "max_queue": self.max_queue,
+            "completed": completed,
+            "rejected": rejected_count,
+            "avg_run_ms": round(avg_run * 1000, 1),
+            "wait_ms": {
+                "avg": round(sum(waits) / len(waits) * 1000, 1) if waits else 0.0,
+                "p95": round(waits[min(len(waits) - 1, int(len(waits) * 0.95))] * 1000, 1) if waits else 0.0,
+            },
+        }
+
+    def queued(self) -> int:
+        with self._lock:
+            return self._pending - self._running
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+class MicroBatcher:
+    """
+    동시에 들어온 단건 요청을 모아 한 번에 추론 (동적 마이크로 배칭)
+    - 첫 요청 후 max_wait 동안 또는 max_batch개가 모일 때까지 모아서 batch_fn(items) 1회 실행
+    - 워커가 모두 사용 중이면 워커가 빌 때까지 계속 모음 (부하가 높을수록 배치가 커짐)
+    - 배치를 기다리는 요청이 max_pending개면 바로 InferenceBusyError
+      (기본: 실행기 대기열 길이와 max_batch 중 큰 값, 대기열이 배치보다 짧아도 배치 1개는 채울 수 있도록)
+    - batch_fn은 items와 같은 순서의 결과 목록을 반환 (항목별 실패는 Exception 객체로)
+    """
+
+    def __init__(self, executor: InferenceExecutor, batch_fn: Callable[[List[Any]], List[Any]],
+                 max_batch: int = 8, max_wait_ms: float = 10, max_pending: Optional[int] = None):
+        self.executor = executor
+        self.batch_fn = batch_fn
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self.max_pending = max_pending if max_pending is not None else max(executor.max_queue, max_batch)
+        # (요청 항목, future, 들어온 시각)
+        self._items: List[Tuple[Any, asyncio.Future, float]] = []
+        self._in_flight = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._batches = 0
+        self._batched_items = 0
+
+    async def submit(self, item: Any) -> Any:
+        """항목 1개를 배치에 넣고 그 항목의 결과를 기다림"""
+        if len(self._items) >= self.max_pending:
+            raise self.executor.busy_error()
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._items.append((item, future, loop.time()))
+        self._dispatch()
+        return await future
+
+    def _dispatch(self) -> None:
+        """보낼 수 있는 배치를 워커로 보내고, 아니면 대기 시간이 끝날 때 다시 확인"""
+        loop = asyncio.get_running_loop()
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        # 응답을 기다리지 않게 된(취소된) 요청은 제외
+        self._items = [entry for entry in self._items if not entry[1].done()]
+        while self._items and self._in_flight < self.executor.workers:
+            waited = loop.time() - self._items[0][2]
+            if len(self._items) < self.max_batch and waited < self.max_wait:
+                self._timer = loop.call_later(self.max_wait - waited, self._dispatch)
+                return
+            batch, self._items = self._items[:self.max_batch], self._items[self.max_batch:]
+            self._in_flight += 1
+            loop.create_task(self._run(batch))
+
+    async def _run(self, batch: List[Tuple[Any, asyncio.Future, float]]) -> None:
+        try:
+            results = await self.executor.run(self.batch_fn, [item for item, _, _ in batch])
+        except Exception as e:
+            results = [e] * len(batch)
+        finally:
+            self._in_flight -= 1
+            self._batches += 1
+            self._batched_items += len(batch)
+
+        for (_, future, _), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+        self._dispatch()
+
+    def stats(self) -> Dict[str, Any]:
+        """배칭 상태 (/health용)"""
+        return {
+            "max_batch": self.max_batch,
+            "max_wait_ms": self.max_wait * 1000,
+            "pending": len(self._items),
+            "batches": self._batches,
+            "avg_batch_size": round(self._batched_items / self._batches, 2) if self._batches else 0.0,
+        }
@@ -1,7 +1,7 @@
 # syncview_ai_service/main.py
 # Cloud Run에서 실행될 AI 전용 마이크로서비스
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 import torch
@@ -9,6 +9,13 @@ from transformers import pipeline
 import logging
 import os
 import gc
+import time
+from typing import Callable, List
+
+from metrics import registry, MetricsMiddleware, threadpool_gauges, CONTENT_TYPE
+from inference import InferenceExecutor, InferenceBusyError, MicroBatcher
+from model_loader import ModelLoader, ModelLoadError, MODEL_REPOS, model_path
+import profiler
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # 로깅 설정
@@ -23,6 +30,28 @@ os.environ["TRANSFORMERS_NO_ADVISORY_WARNINGS"] = "1"
 os.environ["ACCELERATE_USE_CPU"] = "1"
 os.environ["CUDA_VISIBLE_DEVICES"] = ""
 
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 추론 동시성 설정
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 모델별 동시 추론 수와 대기열 길이 (대기열이 가득 차면 503 + Retry-After)
+INFERENCE_WORKERS = int(os.getenv("INFERENCE_WORKERS", "1"))
+INFERENCE_MAX_QUEUE = int(os.getenv("INFERENCE_MAX_QUEUE", "16"))
+# torch 연산 스레드 수 (기본: CPU 수 / 모델별 워커 수)
+# Cloud Run처럼 할당된 CPU보다 많은 코어가 보이는 환경에서는 직접 지정
+TORCH_NUM_THREADS = int(os.getenv("TORCH_NUM_THREADS", "0")) or max(1, (os.cpu_count() or 1) // INFERENCE_WORKERS)
+TORCH_INTEROP_THREADS = int(os.getenv("TORCH_INTEROP_THREADS", "1"))
+torch.set_num_threads(TORCH_NUM_THREADS)
+torch.set_num_interop_threads(TORCH_INTEROP_THREADS)
+# 동시에 들어온 감성 분석/요약 요청을 모으는 최대 개수와 대기 시간 (BATCH_MAX_SIZE=1이면 배칭 안 함)
+BATCH_MAX_SIZE = int(os.getenv("BATCH_MAX_SIZE", "8"))
+BATCH_MAX_WAIT_MS = float(os.getenv("BATCH_MAX_WAIT_MS", "10"))
+# /summarize/batch 요청 1건에 넣을 수 있는 최대 텍스트 수
+SUMMARIZE_BATCH_MAX_ITEMS = int(os.getenv("SUMMARIZE_BATCH_MAX_ITEMS", "64"))
+# 서버 시작 후 백그라운드에서 미리 로딩할 모델 (나머지는 첫 요청 때 로딩, /ready 기준)
+PRELOAD_MODELS = [name.strip() for name in os.getenv("PRELOAD_MODELS", "sentiment").split(",") if name.strip()]
+# 로딩 중인 모델을 요청이 기다리는 최대 시간 (초과하면 503 + Retry-After)
+MODEL_WAIT_TIMEOUT = float(os.getenv("MODEL_WAIT_TIMEOUT", "60"))
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # FastAPI 앱 생성
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -37,12 +66,47 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 요청 샘플링 프로파일러 (PROFILING_ENABLED 또는 서명 헤더로 켜짐)
+app.add_middleware(profiler.ProfilerMiddleware)
+
+# 라우트별 요청 지연 시간 지표
+app.add_middleware(MetricsMiddleware)
+
+# 최근 프로파일 조회 (/admin/profiles)
+app.include_router(profiler.router, tags=["admin"])
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-# AI 모델 전역 변수 (서버 시작 시 1회 로딩)
+# AI 모델 (백그라운드 로딩, 모델마다 1회만 로딩)
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-sentiment_analyzer = None
-summarizer = None
-translator = None
+models = ModelLoader()
+
+# 모델별 추론 실행기 (요청은 이벤트 루프에서 받고 추론은 전용 워커에서 실행)
+executors = {
+    name: InferenceExecutor(name, INFERENCE_WORKERS, INFERENCE_MAX_QUEUE)
+    for name in ("sentiment", "summarize", "translate")
+}
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 지표 (/metrics, Prometheus 텍스트 형식)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+inference_duration = registry.histogram(
+    "model_inference_duration_seconds", "모델 추론 시간 (모델별)", ("model",)
+)
+inference_batch_size = registry.histogram(
+    "model_inference_batch_size", "모델 추론 1회당 입력 개수 (모델별)", ("model",),
+    buckets=(1, 2, 4, 8, 16, 32, 64),
+)
+inference_errors = registry.counter(
+    "model_inference_errors", "모델 추론 실패 수 (모델별)", ("model",)
+)
+model_load_duration = registry.gauge(
+    "model_load_duration_seconds", "모델 로딩에 걸린 시간 (모델별)", ("model",)
+)
+registry.gauge(
+    "inference_queue_depth", "추론 대기열에서 기다리는 요청 수 (모델별)", ("model",),
+    callback=lambda: {name: executor.queued() for name, executor in executors.items()},
+)
+threadpool_gauges("ai_service")
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # Pydantic 모델 (요청/응답 스키마)
@@ -55,43 +119,81 @@ class SummarizeRequest(BaseModel):
     max_length: int = 130
     min_length: int = 30
 
+class SummarizeBatchRequest(BaseModel):
+    texts: List[str]
+    max_length: int = 130
+    min_length: int = 30
+
 class TranslateRequest(BaseModel):
     text: str
     source_lang: str = "en"
     target_lang: str = "ko"
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-# 서버 시작 이벤트 (모델 사전 로딩)
+# 모델 로딩 함수 (모델 로딩 스레드에서 호출)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+def _load_sentiment():
+    started = time.perf_counter()
+    analyzer = pipeline(
+        "sentiment-analysis",
+        model=model_path(MODEL_REPOS["sentiment"]),
+        device=-1,
+        framework="pt"
+    )
+    model_load_duration.set(time.perf_counter() - started, model="sentiment")
+    gc.collect()
+    return analyzer
+
+
+def _load_summarizer():
+    started = time.perf_counter()
+    summarizer = pipeline(
+        "summarization",
+        model=model_path(MODEL_REPOS["summarize"]),
+        device=-1,
+        framework="pt"
+    )
+    model_load_duration.set(time.perf_counter() - started, model="summarize")
+    gc.collect()
+    return summarizer
+
+
+def _load_translator():
+    from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
+    started = time.perf_counter()
+    model_name = model_path(MODEL_REPOS["translate"])
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    model = AutoModelForSeq2SeqLM.from_pretrained(model_name)
+    model_load_duration.set(time.perf_counter() - started, model="translate")
+    gc.collect()
+    return {"tokenizer": tokenizer, "model": model}
+
+
+models.register("sentiment", _load_sentiment)
+models.register("summarize", _load_summarizer)
+models.register("translate", _load_translator)
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 서버 시작 이벤트 (모델 백그라운드 로딩)
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 @app.on_event("startup")
 async def startup_event():
-    """서버 시작 (감성 분석만 사전 로딩, 나머지는 지연 로딩)"""
-    global sentiment_analyzer
-    
+    """서버 시작 (모델 로딩을 기다리지 않고 바로 요청을 받음, 준비 상태는 /ready)"""
     logger.info("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
     logger.info("🚀 SyncView AI Service 시작 (메모리 최적화 모드)")
+    logger.info(f"🧵 torch 스레드 {TORCH_NUM_THREADS}개 (interop {TORCH_INTEROP_THREADS}), "
+                f"모델별 추론 워커 {INFERENCE_WORKERS}개 / 대기열 {INFERENCE_MAX_QUEUE}")
+    logger.info(f"📦 백그라운드 로딩: {', '.join(PRELOAD_MODELS) or '없음'} "
+                f"(나머지는 첫 요청 시 로딩)")
     logger.info("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-    
-    try:
-        # ✅ 감성 분석만 사전 로딩 (가장 많이 사용)
-        logger.info("🔄 감성 분석 모델 로딩 중...")
-        sentiment_analyzer = pipeline(
-            "sentiment-analysis",
-            model="distilbert-base-uncased-finetuned-sst-2-english",
-            device=-1,
-            framework="pt"
-        )
-        gc.collect()
-        logger.info("✅ 감성 분석 모델 로딩 완료")
-        
-        logger.info("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-        logger.info("🎉 서버 준비 완료!")
-        logger.info("💡 요약/번역 모델은 첫 요청 시 자동 로드 (10-20초)")
-        logger.info("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-        
-    except Exception as e:
-        logger.error(f"❌ 모델 로딩 실패: {e}")
-        raise
+    models.start(PRELOAD_MODELS)
+
+@app.on_event("shutdown")
+def shutdown_event():
+    """추론 워커/모델 로딩 스레드 정리 (대기 중인 작업은 취소)"""
+    for executor in executors.values():
+        executor.shutdown()
+    models.shutdown()
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # API 엔드포인트
@@ -104,30 +206,195 @@ def root():
         "service": "SyncView AI Service",
         "status": "running",
         "version": "1.0.0",
-        "models": {
-            "sentiment": "loaded" if sentiment_analyzer else "not loaded",
-            "summarize": "loaded" if summarizer else "not loaded",
-            "translate": "loaded" if translator else "not loaded"
-        }
+        "models": {name: info["state"] for name, info in models.status().items()}
     }
 
 @app.get("/health")
 def health():
-    """상세 헬스체크"""
+    """상세 헬스체크 (모델별 추론 대기열 상태 포함)"""
     return {
         "status": "healthy",
-        "models_loaded": all([sentiment_analyzer, summarizer, translator])
+        "models_loaded": models.ready(MODEL_REPOS),
+        "inference": {name: executor.stats() for name, executor in executors.items()},
+        "batching": {name: batcher.stats() for name, batcher in batchers.items()},
+        "torch_threads": {"intra_op": torch.get_num_threads(), "inter_op": torch.get_num_interop_threads()},
     }
 
+@app.get("/ready")
+def ready(response: Response):
+    """준비 상태 (PRELOAD_MODELS가 모두 로딩되면 200, 아니면 503 + 모델별 로딩 상태)"""
+    is_ready = models.ready(PRELOAD_MODELS)
+    if not is_ready:
+        response.status_code = 503
+    return {"ready": is_ready, "models": models.status()}
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus 지표 (async로 두어야 이벤트 루프에서 스레드풀 상태를 읽을 수 있음)"""
+    return Response(registry.render(), media_type=CONTENT_TYPE)
+
+
+def _busy(model: str, e: InferenceBusyError) -> HTTPException:
+    logger.warning(f"⏳ {model} 추론 대기열 가득 참 (Retry-After {e.retry_after}s)")
+    return HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+
+
+async def _wait_model(model: str):
+    """모델 로딩을 기다림 (이미 로딩 중이면 같은 로딩을 기다리고, 시간 초과/실패 시 503)"""
+    try:
+        return await models.wait(model, MODEL_WAIT_TIMEOUT)
+    except ModelLoadError as e:
+        logger.warning(f"⏳ {e}")
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "10"})
+
+
+async def _infer(model: str, fn, *args):
+    """모델 전용 실행기에서 추론 (대기열이 가득 차면 503 + Retry-After)"""
+    try:
+        return await executors[model].run(fn, *args)
+    except InferenceBusyError as e:
+        raise _busy(model, e)
+
+
+async def _infer_batched(model: str, item):
+    """동시에 들어온 요청과 묶어서 추론하고 이 요청의 결과만 반환"""
+    try:
+        return await batchers[model].submit(item)
+    except InferenceBusyError as e:
+        raise _busy(model, e)
+
+
+def _batch_or_each(fn: Callable[[List], List], items: List) -> List:
+    """
+    배치로 한 번에 실행하고, 실패하면 항목별로 다시 실행
+    - 입력 하나 때문에 같은 배치의 다른 요청까지 실패하지 않도록 실패한 항목만 Exception으로 반환
+    """
+    try:
+        return fn(items)
+    except Exception as e:
+        if len(items) == 1:
+            return [e]
+        logger.warning(f"⚠️  배치 추론 실패, 항목별로 다시 실행: {e}")
+        results = []
+        for item in items:
+            try:
+                results.append(fn([item])[0])
+            except Exception as item_error:
+                results.append(item_error)
+        return results
+
+
+def _run_sentiment_batch(texts: List[str]) -> List[dict]:
+    """감성 분석 배치 (파이프라인이 배치 안에서 가장 긴 입력에 맞춰 패딩)"""
+    inference_batch_size.observe(len(texts), model="sentiment")
+    with inference_duration.time(model="sentiment"):
+        analyzer = models.get("sentiment")
+        return _batch_or_each(lambda batch: analyzer(batch, batch_size=len(batch)), texts)
+
+
+def _run_summarize_batch(items: List[tuple]) -> List:
+    """
+    요약 배치 ((text, max_length, min_length) 목록)
+    - 생성 길이 설정이 같은 요청끼리 묶어서 실행
+    """
+    model = models.get("summarize")
+    results: List = [None] * len(items)
+    groups = {}
+    for i, (_, max_length, min_length) in enumerate(items):
+        groups.setdefault((max_length, min_length), []).append(i)
+
+    for (max_length, min_length), indexes in groups.items():
+        outputs = _summarize_texts(model, [items[i][0] for i in indexes], max_length, min_length)
+        for i, output in zip(indexes, outputs):
+            results[i] = output
+    return results
+
+
+def _summarize_texts(model, texts: List[str], max_length: int, min_length: int) -> List:
+    """
+    같은 생성 길이 설정의 텍스트 목록 요약 (요약 문자열 또는 Exception, texts 순서)
+    - 길이순으로 정렬해 BATCH_MAX_SIZE개씩 묶음 (비슷한 길이끼리 묶여 패딩 낭비가 적음)
+    """
+    order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+    size = max(1, BATCH_MAX_SIZE)
+    results: List = [None] * len(texts)
+    for start in range(0, len(order), size):
+        indexes = order[start:start + size]
+        inference_batch_size.observe(len(indexes), model="summarize")
+        with inference_duration.time(model="summarize"):
+            outputs = _batch_or_each(
+                lambda batch: model(
+                    batch,
+                    max_length=max_length,
+                    min_length=min_length,
+                    do_sample=False,
+                    batch_size=len(batch)
+                ),
+                [texts[i] for i in indexes],
+            )
+        for i, output in zip(indexes, outputs):
+            results[i] = output if isinstance(output, Exception) else output["summary_text"]
+    return results
+
+
+def _run_summarize_texts(texts: List[str], max_length: int, min_length: int) -> List:
+    return _summarize_texts(models.get("summarize"), texts, max_length, min_length)
+
+
+def _run_translate(text: str) -> str:
+    loaded = models.get("translate")
+    tokenizer = loaded["tokenizer"]
+    model = loaded["model"]
+
+    # NLLB 모델은 소스/타깃 언어 설정 필요
+    tokenizer.src_lang = "eng_Latn"  # 영어
+
+    # 텍스트를 작은 청크로 나누기 (700자씩)
+    chunks = []
+    while text:
+        chunk = text[:700]
+        chunks.append(chunk)
+        text = text[700:]
+
+    # 각 청크 번역
+    translated_chunks = []
+    for chunk in chunks:
+        inputs = tokenizer(chunk, return_tensors="pt", padding=True, truncation=True, max_length=512)
+
+        # NLLB는 forced_bos_token_id로 타깃 언어 지정
+        forced_bos_token_id = tokenizer.convert_tokens_to_ids("kor_Hang")  # 한국어
+
+        inference_batch_size.observe(inputs["input_ids"].shape[0], model="translate")
+        with torch.no_grad(), inference_duration.time(model="translate"):
+            generated_tokens = model.generate(
+                **inputs,
+                forced_bos_token_id=forced_bos_token_id,
+                num_beams=4,
+                max_length=512,
+                early_stopping=True
+            )
+
+        translated = tokenizer.decode(generated_tokens[0], skip_special_tokens=True)
+        translated_chunks.append(translated)
+
+    return " ".join(translated_chunks)
+
+
+# 감성 분석/요약은 동시에 들어온 요청을 모아서 배치로 추론
+batchers = {
+    "sentiment": MicroBatcher(executors["sentiment"], _run_sentiment_batch, BATCH_MAX_SIZE, BATCH_MAX_WAIT_MS),
+    "summarize": MicroBatcher(executors["summarize"], _run_summarize_batch, BATCH_MAX_SIZE, BATCH_MAX_WAIT_MS),
+}
+
+
 @app.post("/sentiment")
-def analyze_sentiment(request: SentimentRequest):
+async def analyze_sentiment(request: SentimentRequest):
     """감성 분석 API"""
     try:
-        if not sentiment_analyzer:
-            raise HTTPException(status_code=503, detail="감성 분석 모델이 로딩되지 않았습니다")
+        await _wait_model("sentiment")
         
         text = request.text[:512]  # 최대 512 토큰
-        result = sentiment_analyzer(text)[0]
+        result = await _infer_batched("sentiment", text)
         
         # POSITIVE/NEGATIVE를 한국어로 변환
         sentiment_map = {
@@ -143,100 +410,91 @@ def analyze_sentiment(request: SentimentRequest):
             "score": round(result["score"], 2)
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
+        inference_errors.inc(model="sentiment")
         logger.error(f"❌ 감성 분석 실패: {e}")
         raise HTTPException(status_code=500, detail=f"감성 분석 실패: {str(e)}")
 
 @app.post("/summarize")
-def summarize_text(request: SummarizeRequest):
-    """텍스트 요약 API (지연 로딩)"""
-    global summarizer
-    
+async def summarize_text(request: SummarizeRequest):
+    """텍스트 요약 API (모델이 로딩 중이면 로딩 완료까지 대기)"""
     try:
-        # 지연 로딩: 모델이 없으면 로드
-        if not summarizer:
-            logger.info("🔄 요약 모델 지연 로딩 중... (첫 요청)")
-            summarizer = pipeline(
-                "summarization",
-                model="sshleifer/distilbart-cnn-12-6",
-                device=-1,
-                framework="pt"
-            )
-            gc.collect()
-            logger.info("✅ 요약 모델 로딩 완료")
-        
         text = request.text[:1024]  # 최대 1024자
         
         if len(text.strip()) < 50:
             return {"summary": "텍스트가 너무 짧아 요약할 수 없습니다."}
         
-        result = summarizer(
-            text,
-            max_length=request.max_length,
-            min_length=request.min_length,
-            do_sample=False
-        )
-        
-        return {"summary": result[0]["summary_text"]}
+        await _wait_model("summarize")
+        summary = await _infer_batched("summarize", (text, request.max_length, request.min_length))
+        return {"summary": summary}
         
+    except HTTPException:
+        raise
     except Exception as e:
+        inference_errors.inc(model="summarize")
         logger.error(f"❌ 요약 실패: {e}")
         raise HTTPException(status_code=500, detail=f"요약 실패: {str(e)}")
 
+@app.post("/summarize/batch")
+async def summarize_batch(request: SummarizeBatchRequest):
+    """
+    여러 텍스트 일괄 요약 API (피드 새로고침 시 미리 요약용)
+    - 길이가 비슷한 텍스트끼리 묶어 같은 max_length/min_length로 배치 생성
+    - 결과는 입력 순서대로, 항목마다 summary 또는 error
+    """
+    if len(request.texts) > SUMMARIZE_BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"한 번에 최대 {SUMMARIZE_BATCH_MAX_ITEMS}개까지 요약할 수 있습니다."
+        )
+
+    try:
+        results: List[dict] = [{} for _ in request.texts]
+        texts, indexes = [], []
+        for i, text in enumerate(request.texts):
+            text = text[:1024]  # 최대 1024자
+            if len(text.strip()) < 50:
+                results[i] = {"summary": "텍스트가 너무 짧아 요약할 수 없습니다."}
+            else:
+                texts.append(text)
+                indexes.append(i)
+
+        if texts:
+            await _wait_model("summarize")
+            summaries = await _infer(
+                "summarize", _run_summarize_texts, texts, request.max_length, request.min_length
+            )
+            for i, summary in zip(indexes, summaries):
+                if isinstance(summary, Exception):
+                    inference_errors.inc(model="summarize")
+                    logger.error(f"❌ 일괄 요약 항목 실패 ({i}번): {summary}")
+                    results[i] = {"error": f"요약 실패: {str(summary)}"}
+                else:
+                    results[i] = {"summary": summary}
+
+        return {"results": results}
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        inference_errors.inc(model="summarize")
+        logger.error(f"❌ 일괄 요약 실패: {e}")
+        raise HTTPException(status_code=500, detail=f"요약 실패: {str(e)}")
+
 @app.post("/translate")
-def translate_text(request: TranslateRequest):
-    """텍스트 번역 API (영어 → 한국어, 지연 로딩)"""
-    global translator
-    
+async def translate_text(request: TranslateRequest):
+    """텍스트 번역 API (영어 → 한국어, 모델이 로딩 중이면 로딩 완료까지 대기)"""
     try:
-        # 지연 로딩: 모델이 없으면 로드
-        if not translator:
-            logger.info("🔄 번역 모델 지연 로딩 중... (첫 요청)")
-            from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
-            model_name = "facebook/nllb-200-distilled-600M"
-            tokenizer = AutoTokenizer.from_pretrained(model_name)
-            model = AutoModelForSeq2SeqLM.from_pretrained(model_name)
-            translator = {"tokenizer": tokenizer, "model": model}
-            gc.collect()
-            logger.info("✅ 번역 모델 로딩 완료")
-        
-        tokenizer = translator["tokenizer"]
-        model = translator["model"]
-        
-        # NLLB 모델은 소스/타깃 언어 설정 필요
-        tokenizer.src_lang = "eng_Latn"  # 영어
-        
-        # 텍스트를 작은 청크로 나누기 (700자씩)
-        chunks = []
-        text = request.text
-        while text:
-            chunk = text[:700]
-            chunks.append(chunk)
-            text = text[700:]
-        
-        # 각 청크 번역
-        translated_chunks = []
-        for chunk in chunks:
-            inputs = tokenizer(chunk, return_tensors="pt", padding=True, truncation=True, max_length=512)
-            
-            # NLLB는 forced_bos_token_id로 타깃 언어 지정
-            forced_bos_token_id = tokenizer.convert_tokens_to_ids("kor_Hang")  # 한국어
-            
-            with torch.no_grad():
-                generated_tokens = model.generate(
-                    **inputs,
-                    forced_bos_token_id=forced_bos_token_id,
-                    num_beams=4,
-                    max_length=512,
-                    early_stopping=True
-                )
-            
-            translated = tokenizer.decode(generated_tokens[0], skip_special_tokens=True)
-            translated_chunks.append(translated)
-        
-        return {"translated_text": " ".join(translated_chunks)}
+        await _wait_model("translate")
+        translated = await _infer("translate", _run_translate, request.text)
+        return {"translated_text": translated}
         
+    except HTTPException:
+        raise
     except Exception as e:
+        inference_errors.inc(model="translate")
         logger.error(f"❌ 번역 실패: {e}")
         raise HTTPException(status_code=500, detail=f"번역 실패: {str(e)}")
 
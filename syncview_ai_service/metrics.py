@@ -0,0 +1,245 @@
+"""
+프로세스 내 지표(metrics) 레지스트리 모듈
+- Counter / Gauge / Histogram을 메모리에 모아 두고 /metrics에서 Prometheus 텍스트 형식으로 출력
+- 외부 의존성 없이 동작 (AI 서비스에도 같은 파일을 사용)
+- MetricsMiddleware: 라우트(경로 템플릿)별 요청 지연 시간 히스토그램
+"""
+import time
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# 요청/외부 호출 지연 시간 기본 버킷 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 callback: Optional[Callable[[], object]] = None):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values: Dict[LabelValues, float] = {}
+        # 출력 시점에 값을 계산하는 콜백 (숫자 하나 또는 {레이블 값(튜플): 숫자} dict 반환)
+        self._callback = callback
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def _items(self) -> List[Tuple[LabelValues, float]]:
+        if self._callback is None:
+            with self._lock:
+                return list(self._values.items())
+        result = self._callback()
+        if isinstance(result, dict):
+            return [((k,) if isinstance(k, str) else tuple(k), v) for k, v in result.items()]
+        return [((), result)]
+
+    def samples(self) -> Iterable[Tuple[str, str, float]]:
+        """(이름 접미사, 레이블 문자열, 값) 목록"""
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        for suffix, labels, value in self.samples():
+            lines.append(f"{self.name}{suffix}{labels} {_format_value(value)}")
+        return lines
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def samples(self):
+        for key, value in self._items():
+            yield "_total", _format_labels(self.labelnames, key), value
+
+
+class Gauge(_Metric):
+    """현재 값 (set으로 설정하거나, 출력 시점에 콜백으로 계산)"""
+    kind = "gauge"
+
+    def set(self, value: float, **labels) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def samples(self):
+        for key, value in self._items():
+            yield "", _format_labels(self.labelnames, key), value
+
+
+class Histogram(_Metric):
+    """분포 (버킷별 누적 개수, 합계, 개수)"""
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        # 레이블 값 → [버킷별 개수..., 합계]
+        self._states: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            state = self._states.get(key)
+            if state is None:
+                state = self._states[key] = [0.0] * (len(self.buckets) + 1)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[i] += 1
+                    break
+            state[-1] += value
+
+    @contextmanager
+    def time(self, **labels):
+        """with 블록 실행 시간(초) 기록"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def samples(self):
+        with self._lock:
+            items = [(key, list(state)) for key, state in self._states.items()]
+        for key, state in items:
+            cumulative = 0.0
+            for bound, count in zip(self.buckets, state):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                yield "_bucket", _format_labels(self.labelnames, key, le), cumulative
+            yield "_sum", _format_labels(self.labelnames, key), state[-1]
+            yield "_count", _format_labels(self.labelnames, key), cumulative
+
+
+class Registry:
+    """지표 모음"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                # 모듈 재로딩 등으로 같은 이름이 다시 등록되면 기존 지표 재사용
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = (), callback=None) -> Counter:
+        return self._register(Counter(name, documentation, labelnames, callback))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = (), callback=None) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames, callback))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식 출력"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: List[str] = []
+        for metric in metrics:
+            try:
+                lines.extend(metric.render())
+            except Exception:
+                # 콜백 하나가 실패해도 나머지 지표는 출력
+                continue
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+http_request_duration = registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP 요청 처리 시간 (라우트 경로 템플릿별)",
+    ("method", "route", "status"),
+)
+
+
+class MetricsMiddleware:
+    """
+    요청 처리 시간 기록 (ASGI 미들웨어)
+    - 경로 파라미터로 레이블이 늘어나지 않도록 실제 URL 대신 라우트 템플릿(/bookmarks/{user_id}) 사용
+    - 매칭되는 라우트가 없으면 route="unmatched"
+    """
+
+    def __init__(self, app, exclude: Sequence[str] = ("/metrics",)):
+        self.app = app
+        self.exclude = set(exclude)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope.get("path") in self.exclude:
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = {"code": 500}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            http_request_duration.observe(
+                time.perf_counter() - started,
+                method=scope.get("method", ""),
+                route=getattr(route, "path", "unmatched"),
+                status=str(status["code"]),
+            )
+
+
+def threadpool_gauges(prefix: str) -> None:
+    """
+    anyio 기본 스레드풀(동기 라우트 실행용) 포화도 지표 등록
+    - 콜백은 /metrics 요청(이벤트 루프 안)에서 호출됨
+    """
+    def _limiter():
+        from anyio import to_thread
+        return to_thread.current_default_thread_limiter()
+
+    registry.gauge(f"{prefix}_threadpool_limit", "스레드풀 최대 스레드 수",
+                   callback=lambda: _limiter().total_tokens)
+    registry.gauge(f"{prefix}_threadpool_in_use", "사용 중인 스레드 수",
+                   callback=lambda: _limiter().borrowed_tokens)
+    registry.gauge(f"{prefix}_threadpool_waiting", "스레드를 기다리는 작업 수",
+                   callback=lambda: _limiter().statistics().tasks_waiting)
@@ -0,0 +1,149 @@
+"""
+모델 로딩 관리 모듈
+- 서버가 헬스체크를 받기 시작한 뒤 백그라운드 스레드에서 모델을 순서대로 로딩
+- 모델마다 로딩 future를 하나만 두어, 로딩 중에 들어온 요청은 새로 로딩하지 않고 같은 future를 기다림
+- 이미지에는 모델을 safetensors 형식으로 MODEL_DIR에 저장해 두고 (download_models.py),
+  실행 시 pickle 역직렬화 없이 메모리 매핑으로 읽음 (MODEL_DIR에 없으면 Hugging Face Hub 이름으로 로딩)
+"""
+import os
+import time
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# 빌드 시 safetensors로 저장한 모델 디렉터리
+MODEL_DIR = os.getenv("MODEL_DIR", "/app/models")
+
+# 모델 이름 → Hugging Face Hub 저장소
+MODEL_REPOS = {
+    "sentiment": "distilbert-base-uncased-finetuned-sst-2-english",
+    "summarize": "sshleifer/distilbart-cnn-12-6",
+    "translate": "facebook/nllb-200-distilled-600M",
+}
+
+
+def model_path(repo_id: str) -> str:
+    """MODEL_DIR에 저장된 모델이 있으면 그 경로, 없으면 Hub 저장소 이름"""
+    local = os.path.join(MODEL_DIR, repo_id.replace("/", "--"))
+    return local if os.path.isdir(local) else repo_id
+
+
+class ModelLoadError(Exception):
+    """모델 로딩 실패 또는 대기 시간 초과"""
+
+
+class ModelLoader:
+    """
+    모델별 로딩 future 관리
+    - register(name, load_fn): 로딩 함수 등록
+    - start(names): 백그라운드 로딩 시작 (등록 순서가 아니라 names 순서대로 하나씩)
+    - wait(name): 로딩이 끝날 때까지 기다려 모델 반환 (아직 시작 전이면 이때 로딩 시작)
+    - load_now(names): 백그라운드가 아니라 호출한 스레드에서 바로 로딩 (serve.py)
+    """
+
+    def __init__(self):
+        # 로딩은 한 번에 하나씩 (동시에 로딩하면 메모리 최고점이 겹치고 CPU를 나눠 씀)
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="model-loader")
+        self._lock = threading.Lock()
+        self._loaders: Dict[str, Callable[[], Any]] = {}
+        self._futures: Dict[str, Future] = {}
+        self._models: Dict[str, Any] = {}
+        self._load_seconds: Dict[str, float] = {}
+        self._started_at: Dict[str, float] = {}
+
+    def register(self, name: str, load_fn: Callable[[], Any]) -> None:
+        self._loaders[name] = load_fn
+
+    def _load(self, name: str) -> Any:
+        logger.info(f"🔄 {name} 모델 로딩 중...")
+        started = time.perf_counter()
+        with self._lock:
+            self._started_at[name] = started
+        model = self._loaders[name]()
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self._models[name] = model
+            self._load_seconds[name] = elapsed
+        logger.info(f"✅ {name} 모델 로딩 완료 ({elapsed:.1f}s)")
+        return model
+
+    def future(self, name: str) -> Future:
+        """모델 로딩 future (아직 없으면 로딩 예약)"""
+        if name not in self._loaders:
+            raise KeyError(name)
+        with self._lock:
+            future = self._futures.get(name)
+            # 로딩에 실패했던 모델은 다음 요청 때 다시 시도
+            if future is None or (future.done() and future.exception() is not None):
+                future = self._futures[name] = self._pool.submit(self._load, name)
+        return future
+
+    def start(self, names: Iterable[str]) -> None:
+        """백그라운드 로딩 예약"""
+        for name in names:
+            self.future(name)
+
+    def load_now(self, names: Iterable[str]) -> None:
+        """
+        호출한 스레드에서 바로 로딩 (prefork 부모 프로세스용)
+        - 로딩 스레드를 만들지 않아야 fork한 워커에서도 이 로더를 그대로 쓸 수 있음
+        """
+        for name in names:
+            future: Future = Future()
+            with self._lock:
+                self._futures[name] = future
+            try:
+                future.set_result(self._load(name))
+            except Exception as e:
+                future.set_exception(e)
+                raise
+
+    def get(self, name: str) -> Optional[Any]:
+        """로딩이 끝난 모델 (아직이면 None)"""
+        return self._models.get(name)
+
+    async def wait(self, name: str, timeout: Optional[float] = None) -> Any:
+        """모델 로딩을 기다림 (실패하거나 timeout이 지나면 ModelLoadError)"""
+        model = self._models.get(name)
+        if model is not None:
+            return model
+        future = self.future(name)
+        try:
+            return await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)), timeout)
+        except asyncio.TimeoutError:
+            raise ModelLoadError(f"{name} 모델을 로딩하는 중입니다. 잠시 후 다시 시도해주세요.")
+        except Exception as e:
+            raise ModelLoadError(f"{name} 모델 로딩 실패: {e}")
+
+    def state(self, name: str) -> str:
+        future = self._futures.get(name)
+        if future is None:
+            return "not_loaded"
+        if not future.done():
+            return "loading" if name in self._started_at else "queued"
+        return "failed" if future.exception() else "loaded"
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        """모델별 로딩 상태 (/ready용)"""
+        result = {}
+        for name in self._loaders:
+            state = self.state(name)
+            info: Dict[str, Any] = {"state": state}
+            if state == "loaded":
+                info["load_seconds"] = round(self._load_seconds[name], 2)
+            elif state == "loading":
+                info["elapsed_seconds"] = round(time.perf_counter() - self._started_at[name], 2)
+            elif state == "failed":
+                info["error"] = str(self._futures[name].exception())
+            result[name] = info
+        return result
+
+    def ready(self, names: Iterable[str]) -> bool:
+        return all(self.state(name) == "loaded" for name in names)
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
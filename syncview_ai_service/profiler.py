@@ -0,0 +1,290 @@
+"""
+요청 샘플링 프로파일러 모듈
+- 켜져 있을 때만 일부 요청을 골라 별도 스레드에서 주기적으로 스택을 샘플링
+- 그 요청을 처리하는 스레드만 기록 (다른 요청, 쓰기 버퍼 flush, 사전 처리 워커 등은 제외)
+  - 이벤트 루프 스레드: 이 요청의 task가 실행 중일 때만
+  - 워커 스레드: 실행 중인 작업의 contextvars 컨텍스트가 이 요청에서 복사된 것일 때만
+    (sync 라우트/의존성을 돌리는 anyio 스레드풀, 컨텍스트를 넘겨받는 추론 실행기 작업)
+- 결과는 flamegraph용 folded 형식(`frame;frame;frame count`)으로 PROFILING_DIR에 저장
+  (flamegraph.pl, speedscope, inferno 등에서 바로 열 수 있음)
+- 프로파일링 대상 선택
+  - PROFILING_ENABLED=true 이면 PROFILING_SAMPLE_RATE 비율만큼 무작위 선택
+  - PROFILING_SECRET이 설정되어 있으면 서명된 X-Profile 헤더가 붙은 요청은 항상 프로파일링
+- 꺼져 있으면 미들웨어는 요청을 그대로 통과시킴 (헤더도 읽지 않음)
+- /admin/profiles: 최근 N개 프로파일 목록, /admin/profiles/{name}: folded 내용
+  (PROFILING_SECRET으로 서명한 X-Profile 헤더가 있어야 조회 가능)
+- AI 서비스에도 같은 파일을 사용
+"""
+import os
+import sys
+import hmac
+import time
+import random
+import asyncio
+import hashlib
+import logging
+import threading
+import contextvars
+from collections import Counter, deque
+from typing import Any, Deque, Dict, List, Optional
+
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import PlainTextResponse
+
+logger = logging.getLogger(__name__)
+
+PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "false").lower() == "true"
+PROFILING_SAMPLE_RATE = float(os.getenv("PROFILING_SAMPLE_RATE", "0.01"))
+PROFILING_SECRET = os.getenv("PROFILING_SECRET", "")
+PROFILING_INTERVAL_MS = float(os.getenv("PROFILING_INTERVAL_MS", "5"))
+PROFILING_DIR = os.getenv("PROFILING_DIR", "/tmp/syncview-profiles")
+PROFILING_KEEP = int(os.getenv("PROFILING_KEEP", "20"))
+
+PROFILE_HEADER = "x-profile"
+_PROFILE_HEADER_BYTES = PROFILE_HEADER.encode()
+# 프로파일링하지 않는 경로 (관리용 엔드포인트)
+EXCLUDED_PATHS = ("/metrics", "/admin/profiles")
+
+# 이 디렉터리 아래 코드는 프레임 라벨에 상대 경로로 표시
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+_THIS_FILE = os.path.abspath(__file__)
+# 워커 스레드에서 작업 컨텍스트(`context` 지역 변수)를 찾을 스택 아래쪽 프레임 수
+_ROOT_FRAMES = 8
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 서명 헤더 (X-Profile: "<만료 시각>.<HMAC-SHA256>")
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+def sign(secret: str, ttl: int = 300) -> str:
+    """ttl초 동안 유효한 X-Profile 헤더 값 생성"""
+    expires = str(int(time.time()) + ttl)
+    digest = hmac.new(secret.encode(), expires.encode(), hashlib.sha256).hexdigest()
+    return f"{expires}.{digest}"
+
+
+def verify(secret: str, value: str) -> bool:
+    """X-Profile 헤더 값 검증 (만료 시각, 서명)"""
+    if not secret or not value:
+        return False
+    expires, _, digest = value.partition(".")
+    if not expires.isdigit() or int(expires) < time.time():
+        return False
+    expected = hmac.new(secret.encode(), expires.encode(), hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, digest)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 스택 샘플러
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+def _frame_label(code) -> str:
+    filename = code.co_filename
+    if filename.startswith(APP_DIR):
+        filename = os.path.relpath(filename, APP_DIR)
+    elif "site-packages" in filename:
+        filename = filename.split("site-packages" + os.sep, 1)[1]
+    else:
+        filename = os.path.basename(filename)
+    # folded 형식 구분자(;)와 공백이 라벨에 들어가지 않도록 정리
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})".replace(";", ":").replace(" ", "_")
+
+
+def _job_context(frames: List[Any]) -> Optional[contextvars.Context]:
+    """
+    워커 스레드가 실행 중인 작업의 contextvars 컨텍스트 (없으면 None)
+    - anyio 워커(WorkerThread.run)와 추론 실행기 작업은 스택 아래쪽 프레임의 `context` 변수에 둠
+    """
+    for frame in frames[-_ROOT_FRAMES:]:
+        code = frame.f_code
+        if "context" in code.co_varnames or "context" in code.co_freevars:
+            context = frame.f_locals.get("context")
+            if isinstance(context, contextvars.Context):
+                return context
+    return None
+
+
+class _Sampler(threading.Thread):
+    """요청이 처리되는 동안 interval마다 그 요청을 처리하는 스레드의 스택을 모아 folded 스택별 횟수를 셈"""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, task: Optional[asyncio.Task], interval: float):
+        super().__init__(name="request-profiler", daemon=True)
+        self.loop = loop
+        self.task = task
+        self.loop_thread_id = threading.get_ident()
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        names = {}
+        while not self._stop_event.wait(self.interval):
+            self.samples += 1
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == self.ident:
+                    continue
+                if thread_id == self.loop_thread_id:
+                    # 루프 스레드는 다른 요청의 task도 돌리므로 이 요청의 task가 실행 중일 때만
+                    if asyncio.current_task(self.loop) is not self.task:
+                        continue
+                frames = []
+                while frame is not None:
+                    frames.append(frame)
+                    frame = frame.f_back
+                if thread_id != self.loop_thread_id:
+                    context = _job_context(frames)
+                    if context is None or context.get(_current_sampler) is not self:
+                        continue
+                # 미들웨어 자체 프레임은 건너뜀
+                codes = [f.f_code for f in frames if f.f_code.co_filename != _THIS_FILE]
+                if not codes:
+                    continue
+                if thread_id not in names:
+                    thread = threading._active.get(thread_id)
+                    names[thread_id] = (thread.name if thread else str(thread_id)).replace(" ", "_")
+                labels = [names[thread_id]] + [_frame_label(c) for c in reversed(codes)]
+                self.stacks[";".join(labels)] += 1
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join()
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 프로파일 저장소 (최근 N개만 유지)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+_profiles: Deque[Dict[str, Any]] = deque()
+_profiles_lock = threading.Lock()
+# 프로파일링 중인 요청의 샘플러 (스레드풀/추론 실행기 작업에 컨텍스트로 전달되어 스레드를 구분)
+_current_sampler: contextvars.ContextVar[Optional[_Sampler]] = contextvars.ContextVar(
+    "profiler_sampler", default=None
+)
+
+
+def _save(method: str, path: str, status: int, duration: float, reason: str, sampler: _Sampler) -> None:
+    os.makedirs(PROFILING_DIR, exist_ok=True)
+    slug = path.strip("/").replace("/", "_") or "root"
+    name = f"{time.strftime('%Y%m%d-%H%M%S')}-{int(time.time() * 1000) % 1000:03d}-{method}-{slug}.folded"
+    file_path = os.path.join(PROFILING_DIR, name)
+    with open(file_path, "w") as f:
+        for stack, count in sampler.stacks.most_common():
+            f.write(f"{stack} {count}\n")
+
+    meta = {
+        "name": name,
+        "method": method,
+        "path": path,
+        "status": status,
+        "duration_ms": round(duration * 1000, 1),
+        "samples": sampler.samples,
+        "interval_ms": PROFILING_INTERVAL_MS,
+        "reason": reason,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+    with _profiles_lock:
+        _profiles.append(meta)
+        while len(_profiles) > PROFILING_KEEP:
+            old = _profiles.popleft()
+            try:
+                os.remove(os.path.join(PROFILING_DIR, old["name"]))
+            except OSError:
+                pass
+    logger.info(f"🔬 프로파일 저장: {method} {path} ({meta['duration_ms']}ms, {sampler.samples} samples) → {file_path}")
+
+
+def _profile_reason(scope) -> Optional[str]:
+    """이 요청을 프로파일링할지 결정 (대상이면 이유 반환)"""
+    if scope["path"].startswith(EXCLUDED_PATHS):
+        return None
+    if PROFILING_SECRET:
+        for key, value in scope["headers"]:
+            if key == _PROFILE_HEADER_BYTES:
+                return "header" if verify(PROFILING_SECRET, value.decode("latin-1")) else None
+    if PROFILING_ENABLED and random.random() < PROFILING_SAMPLE_RATE:
+        return "sampled"
+    return None
+
+
+class ProfilerMiddleware:
+    """선택된 요청만 샘플링 프로파일러를 붙여 실행 (ASGI 미들웨어)"""
+
+    def __init__(self, app):
+        self.app = app
+        # 둘 다 꺼져 있으면 요청마다 아무것도 하지 않음
+        self.active = PROFILING_ENABLED or bool(PROFILING_SECRET)
+
+    async def __call__(self, scope, receive, send):
+        if not self.active or scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        reason = _profile_reason(scope)
+        if reason is None:
+            await self.app(scope, receive, send)
+            return
+
+        status = {"code": 500}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        sampler = _Sampler(asyncio.get_running_loop(), asyncio.current_task(), PROFILING_INTERVAL_MS / 1000)
+        token = _current_sampler.set(sampler)
+        started = time.perf_counter()
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            sampler.stop()
+            _current_sampler.reset(token)
+            try:
+                _save(scope.get("method", ""), scope["path"], status["code"],
+                      time.perf_counter() - started, reason, sampler)
+            except Exception as e:
+                logger.error(f"❌ 프로파일 저장 실패: {e}")
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 관리자 엔드포인트
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+router = APIRouter()
+
+
+def _check_admin(request: Request) -> None:
+    """
+    항상 서명된 X-Profile 헤더 필요
+    - 프로파일에는 내부 파일 경로/요청 경로가 들어 있으므로 PROFILING_ENABLED만으로는 열지 않음
+    - PROFILING_SECRET이 없으면 엔드포인트 자체를 숨김 (404)
+    """
+    if not PROFILING_SECRET:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not verify(PROFILING_SECRET, request.headers.get(PROFILE_HEADER, "")):
+        raise HTTPException(status_code=403, detail="유효한 X-Profile 서명이 필요합니다.")
+
+
+@router.get("/admin/profiles")
+def list_profiles(request: Request, limit: int = PROFILING_KEEP) -> List[Dict[str, Any]]:
+    """최근 프로파일 목록 (최신순)"""
+    _check_admin(request)
+    with _profiles_lock:
+        profiles = list(_profiles)
+    return profiles[::-1][:limit]
+
+
+@router.get("/admin/profiles/{name}", response_class=PlainTextResponse)
+def get_profile(name: str, request: Request):
+    """프로파일 folded 내용 (flamegraph.pl / speedscope 입력)"""
+    _check_admin(request)
+    with _profiles_lock:
+        known = any(p["name"] == name for p in _profiles)
+    if not known:
+        raise HTTPException(status_code=404, detail="프로파일을 찾을 수 없습니다.")
+    with open(os.path.join(PROFILING_DIR, name)) as f:
+        return f.read()
+
+
+if __name__ == "__main__":
+    # 서명 헤더 생성: PROFILING_SECRET=... python profiler.py [ttl초]
+    if not PROFILING_SECRET:
+        sys.exit("PROFILING_SECRET 환경 변수가 필요합니다.")
+    print(f"X-Profile: {sign(PROFILING_SECRET, int(sys.argv[1]) if len(sys.argv) > 1 else 300)}")
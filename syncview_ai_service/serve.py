@@ -0,0 +1,139 @@
+"""
+preload-then-fork 실행 모드 (프로세스 여러 개로 서비스)
+- 부모 프로세스에서 모델을 한 번만 로딩한 뒤 워커 프로세스를 fork
+  → 모델 가중치는 copy-on-write로 모든 워커가 같은 메모리를 공유 (워커 수만큼 RAM이 늘지 않음)
+- fork 전에 gc.freeze()로 로딩된 객체를 GC 대상에서 빼서, 워커의 GC가 공유 페이지를 건드려 복사되지 않게 함
+- 부모는 torch 스레드 1개로 로딩만 하고 (fork 전에 OpenMP 스레드를 만들지 않도록),
+  워커마다 torch 스레드 수를 CPU 수 / 워커 수로 나눠 설정
+- 부모가 만든 소켓 하나를 모든 워커가 같이 accept, 워커가 죽으면 부모가 다시 fork (모델은 다시 로딩하지 않음)
+- 사용법: SERVER_PROCESSES=4 python serve.py
+  (단일 프로세스 + 백그라운드 로딩은 기존처럼 uvicorn main:app)
+"""
+import os
+import gc
+import sys
+import time
+import signal
+import socket
+import logging
+from typing import Dict
+
+# 워커 프로세스 수
+SERVER_PROCESSES = int(os.getenv("SERVER_PROCESSES", "2"))
+# 워커가 시작 직후 이 시간(초) 안에 죽으면 다시 fork하기 전에 잠시 대기
+RESTART_BACKOFF = 1.0
+
+logger = logging.getLogger("serve")
+
+
+def _worker_threads(inference_workers: int) -> int:
+    """워커 1개의 torch 연산 스레드 수 (TORCH_NUM_THREADS를 지정하면 워커마다 그 값)"""
+    configured = int(os.getenv("TORCH_NUM_THREADS", "0"))
+    if configured:
+        return configured
+    return max(1, (os.cpu_count() or 1) // (SERVER_PROCESSES * inference_workers))
+
+
+def _bind(host: str, port: int) -> socket.socket:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+def _run_worker(main, sock: socket.socket, threads: int) -> None:
+    """fork된 워커 프로세스 (uvicorn이 SIGTERM/SIGINT를 직접 처리)"""
+    import uvicorn
+
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    main.torch.set_num_threads(threads)
+    main.TORCH_NUM_THREADS = threads
+
+    config = uvicorn.Config(main.app, log_level="info")
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+def main() -> int:
+    logging.basicConfig(level=logging.INFO)
+    host = os.getenv("HOST", "0.0.0.0")
+    port = int(os.getenv("PORT", "8080"))
+
+    # main을 import하면 torch/transformers가 로딩됨 (모델은 아직 로딩 전)
+    import main as app_main
+
+    threads = _worker_threads(app_main.INFERENCE_WORKERS)
+    logger.info("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+    logger.info(f"🚀 preload-then-fork 모드: 워커 {SERVER_PROCESSES}개, 워커당 torch 스레드 {threads}개")
+    logger.info(f"📦 부모 프로세스에서 로딩: {', '.join(app_main.PRELOAD_MODELS) or '없음'}")
+    logger.info("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+
+    app_main.torch.set_num_threads(1)
+    try:
+        app_main.models.load_now(app_main.PRELOAD_MODELS)
+    except Exception as e:
+        logger.error(f"❌ 모델 로딩 실패: {e}")
+        return 1
+
+    # 로딩된 객체를 영구 세대로 옮겨 워커의 GC가 공유 페이지에 쓰지 않게 함
+    gc.collect()
+    gc.freeze()
+
+    sock = _bind(host, port)
+    logger.info(f"🌐 http://{host}:{port} 에서 요청 대기")
+
+    children: Dict[int, float] = {}
+    stopping = False
+
+    def spawn() -> None:
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                _run_worker(app_main, sock, threads)
+            except BaseException as e:
+                logger.error(f"❌ 워커 오류: {e}")
+                code = 1
+            finally:
+                # 부모의 atexit 처리기(스레드풀 정리 등)를 다시 실행하지 않도록 바로 종료
+                os._exit(code)
+        children[pid] = time.monotonic()
+        logger.info(f"👷 워커 시작 (pid {pid})")
+
+    def stop(signum, _frame) -> None:
+        nonlocal stopping
+        stopping = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    for _ in range(SERVER_PROCESSES):
+        spawn()
+
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        started = children.pop(pid, None)
+        if started is None or stopping:
+            continue
+        logger.warning(f"⚠️  워커 종료 (pid {pid}, 상태 {status}), 다시 시작")
+        if time.monotonic() - started < RESTART_BACKOFF:
+            time.sleep(RESTART_BACKOFF)
+        spawn()
+
+    sock.close()
+    logger.info("👋 모든 워커 종료")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+"""
+추론 실행기 / 마이크로 배처 테스트
+- 모델 없이 가짜 batch 함수로 스케줄링(배치 묶기, 대기열 제한, 거절)만 확인
+"""
+import asyncio
+import contextvars
+import threading
+
+import pytest
+
+from inference import InferenceBusyError, InferenceExecutor, MicroBatcher
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+class RecordingBatch:
+    """호출된 배치를 기록하고 항목을 두 배로 돌려주는 batch 함수"""
+
+    def __init__(self, gate: threading.Event = None):
+        self.batches = []
+        self.gate = gate
+
+    def __call__(self, items):
+        if self.gate is not None:
+            self.gate.wait(5)
+        self.batches.append(list(items))
+        return [item * 2 if item >= 0 else ValueError(f"bad item {item}") for item in items]
+
+
+def test_concurrent_submits_are_batched_in_order():
+    async def scenario():
+        executor = InferenceExecutor("test", workers=1, max_queue=16)
+        batch = RecordingBatch()
+        batcher = MicroBatcher(executor, batch, max_batch=8, max_wait_ms=50)
+        try:
+            results = await asyncio.gather(*(batcher.submit(i) for i in range(5)))
+        finally:
+            executor.shutdown()
+        return results, batch.batches
+
+    results, batches = _run(scenario())
+    assert results == [0, 2, 4, 6, 8]
+    assert batches == [[0, 1, 2, 3, 4]]
+
+
+def test_short_queue_does_not_reject_while_worker_is_idle():
+    # INFERENCE_MAX_QUEUE < BATCH_MAX_SIZE 이어도 워커가 놀고 있으면 거절하지 않음
+    async def scenario():
+        executor = InferenceExecutor("test", workers=1, max_queue=4)
+        batch = RecordingBatch()
+        batcher = MicroBatcher(executor, batch, max_batch=8, max_wait_ms=20)
+        try:
+            results = await asyncio.gather(*(batcher.submit(i) for i in range(10)), return_exceptions=True)
+        finally:
+            executor.shutdown()
+        return results, batch.batches, executor.stats()
+
+    results, batches, stats = _run(scenario())
+    assert results == [i * 2 for i in range(10)]
+    assert [len(b) for b in batches] == [8, 2]
+    assert stats["rejected"] == 0
+
+
+def test_item_errors_go_to_their_own_caller():
+    async def scenario():
+        executor = InferenceExecutor("test", workers=1, max_queue=16)
+        batcher = MicroBatcher(executor, RecordingBatch(), max_batch=8, max_wait_ms=20)
+        try:
+            return await asyncio.gather(*(batcher.submit(i) for i in (1, -1, 2)), return_exceptions=True)
+        finally:
+            executor.shutdown()
+
+    ok, bad, ok2 = _run(scenario())
+    assert (ok, ok2) == (2, 4)
+    assert isinstance(bad, ValueError)
+
+
+def test_batcher_rejects_when_pending_limit_reached_while_worker_busy():
+    async def scenario():
+        gate = threading.Event()
+        executor = InferenceExecutor("test", workers=1, max_queue=16)
+        batch = RecordingBatch(gate)
+        batcher = MicroBatcher(executor, batch, max_batch=1, max_wait_ms=0, max_pending=2)
+        try:
+            running = asyncio.ensure_future(batcher.submit(1))
+            await asyncio.sleep(0.05)  # 첫 배치가 워커를 점유
+            waiting = [asyncio.ensure_future(batcher.submit(i)) for i in (2, 3)]
+            await asyncio.sleep(0)
+            with pytest.raises(InferenceBusyError):
+                await batcher.submit(4)
+            gate.set()
+            return await asyncio.gather(running, *waiting), batch.batches
+        finally:
+            gate.set()
+            executor.shutdown()
+
+    results, batches = _run(scenario())
+    assert results == [2, 4, 6]
+    assert batches == [[1], [2], [3]]
+
+
+def test_executor_rejects_when_queue_is_full():
+    async def scenario():
+        gate = threading.Event()
+        executor = InferenceExecutor("test", workers=1, max_queue=1)
+        try:
+            first = asyncio.ensure_future(executor.run(gate.wait, 5))
+            second = asyncio.ensure_future(executor.run(gate.wait, 5))
+            await asyncio.sleep(0.05)
+            with pytest.raises(InferenceBusyError) as busy:
+                await executor.run(gate.wait, 5)
+            stats = executor.stats()
+            gate.set()
+            await asyncio.gather(first, second)
+            return busy.value, stats, executor.stats()
+        finally:
+            gate.set()
+            executor.shutdown()
+
+    error, busy_stats, done_stats = _run(scenario())
+    assert error.retry_after >= 1
+    assert (busy_stats["running"], busy_stats["queued"], busy_stats["rejected"]) == (1, 1, 1)
+    assert (done_stats["running"], done_stats["queued"], done_stats["completed"]) == (0, 0, 2)
+
+
+def test_executor_runs_jobs_in_caller_context():
+    request_id = contextvars.ContextVar("request_id", default=None)
+
+    async def scenario():
+        executor = InferenceExecutor("test", workers=1, max_queue=4)
+        request_id.set("abc")
+        try:
+            return await executor.run(request_id.get)
+        finally:
+            executor.shutdown()
+
+    assert _run(scenario()) == "abc"
@@ -0,0 +1,41 @@
+"""
+일일 통계 롤업(read_stats_daily) 백필 스크립트
+- 기존 read_articles 기록으로 롤업 테이블을 다시 계산
+- 사용법: python backfill_stats.py [user_id]  (python migrate.py 적용 후 실행)
+"""
+import sys
+from sqlalchemy import delete, func, insert, select, text, update
+
+from database import engine
+from models import ReadArticle, ReadStatsDaily, AnalyticsVersion
+
+user_id = int(sys.argv[1]) if len(sys.argv) > 1 else None
+
+day = func.date(ReadArticle.read_at)
+hour = func.cast(func.extract("hour", ReadArticle.read_at), ReadStatsDaily.hour.type)
+sentiment = func.coalesce(ReadArticle.sentiment, "")
+category = func.coalesce(ReadArticle.category, "")
+
+source = select(
+    ReadArticle.user_id, day, hour, sentiment, category, func.count(ReadArticle.id)
+).group_by(ReadArticle.user_id, day, hour, sentiment, category)
+clear = delete(ReadStatsDaily)
+# 캐시된 통계 응답/ETag가 재사용되지 않도록 버전도 올림
+bump = update(AnalyticsVersion).values(version=AnalyticsVersion.version + 1)
+if user_id is not None:
+    source = source.where(ReadArticle.user_id == user_id)
+    clear = clear.where(ReadStatsDaily.user_id == user_id)
+    bump = bump.where(AnalyticsVersion.user_id == user_id)
+
+print(f"롤업 백필 시작 (user_id={user_id or '전체'})...")
+with engine.begin() as conn:
+    # 백필 중 새 읽기 기록이 들어와 중복 집계되지 않도록 잠금
+    conn.execute(text("LOCK TABLE read_articles IN SHARE MODE"))
+    conn.execute(clear)
+    result = conn.execute(
+        insert(ReadStatsDaily).from_select(
+            ["user_id", "day", "hour", "sentiment", "category", "count"], source
+        )
+    )
+    conn.execute(bump)
+print(f"롤업 {result.rowcount}행 생성 완료")
@@ -0,0 +1,252 @@
+"""
+뉴스 핫 패스 마이크로 벤치마크
+- bench_fixtures/에 저장된 BBC/Reuters/CNN RSS와 기사 HTML을 사용해 네트워크 없이 측정
+- 대상: 매체별 피드 항목 처리 루프, _extract_article_text, analyze_sentiment(키워드 분기),
+  find_similar_articles, recommender.rank_articles, recommend_news (DB 필요)
+- 항목별 ops/sec(반복 측정 중앙값)와 1회 호출 시 최대 메모리 할당량(tracemalloc peak) 출력
+- bench_fixtures/baseline.json과 비교해 허용 오차보다 느려지거나 할당이 늘면 종료 코드 1
+  (기준값은 측정 장비에 따라 다르므로 장비를 바꾸면 --save-baseline으로 다시 저장)
+- 사용법: python bench_news.py [--only 이름] [--tolerance 0.25] [--save-baseline]
+  recommend_news는 DATABASE_URL에 접속할 수 있을 때만 측정하며, 만든 데이터는 롤백
+"""
+import os
+import gc
+import sys
+import json
+import time
+import logging
+import argparse
+import platform
+import statistics
+import tracemalloc
+from contextlib import ExitStack
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+FIXTURES_DIR = os.path.join(APP_DIR, "bench_fixtures")
+BASELINE_PATH = os.path.join(FIXTURES_DIR, "baseline.json")
+
+# 할당량 비교 시 이보다 작은 차이(KiB)는 측정 오차로 보고 무시
+ALLOC_NOISE_KIB = 4.0
+
+# 키워드 감성 분석 분기를 타도록 AI 설정 제거 (함수가 호출 시점에 환경 변수를 읽음)
+os.environ.pop("AI_SERVICE_URL", None)
+os.environ["USE_LOCAL_AI"] = "false"
+
+Benchmark = Tuple[str, Callable[[], Any]]
+
+
+def _fixture(name: str) -> str:
+    with open(os.path.join(FIXTURES_DIR, name), encoding="utf-8") as f:
+        return f.read()
+
+
+def _feed_benchmarks(news) -> List[Benchmark]:
+    """매체별 피드 항목 처리 루프 (RSS 파싱 결과는 미리 만들어 두고 루프만 측정)"""
+    import feedparser
+
+    benches = []
+    for key, fetch, fixture in (
+        ("bbc", news._fetch_bbc_news, "bbc_world.xml"),
+        ("reuters", news._fetch_reuters_news, "reuters.xml"),
+        ("cnn", news._fetch_cnn_news, "cnn_edition.xml"),
+    ):
+        feed = feedparser.parse(_fixture(fixture))
+
+        def run(fetch=fetch, feed=feed):
+            news._parse_feed = lambda _url: feed
+            return fetch()
+
+        benches.append((f"feed_loop.{key}", run))
+    return benches
+
+
+def _benchmarks(news, stack: ExitStack) -> List[Benchmark]:
+    import feed_cache
+    import recommender
+    from models import UserProfile
+
+    original_parse_feed = news._parse_feed
+    stack.callback(setattr, news, "_parse_feed", original_parse_feed)
+
+    benches = _feed_benchmarks(news)
+
+    # 피드 캐시를 픽스처로 채움 (유사 기사/추천 후보로 사용)
+    for name, run in benches:
+        feed_cache.get_feed(name.split(".")[1], run)
+    articles = feed_cache.cached_articles()
+
+    pages = [
+        ("reuters", "https://www.reuters.com/world/central-bank-holds-rates-2025-10-14/", "reuters_article.html"),
+        ("bbc", "https://www.bbc.co.uk/news/articles/c0000000000o", "bbc_article.html"),
+        ("cnn", "https://edition.cnn.com/2025/10/14/business/stocks-index.html", "cnn_article.html"),
+    ]
+    for key, url, fixture in pages:
+        html = _fixture(fixture)
+        benches.append((f"extract_article_text.{key}", lambda url=url, html=html: news._extract_article_text(url, html)))
+
+    article_text = news._extract_article_text(pages[0][1], _fixture(pages[0][2]))
+    benches.append(("analyze_sentiment.keywords", lambda: news.analyze_sentiment({"text": article_text})))
+
+    target = articles[0]
+    benches.append((
+        "find_similar_articles",
+        lambda: news.find_similar_articles({"target_article": target, "articles": articles}),
+    ))
+
+    # 읽기 기록 30건으로 만든 프로필 (DB 없이 메모리에서만 사용)
+    profile = UserProfile(term_weights={}, category_weights={}, article_count=0)
+    for article in articles[:30]:
+        recommender._apply_article(profile, article["title"], feed_cache.article_url(article), None)
+    candidates = feed_cache.cached_articles("bbc")
+    benches.append(("rank_articles", lambda: recommender.rank_articles(profile, candidates)))
+
+    recommend = _recommend_benchmark(news, stack, articles[:30])
+    if recommend:
+        benches.append(recommend)
+    return benches
+
+
+def _recommend_benchmark(news, stack: ExitStack, history: List[Dict[str, Any]]) -> Optional[Benchmark]:
+    """recommend_news (바깥 트랜잭션 안에서 실행하고 끝나면 롤백)"""
+    from sqlalchemy import text
+    from sqlalchemy.orm import Session
+    from database import engine
+    from models import ReadArticle, User
+    import feed_cache
+
+    try:
+        connection = engine.connect()
+    except Exception as e:
+        print(f"⚠️  DB에 접속할 수 없어 recommend_news는 건너뜀 ({type(e).__name__})")
+        return None
+    stack.callback(connection.close)
+    transaction = connection.begin()
+    stack.callback(transaction.rollback)
+    try:
+        connection.execute(text("SELECT 1 FROM read_articles LIMIT 1"))
+    except Exception as e:
+        print(f"⚠️  read_articles 테이블이 없어 recommend_news는 건너뜀 ({type(e).__name__})")
+        return None
+
+    db = Session(bind=connection, join_transaction_mode="create_savepoint")
+    stack.callback(db.close)
+
+    user = User(username=f"bench-{time.time_ns()}", email=f"bench-{time.time_ns()}@example.com", password="-")
+    db.add(user)
+    db.flush()
+    db.add_all([
+        ReadArticle(user_id=user.id, title=a["title"], url=feed_cache.article_url(a), source="BBC")
+        for a in history
+    ])
+    db.commit()
+
+    request = news.RecommendRequest(user_id=user.id, source="BBC")
+    return "recommend_news", lambda: news.recommend_news(request, db)
+
+
+def _measure(fn: Callable[[], Any], min_time: float, repeat: int) -> Dict[str, float]:
+    """반복 측정한 ops/sec 중앙값과 1회 호출 시 최대 할당량(KiB)"""
+    fn()  # 워밍업 (지연 import, 정규식 컴파일 등)
+
+    # 한 번 측정에 min_time 이상 걸리도록 호출 횟수 보정
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        if time.perf_counter() - started >= min_time:
+            break
+        number *= 2
+
+    rates = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        rates.append(number / (time.perf_counter() - started))
+
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "ops_per_sec": round(statistics.median(rates), 1),
+        "alloc_kib": round((peak - before) / 1024, 1),
+    }
+
+
+def _compare(name: str, result: Dict[str, float], base: Optional[Dict[str, float]], tolerance: float) -> List[str]:
+    """기준값 대비 회귀 항목 설명 목록"""
+    if not base:
+        return []
+    problems = []
+    if result["ops_per_sec"] < base["ops_per_sec"] * (1 - tolerance):
+        problems.append(f"{name}: {base['ops_per_sec']:.1f} → {result['ops_per_sec']:.1f} ops/sec")
+    if (result["alloc_kib"] > base["alloc_kib"] * (1 + tolerance)
+            and result["alloc_kib"] - base["alloc_kib"] > ALLOC_NOISE_KIB):
+        problems.append(f"{name}: {base['alloc_kib']:.1f} → {result['alloc_kib']:.1f} KiB")
+    return problems
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="뉴스 핫 패스 마이크로 벤치마크")
+    parser.add_argument("--only", default="", help="이름에 이 문자열이 포함된 항목만 측정")
+    parser.add_argument("--min-time", type=float, default=0.2, help="측정 1회 최소 시간 (초)")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 측정 횟수 (중앙값 사용)")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="기준값 대비 허용 오차 (0.25 = 25%%)")
+    parser.add_argument("--save-baseline", action="store_true", help="측정 결과를 기준값으로 저장")
+    args = parser.parse_args()
+
+    # 라우트 함수의 info 로그는 측정 대상이 아니므로 출력하지 않음
+    logging.disable(logging.WARNING)
+    from routes import news
+
+    baseline: Dict[str, Any] = {}
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH) as f:
+            baseline = json.load(f)
+    base_results = baseline.get("results", {})
+
+    results: Dict[str, Dict[str, float]] = {}
+    regressions: List[str] = []
+    print(f"{'항목':<32}{'ops/sec':>12}{'기준 대비':>10}{'alloc KiB':>12}{'기준 대비':>10}")
+    with ExitStack() as stack:
+        for name, fn in _benchmarks(news, stack):
+            if args.only not in name:
+                continue
+            result = results[name] = _measure(fn, args.min_time, args.repeat)
+            base = base_results.get(name)
+            speed = f"{result['ops_per_sec'] / base['ops_per_sec'] - 1:+.0%}" if base else "-"
+            alloc = f"{result['alloc_kib'] - base['alloc_kib']:+.1f}" if base else "-"
+            print(f"{name:<32}{result['ops_per_sec']:>12.1f}{speed:>10}{result['alloc_kib']:>12.1f}{alloc:>10}")
+            regressions.extend(_compare(name, result, base, args.tolerance))
+
+    if args.save_baseline:
+        baseline = {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "saved_at": time.strftime("%Y-%m-%d"),
+            "results": {**base_results, **results},
+        }
+        with open(BASELINE_PATH, "w") as f:
+            json.dump(baseline, f, indent=2, ensure_ascii=False, sort_keys=True)
+            f.write("\n")
+        print(f"\n💾 기준값 저장: {BASELINE_PATH}")
+        return 0
+
+    print()
+    if regressions:
+        print(f"❌ 기준값 대비 {args.tolerance:.0%} 넘게 나빠진 항목")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    print("✅ 기준값 대비 회귀 없음" if base_results else "ℹ️  기준값이 없습니다 (--save-baseline으로 저장)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+"""
+서버 시작(import) 시간 벤치마크
+- 새 파이썬 프로세스에서 `python -X importtime -c "import main"`을 실행해 모듈별 import 시간 측정
+- 앱 모듈(routes, database 등)과 누적 시간이 긴 모듈을 보여주고,
+  지연 로딩 대상(bs4, feedparser, numpy, scikit-learn)이 시작 시점에 로딩되는지 확인
+- 사용법: python bench_startup.py [--top 20] [--runs 3]
+  (지연 로딩 대상이 시작 시점에 로딩되면 종료 코드 1)
+"""
+import os
+import re
+import sys
+import argparse
+import statistics
+import subprocess
+from typing import Dict, List, Tuple
+
+from warmup import HEAVY_MODULES
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_PREFIXES = ("main", "database", "models", "routes", "migrations", "utils")
+_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def _measure() -> Tuple[Dict[str, Tuple[int, int, int]], float]:
+    """
+    새 프로세스에서 main을 import
+
+    Returns:
+        ({모듈: (self_us, cumulative_us, depth)}, 전체 import 시간 ms)
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=APP_DIR, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        sys.stderr.write(result.stderr)
+        raise SystemExit("main import 실패")
+
+    modules = {}
+    for line in result.stderr.splitlines():
+        m = _LINE.match(line)
+        if m:
+            self_us, cumulative_us, indent, name = m.groups()
+            modules[name] = (int(self_us), int(cumulative_us), len(indent) // 2)
+    return modules, modules["main"][1] / 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="서버 import 시간 벤치마크")
+    parser.add_argument("--top", type=int, default=20, help="누적 시간 상위 N개 모듈 출력")
+    parser.add_argument("--runs", type=int, default=3, help="반복 측정 횟수 (중앙값 사용)")
+    args = parser.parse_args()
+
+    runs: List[Dict[str, Tuple[int, int, int]]] = []
+    totals: List[float] = []
+    for _ in range(args.runs):
+        modules, total_ms = _measure()
+        runs.append(modules)
+        totals.append(total_ms)
+
+    # 마지막 실행 기준으로 목록을 만들고 시간은 실행별 중앙값 사용
+    modules = runs[-1]
+
+    def median_ms(name: str) -> float:
+        return statistics.median(r[name][1] for r in runs if name in r) / 1000
+
+    print(f"⏱️  import main: {statistics.median(totals):.0f}ms (중앙값, {args.runs}회)")
+
+    print("\n📦 앱 모듈 (누적 ms)")
+    for name in sorted(modules, key=median_ms, reverse=True):
+        if name.split(".")[0] in APP_PREFIXES:
+            print(f"  {median_ms(name):8.1f}  {name}")
+
+    print(f"\n🐢 최상위 import 누적 시간 상위 {args.top}")
+    top_level = [name for name, (_, _, depth) in modules.items() if depth <= 1 and name != "main"]
+    for name in sorted(top_level, key=median_ms, reverse=True)[:args.top]:
+        print(f"  {median_ms(name):8.1f}  {name}")
+
+    eager = [name for name in HEAVY_MODULES if name.split(".")[0] in {m.split(".")[0] for m in modules}]
+    print()
+    if eager:
+        print(f"❌ 시작 시점에 로딩된 지연 로딩 대상: {', '.join(eager)}")
+        return 1
+    print(f"✅ 지연 로딩 대상은 시작 시점에 로딩되지 않음: {', '.join(HEAVY_MODULES)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""
+주요 조회 쿼리 실행 계획 점검
+- 각 쿼리를 EXPLAIN 해서 기대한 인덱스를 사용하는지 확인
+- 데이터가 적은 개발 DB에서도 확인할 수 있도록 seq scan을 비활성화한 상태로 계획을 만듦
+- 사용법: python check_query_plans.py  (하나라도 실패하면 종료 코드 1)
+"""
+import sys
+import json
+from datetime import datetime, timedelta
+from sqlalchemy import select, text, tuple_
+from sqlalchemy.dialects import postgresql
+
+from database import SessionLocal
+from models import Bookmark, ReadArticle
+from routes.analytics import _stats_query
+
+USER_ID = 1
+
+HOT_QUERIES = [
+    (
+        "읽기 기록 최신순 (/analytics/history)",
+        "ix_read_articles_user_read_at",
+        select(ReadArticle).where(ReadArticle.user_id == USER_ID)
+        .order_by(ReadArticle.read_at.desc(), ReadArticle.id.desc()).limit(51),
+    ),
+    (
+        "읽기 기록 다음 페이지 (/analytics/history?cursor=)",
+        "ix_read_articles_user_read_at",
+        select(ReadArticle).where(
+            ReadArticle.user_id == USER_ID,
+            tuple_(ReadArticle.read_at, ReadArticle.id) < tuple_(datetime(2025, 1, 1), 1000)
+        ).order_by(ReadArticle.read_at.desc(), ReadArticle.id.desc()).limit(51),
+    ),
+    (
+        "이미 읽은 기사 확인 (/news/recommend)",
+        "ix_read_articles_user_url",
+        select(ReadArticle.url).where(
+            ReadArticle.user_id == USER_ID,
+            ReadArticle.url.in_(["https://example.com/a", "https://example.com/b"])
+        ),
+    ),
+    (
+        "북마크 최신순 (/bookmarks/{user_id})",
+        "ix_bookmarks_user_saved_at",
+        select(Bookmark).where(Bookmark.user_id == USER_ID)
+        .order_by(Bookmark.saved_at.desc(), Bookmark.id.desc()).limit(51),
+    ),
+    (
+        "북마크 다음 페이지 (/bookmarks/{user_id}?cursor=)",
+        "ix_bookmarks_user_saved_at",
+        select(Bookmark).where(
+            Bookmark.user_id == USER_ID,
+            tuple_(Bookmark.saved_at, Bookmark.id) < tuple_(datetime(2025, 1, 1), 1000)
+        ).order_by(Bookmark.saved_at.desc(), Bookmark.id.desc()).limit(51),
+    ),
+    (
+        "북마크 중복 확인 (POST /bookmarks/)",
+        "uq_bookmarks_user_url",
+        select(Bookmark.id).where(Bookmark.user_id == USER_ID, Bookmark.url == "https://example.com/a"),
+    ),
+]
+
+
+def _index_names(plan: dict) -> set:
+    """실행 계획 트리에서 사용된 인덱스 이름 수집"""
+    names = set()
+    if "Index Name" in plan:
+        names.add(plan["Index Name"])
+    for child in plan.get("Plans", []):
+        names |= _index_names(child)
+    return names
+
+
+def main() -> int:
+    db = SessionLocal()
+    queries = list(HOT_QUERIES)
+    queries.append((
+        "사용자 통계 집계 (/analytics/stats)",
+        "ix_read_stats_daily_user_day",
+        _stats_query(USER_ID, datetime.utcnow() - timedelta(days=7)),
+    ))
+
+    failed = 0
+    try:
+        db.execute(text("SET enable_seqscan = off"))
+        for name, expected_index, stmt in queries:
+            sql = str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+            plan = db.execute(text(f"EXPLAIN (FORMAT JSON) {sql}")).scalar()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            used = _index_names(plan[0]["Plan"])
+
+            if expected_index in used:
+                print(f"✅ {name}: {expected_index}")
+            else:
+                failed += 1
+                print(f"❌ {name}: {expected_index} 미사용 (사용된 인덱스: {', '.join(sorted(used)) or '없음'})")
+    finally:
+        db.close()
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,386 @@
+"""
+기사 사전 처리(enrichment) 모듈
+- 피드 캐시가 갱신되면 새 기사 URL을 큐에 넣고, 백그라운드 스레드가 본문 추출 → 감성 분석 → 요약
+  (ENRICH_TRANSLATE=true면 제목 번역까지) 미리 처리해 article_cache/translation_cache에 저장
+  → 팝업을 열 때 상세/요약/감성 분석 API가 캐시에서 바로 응답
+- 기사 여러 개를 묶어서 처리: 본문 추출/감성 분석/번역은 ENRICH_CONCURRENCY개씩 동시에 요청하고
+  (AI 서비스가 동시에 들어온 요청을 배치로 추론), 요약은 /summarize/batch 한 번으로 요청
+- 우선순위 큐: 사용자가 지금 보고 있는 기사(상세 요청)는 피드에서 새로 들어온 기사보다 먼저 처리
+- ENRICHMENT_ENABLED=false면 워커를 띄우지 않음 (요청 시 직접 처리한 결과는 그대로 캐시에 저장)
+- 캐시에는 서버가 가져온 본문으로 만든 결과만 저장 (클라이언트가 보낸 텍스트로 만든 결과는 저장하지 않음)
+- 빈 본문/요약 안내 문구는 저장하지 않고 실패로 기록해 ENRICH_RETRY_SECONDS 동안만 다시 시도하지 않음
+"""
+import os
+import time
+import logging
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from queue import Empty, PriorityQueue
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+import feed_cache
+from metrics import registry
+from response_cache import ResponseCache, article_cache, translation_cache
+
+logger = logging.getLogger(__name__)
+
+ENRICHMENT_ENABLED = os.getenv("ENRICHMENT_ENABLED", "true").lower() == "true"
+# 한 번에 묶어서 처리할 기사 수 (요약은 이 개수만큼 /summarize/batch 1회)
+ENRICH_BATCH_SIZE = int(os.getenv("ENRICH_BATCH_SIZE", "8"))
+# 본문 추출/감성 분석/번역 동시 요청 수
+ENRICH_CONCURRENCY = int(os.getenv("ENRICH_CONCURRENCY", "4"))
+# 대기열 최대 길이 (넘으면 피드 기사는 버림, 보고 있는 기사는 항상 추가)
+ENRICH_MAX_QUEUE = int(os.getenv("ENRICH_MAX_QUEUE", "500"))
+# 제목 번역까지 미리 처리 (AI 서비스가 설정된 경우만)
+ENRICH_TRANSLATE = os.getenv("ENRICH_TRANSLATE", "false").lower() == "true"
+# 본문 추출/요약에 실패한 기사를 다시 시도하기까지 기다리는 시간 (초)
+ENRICH_RETRY_SECONDS = float(os.getenv("ENRICH_RETRY_SECONDS", "120"))
+
+# 우선순위 (작을수록 먼저)
+PRIORITY_VIEWING = 0  # 사용자가 보고 있는 기사
+PRIORITY_FEED = 1     # 피드에서 새로 들어온 기사
+_STOP = -1
+
+# 이 필드가 모두 캐시에 있으면 사전 처리 완료
+ENRICHED_FIELDS = ("content", "sentiment", "summary")
+
+enrich_stage_duration = registry.histogram(
+    "enrichment_stage_duration_seconds", "기사 사전 처리 단계별 시간 (배치 1회)", ("stage",)
+)
+enrich_articles = registry.counter(
+    "enrichment_articles", "사전 처리한 기사 수 (결과별)", ("result",)
+)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 캐시 접근
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+def cached(url: str) -> Optional[Dict[str, Any]]:
+    """기사 URL의 사전 처리 결과 (final_url, content, sentiment, summary 중 처리된 것만)"""
+    return article_cache.get(url)
+
+
+def store(url: str, **fields: Any) -> Dict[str, Any]:
+    """기사 URL의 처리 결과 저장 (기존 필드에 합침)"""
+    return article_cache.update(url, **fields)
+
+
+# 실패한 기사 URL → 실패 시각 (짧은 negative 캐시)
+_failures = ResponseCache(int(os.getenv("ARTICLE_CACHE_SIZE", "2000")))
+
+
+def mark_failed(url: str) -> None:
+    """본문 추출/요약 실패 기록 (ENRICH_RETRY_SECONDS 동안 다시 시도하지 않음)"""
+    _failures.set(url, time.monotonic())
+
+
+def recently_failed(url: str) -> bool:
+    failed_at = _failures.peek(url)
+    return failed_at is not None and time.monotonic() - failed_at < ENRICH_RETRY_SECONDS
+
+
+def store_content(url: str, final_url: str, content: str) -> Optional[Dict[str, Any]]:
+    """기사 본문 저장 (빈 본문은 저장하지 않고 실패로 기록, None 반환)"""
+    if not content or not content.strip():
+        mark_failed(url)
+        return None
+    return store(url, final_url=final_url, content=content[:3000])
+
+
+def store_summary(url: str, summary: str, **fields: Any) -> None:
+    """요약 저장 (요약 대신 돌려준 안내 문구는 저장하지 않고 실패로 기록)"""
+    from routes import news
+    if news.is_placeholder_summary(summary):
+        mark_failed(url)
+        return
+    store(url, summary=summary, **fields)
+
+
+def cached_translation(text: str, target_lang: str = "ko") -> Optional[str]:
+    return translation_cache.get((target_lang, text))
+
+
+def store_translation(text: str, translated: str, target_lang: str = "ko") -> None:
+    translation_cache.set((target_lang, text), translated)
+
+
+def _missing(url: str) -> List[str]:
+    entry = article_cache.peek(url) or {}
+    return [field for field in ENRICHED_FIELDS if field not in entry]
+
+
+def _title(url: str) -> str:
+    article = feed_cache.find_article(url) or {}
+    return article.get("title", "")
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 사전 처리 워커
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+class EnrichmentWorker:
+    """우선순위 큐에서 기사를 묶어 꺼내 사전 처리하는 백그라운드 워커"""
+
+    def __init__(self, batch_size: int, concurrency: int, max_queue: int, translate: bool):
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.max_queue = max_queue
+        self.translate = translate
+
+        # (우선순위, 순번, URL) - 같은 우선순위면 먼저 들어온 순서
+        self._queue: "PriorityQueue[Tuple[int, int, Optional[str]]]" = PriorityQueue()
+        self._queued: Dict[str, int] = {}  # 대기 중인 URL → 우선순위
+        self._active: Set[str] = set()     # 처리 중인 URL
+        self._cond = threading.Condition()
+        self._seq = itertools.count()
+        self._thread: Optional[threading.Thread] = None
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+        # 지표
+        self.processed = 0
+        self.failed = 0
+        self.dropped = 0
+        self.batches = 0
+        self.last_batch_ms = 0.0
+
+    def start(self) -> None:
+        """워커 스레드 시작 후 피드 갱신 알림 등록 (이미 실행 중이면 무시)"""
+        with self._cond:
+            if self.running():
+                return
+            self._pool = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="enrich")
+            self._thread = threading.Thread(target=self._run, name="enrichment", daemon=True)
+            self._thread.start()
+        feed_cache.on_refresh(self._on_feed_refresh)
+        logger.info(f"✅ 기사 사전 처리 시작 (배치 {self.batch_size}, 동시 요청 {self.concurrency}, "
+                    f"번역 {'사용' if self.translate else '안 함'})")
+
+    def stop(self) -> None:
+        """처리 중인 배치가 끝나면 종료 (대기 중인 기사는 버림)"""
+        thread = self._thread
+        if not thread:
+            return
+        self._queue.put((_STOP, next(self._seq), None))
+        thread.join(timeout=10)
+        if self._pool:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+        self._thread = None
+        logger.info("기사 사전 처리 종료")
+
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def enqueue(self, articles: List[Dict[str, Any]], priority: int) -> int:
+        """
+        기사 사전 처리 예약 (이미 처리됐거나 같은/더 높은 우선순위로 대기 중이면 무시)
+
+        Returns:
+            새로 예약한 기사 수
+        """
+        if not self.running():
+            return 0
+        added = 0
+        with self._cond:
+            for article in articles:
+                url = feed_cache.article_url(article)
+                if not url or url in self._active or not _missing(url) or recently_failed(url):
+                    continue
+                current = self._queued.get(url)
+                if current is not None and current <= priority:
+                    continue
+                if current is None and priority != PRIORITY_VIEWING and len(self._queued) >= self.max_queue:
+                    self.dropped += 1
+                    continue
+                # 우선순위가 올라간 기사는 새로 넣고, 이전 항목은 꺼낼 때 건너뜀
+                self._queued[url] = priority
+                self._queue.put((priority, next(self._seq), url))
+                added += 1
+        return added
+
+    def wait(self, url: str, field: str, timeout: float) -> Optional[Dict[str, Any]]:
+        """
+        기사가 처리 중이거나 보고 있는 기사로 대기 중이면 최대 timeout초 기다린 뒤 캐시 반환
+        (field가 아직 없으면 None → 호출한 쪽에서 직접 처리)
+        """
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while url in self._active or self._queued.get(url) == PRIORITY_VIEWING:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self.running():
+                    break
+                self._cond.wait(remaining)
+        entry = article_cache.get(url)
+        return entry if entry and field in entry else None
+
+    def _on_feed_refresh(self, source: str, articles: List[Dict[str, Any]]) -> None:
+        added = self.enqueue(articles, PRIORITY_FEED)
+        if added:
+            logger.info(f"📥 사전 처리 예약: source={source}, 새 기사 {added}개")
+
+    def _next_batch(self) -> Optional[List[str]]:
+        """큐에서 최대 batch_size개를 꺼냄 (첫 항목은 올 때까지 대기, 종료 신호면 None)"""
+        batch: List[str] = []
+        item = self._queue.get()
+        while True:
+            priority, _, url = item
+            if priority == _STOP:
+                if not batch:
+                    return None
+                # 꺼낸 배치를 먼저 처리한 뒤 종료
+                self._queue.put(item)
+                break
+            with self._cond:
+                if self._queued.get(url) == priority:
+                    del self._queued[url]
+                    self._active.add(url)
+                    batch.append(url)
+            if len(batch) >= self.batch_size:
+                break
+            try:
+                item = self._queue.get_nowait()
+            except Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            if not batch:
+                continue
+            started = time.perf_counter()
+            try:
+                self._process(batch)
+            except Exception as e:
+                logger.error(f"❌ 기사 사전 처리 실패 ({len(batch)}건): {e}")
+            finally:
+                done = sum(1 for url in batch if not _missing(url))
+                self.processed += done
+                self.failed += len(batch) - done
+                enrich_articles.inc(done, result="done")
+                enrich_articles.inc(len(batch) - done, result="failed")
+                self.batches += 1
+                self.last_batch_ms = (time.perf_counter() - started) * 1000
+                with self._cond:
+                    self._active.difference_update(batch)
+                    self._cond.notify_all()
+            logger.info(f"🧪 기사 사전 처리: {done}/{len(batch)}건, {self.last_batch_ms:.0f}ms")
+
+    def _map(self, fn: Callable[[Any], Any], items: List[Any]) -> List[Any]:
+        """items를 동시에 처리한 결과 (입력 순서, 실패한 항목은 Exception)"""
+        futures = [self._pool.submit(fn, item) for item in items]
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(e)
+        return results
+
+    def _process(self, urls: List[str]) -> None:
+        # routes.news가 이 모듈을 import하므로 처리할 때 import
+        from routes import news
+
+        # 1) 본문 추출 (캐시에 없는 기사만)
+        def extract(url: str) -> Dict[str, Any]:
+            entry = article_cache.peek(url) or {}
+            if "content" in entry:
+                return entry
+            final_url, content = news._fetch_article(url)
+            entry = store_content(url, final_url, content)
+            if entry is None:
+                raise ValueError("본문이 비어 있음")
+            return entry
+
+        entries: Dict[str, Dict[str, Any]] = {}
+        with enrich_stage_duration.time(stage="extract"):
+            for url, result in zip(urls, self._map(extract, urls)):
+                if isinstance(result, Exception):
+                    logger.warning(f"⚠️  사전 처리 본문 추출 실패: {url} ({result})")
+                    mark_failed(url)
+                else:
+                    entries[url] = result
+
+        # 2) 감성 분석은 동시에 요청해 두고, 그동안 요약을 배치 1회로 요청
+        sentiment_urls = [url for url, entry in entries.items() if "sentiment" not in entry]
+        sentiment_futures = [
+            self._pool.submit(news.sentiment_for_text, entries[url]["content"])
+            for url in sentiment_urls
+        ]
+
+        summary_urls = [url for url, entry in entries.items() if "summary" not in entry]
+        if summary_urls:
+            with enrich_stage_duration.time(stage="summarize"):
+                try:
+                    summaries = news.summarize_contents([entries[url]["content"] for url in summary_urls])
+                except Exception as e:
+                    logger.warning(f"⚠️  사전 처리 요약 실패 ({len(summary_urls)}건): {e}")
+                    summaries = []
+                    for url in summary_urls:
+                        mark_failed(url)
+            for url, summary in zip(summary_urls, summaries):
+                if isinstance(summary, Exception):
+                    logger.warning(f"⚠️  사전 처리 요약 실패: {url} ({summary})")
+                    mark_failed(url)
+                else:
+                    store_summary(url, summary)
+
+        with enrich_stage_duration.time(stage="sentiment"):
+            for url, future in zip(sentiment_urls, sentiment_futures):
+                try:
+                    store(url, sentiment=future.result())
+                except Exception as e:
+                    logger.warning(f"⚠️  사전 처리 감성 분석 실패: {url} ({e})")
+
+        # 3) 제목 번역 (프론트엔드가 번역 요청하는 제목 그대로 캐시)
+        if self.translate and os.getenv("AI_SERVICE_URL"):
+            titles = [_title(url) for url in entries]
+            titles = [title for title in titles if title and not translation_cache.peek(("ko", title))]
+            with enrich_stage_duration.time(stage="translate"):
+                for title, result in zip(titles, self._map(self._translate, titles)):
+                    if isinstance(result, Exception):
+                        logger.warning(f"⚠️  사전 처리 번역 실패: {title[:30]} ({result})")
+                    else:
+                        store_translation(title, result)
+
+    @staticmethod
+    def _translate(text: str) -> str:
+        from utils import call_ai_service
+        payload = {"text": text, "source_lang": "en", "target_lang": "ko"}
+        return call_ai_service("/translate", payload, timeout=120)["translated_text"]
+
+    def stats(self) -> Dict[str, Any]:
+        """큐 상태와 처리 지표 (/health용)"""
+        with self._cond:
+            queued = len(self._queued)
+            viewing = sum(1 for priority in self._queued.values() if priority == PRIORITY_VIEWING)
+            active = len(self._active)
+        return {
+            "enabled": ENRICHMENT_ENABLED,
+            "running": self.running(),
+            "queued": queued,
+            "queued_viewing": viewing,
+            "active": active,
+            "batch_size": self.batch_size,
+            "concurrency": self.concurrency,
+            "processed": self.processed,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "batches": self.batches,
+            "last_batch_ms": round(self.last_batch_ms, 1),
+            "cached_articles": len(article_cache),
+        }
+
+    def depth(self) -> int:
+        with self._cond:
+            return len(self._queued)
+
+
+worker = EnrichmentWorker(ENRICH_BATCH_SIZE, ENRICH_CONCURRENCY, ENRICH_MAX_QUEUE, ENRICH_TRANSLATE)
+
+
+def start() -> None:
+    """사전 처리 워커 시작 (비활성화면 무시)"""
+    if ENRICHMENT_ENABLED:
+        worker.start()
@@ -0,0 +1,130 @@
+"""
+RSS 피드 서버 캐시 모듈
+- 매체별 기사 목록을 TTL 동안 메모리에 보관
+- 추천 시스템 등 다른 기능이 클라이언트 업로드 없이 최신 피드를 사용할 수 있도록 함
+"""
+import os
+import time
+import threading
+import logging
+from typing import Callable, Dict, Any, List, Optional
+
+from metrics import registry
+
+logger = logging.getLogger(__name__)
+
+feed_fetch_duration = registry.histogram(
+    "feed_fetch_duration_seconds", "RSS 피드 수집 시간 (매체별)", ("source",)
+)
+feed_cache_requests = registry.counter(
+    "feed_cache_requests", "피드 캐시 조회 수 (매체, hit/miss별)", ("source", "result")
+)
+
+# 피드 캐시 유지 시간 (초)
+FEED_CACHE_TTL = int(os.getenv("FEED_CACHE_TTL", "300"))
+
+# source -> {"articles": [...], "fetched_at": float}
+_feeds: Dict[str, Dict[str, Any]] = {}
+# url -> article (모든 매체 통합 인덱스)
+_by_url: Dict[str, Dict[str, Any]] = {}
+_lock = threading.Lock()
+# 피드가 갱신될 때마다 1씩 증가 (매체 간 비교 결과 등의 캐시 키)
+_version = 0
+# 피드가 갱신될 때 새로 들어온 기사 목록을 받는 함수 (source, articles)
+_listeners: List[Callable[[str, List[Dict[str, Any]]], None]] = []
+
+
+def article_url(article: Dict[str, Any]) -> str:
+    """피드 항목은 link, 클라이언트 데이터는 url 키를 사용하므로 둘 다 확인"""
+    return article.get("url") or article.get("link") or ""
+
+
+def on_refresh(listener: Callable[[str, List[Dict[str, Any]]], None]) -> None:
+    """피드 갱신 시 새 기사(이전 캐시에 없던 URL)를 받을 함수 등록"""
+    if listener not in _listeners:
+        _listeners.append(listener)
+
+
+def get_feed(source: str, loader: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    캐시된 피드 반환 (만료되었으면 loader로 다시 가져옴)
+
+    Args:
+        source: 매체 키 (bbc, reuters, cnn)
+        loader: 피드를 가져오는 함수 ({"articles": [...]} 형태 반환)
+    """
+    global _version
+    entry = _feeds.get(source)
+    if entry and time.time() - entry["fetched_at"] < FEED_CACHE_TTL:
+        feed_cache_requests.inc(source=source, result="hit")
+        return entry["payload"]
+
+    feed_cache_requests.inc(source=source, result="miss")
+    with feed_fetch_duration.time(source=source):
+        payload = loader()
+    articles = payload.get("articles") or []
+
+    # 빈 결과는 캐시하지 않음 (일시적 장애일 수 있음)
+    if articles:
+        with _lock:
+            _version += 1
+            old = _feeds.get(source)
+            old_urls = set()
+            if old:
+                for article in old["payload"].get("articles", []):
+                    old_urls.add(article_url(article))
+                    _by_url.pop(article_url(article), None)
+            _feeds[source] = {"payload": payload, "fetched_at": time.time()}
+            for article in articles:
+                url = article_url(article)
+                if url:
+                    _by_url[url] = {**article, "source": article.get("source") or source}
+        logger.info(f"피드 캐시 갱신: source={source}, articles={len(articles)}")
+
+        new_articles = [a for a in articles if article_url(a) and article_url(a) not in old_urls]
+        for listener in _listeners:
+            try:
+                listener(source, new_articles)
+            except Exception as e:
+                logger.warning(f"⚠️  피드 갱신 알림 실패: {e}")
+
+    return payload
+
+
+def cached_articles(source: Optional[str] = None) -> List[Dict[str, Any]]:
+    """캐시된 기사 목록 (source가 없으면 모든 매체)"""
+    with _lock:
+        if source:
+            entry = _feeds.get(source)
+            if not entry:
+                return []
+            urls = [article_url(a) for a in entry["payload"].get("articles", [])]
+            return [_by_url[url] for url in urls if url in _by_url]
+        return list(_by_url.values())
+
+
+def fetched_at(source: str) -> float:
+    """매체 피드를 마지막으로 가져온 시각 (캐시에 없으면 0)"""
+    entry = _feeds.get(source)
+    return entry["fetched_at"] if entry else 0.0
+
+
+def version() -> int:
+    """피드 캐시 버전 (어느 매체든 갱신되면 증가)"""
+    return _version
+
+
+def payload_version(source: str, payload: Dict[str, Any]) -> Optional[str]:
+    """
+    캐시에 들어 있는 피드 응답의 버전 (ETag용)
+    - 수집에 실패해 캐시에 저장되지 않은 응답이면 None
+    """
+    entry = _feeds.get(source)
+    if entry is None or entry["payload"] is not payload:
+        return None
+    return f"{source}-{int(entry['fetched_at'] * 1000)}"
+
+
+def find_article(url: str) -> Optional[Dict[str, Any]]:
+    """URL로 캐시된 기사 조회"""
+    return _by_url.get(url)
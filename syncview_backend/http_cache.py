@@ -0,0 +1,229 @@
+"""
+HTTP 캐시/압축 미들웨어 모듈
+- 라우트별 Cache-Control 기본값 (피드는 public + 짧은 max-age로 CDN이 받아가고, 분석/북마크는 private)
+  라우트가 직접 Cache-Control을 넣었으면 그대로 둠
+- 강한 ETag: 라우트가 캐시 버전으로 ETag를 넣었으면 그 값을, 없으면 본문 해시를 사용
+  If-None-Match가 일치하면 본문 없이 304
+- 본문이 HTTP_COMPRESS_MIN_BYTES 이상이면 brotli(설치된 경우) 또는 gzip으로 압축
+  인코딩마다 다른 표현이므로 ETag 뒤에 -br / -gzip을 붙이고 Vary: Accept-Encoding 추가
+- 본문을 여러 조각으로 보내는 스트리밍 응답은 건드리지 않음
+"""
+import os
+import gzip
+import hashlib
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from anyio import to_thread
+from starlette.datastructures import Headers, MutableHeaders
+
+from feed_cache import FEED_CACHE_TTL
+from metrics import registry
+
+try:
+    import brotli
+except ImportError:  # 설치되지 않았으면 gzip만 사용
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# 이 크기(바이트) 미만의 응답은 압축하지 않음 (헤더보다 이득이 작음)
+HTTP_COMPRESS_MIN_BYTES = int(os.getenv("HTTP_COMPRESS_MIN_BYTES", "1024"))
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", "6"))
+# 요청마다 압축하므로 속도 위주 (최대 11)
+BROTLI_QUALITY = int(os.getenv("BROTLI_QUALITY", "5"))
+# 이보다 큰 본문은 이벤트 루프를 막지 않도록 스레드에서 압축
+_THREAD_COMPRESS_BYTES = 64 * 1024
+# 브라우저가 피드를 그대로 쓰는 시간 (초, CDN은 서버 피드 캐시 TTL까지)
+FEED_HTTP_MAX_AGE = int(os.getenv("FEED_HTTP_MAX_AGE", "60"))
+# 기사 본문/요약은 기사 URL마다 거의 바뀌지 않음
+ARTICLE_HTTP_MAX_AGE = int(os.getenv("ARTICLE_HTTP_MAX_AGE", "1800"))
+
+FEED_POLICY = f"public, max-age={FEED_HTTP_MAX_AGE}, s-maxage={FEED_CACHE_TTL}"
+ARTICLE_POLICY = f"public, max-age={ARTICLE_HTTP_MAX_AGE}"
+PRIVATE_POLICY = "private, no-cache"
+
+# 경로 → Cache-Control 기본값 (경로 자체 또는 하위 경로에 적용, 위에서부터 처음 맞는 것)
+CACHE_POLICIES: List[Tuple[str, str]] = [
+    ("/news/news", FEED_POLICY),
+    ("/news/bbc", FEED_POLICY),
+    ("/news/reuters", FEED_POLICY),
+    ("/news/cnn", FEED_POLICY),
+    ("/news/detail", ARTICLE_POLICY),
+    ("/news/summary", ARTICLE_POLICY),
+    ("/analytics", PRIVATE_POLICY),
+    ("/bookmarks", PRIVATE_POLICY),
+    ("/subscriptions", PRIVATE_POLICY),
+    ("/auth", "no-store"),
+    ("/metrics", "no-store"),
+    ("/admin", "no-store"),
+]
+
+_COMPRESSIBLE_TYPES = ("application/json", "text/", "application/javascript", "application/xml", "image/svg+xml")
+
+http_not_modified = registry.counter(
+    "http_not_modified", "If-None-Match가 일치해 304로 응답한 수"
+)
+http_compressed = registry.counter(
+    "http_compressed_responses", "압축해서 보낸 응답 수 (인코딩별)", ("encoding",)
+)
+http_compression_saved_bytes = registry.counter(
+    "http_compression_saved_bytes", "압축으로 줄인 응답 바이트 수"
+)
+
+
+def cache_policy(path: str) -> Optional[str]:
+    """경로의 Cache-Control 기본값 (없으면 None)"""
+    for prefix, policy in CACHE_POLICIES:
+        if path == prefix or path.startswith(prefix + "/"):
+            return policy
+    return None
+
+
+def _accepted_encodings(header: str) -> Dict[str, float]:
+    """Accept-Encoding → {인코딩: q값}"""
+    accepted = {}
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[name.strip().lower()] = q
+    return accepted
+
+
+def choose_encoding(header: str) -> Optional[str]:
+    """클라이언트가 받을 수 있는 압축 방식 (br > gzip, 없으면 None)"""
+    accepted = _accepted_encodings(header)
+    for encoding in ("br", "gzip"):
+        if encoding == "br" and brotli is None:
+            continue
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+
+def _compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def _strip_encoding(tag: str) -> str:
+    """ETag에서 W/ 접두어와 인코딩 접미어(-br, -gzip)를 떼어 비교용 값으로"""
+    if tag.startswith("W/"):
+        tag = tag[2:]
+    for suffix in ('-br"', '-gzip"'):
+        if tag.endswith(suffix):
+            return tag[: -len(suffix)] + '"'
+    return tag
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match에 etag가 있는지 (약한 비교, 인코딩 접미어 무시)"""
+    if if_none_match.strip() == "*":
+        return True
+    target = _strip_encoding(etag)
+    return any(_strip_encoding(tag.strip()) == target for tag in if_none_match.split(","))
+
+
+class HttpCacheMiddleware:
+    """
+    응답 캐시 헤더/압축 (ASGI 미들웨어)
+    - ETag/304/Cache-Control은 GET 200 응답에만, 압축은 모든 응답에 적용
+    """
+
+    def __init__(self, app, min_size: int = HTTP_COMPRESS_MIN_BYTES):
+        self.app = app
+        self.min_size = min_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        encoding = choose_encoding(request_headers.get("accept-encoding", ""))
+        if_none_match = request_headers.get("if-none-match")
+        cacheable = scope["method"] == "GET"
+        start_message = None
+        chunks: List[bytes] = []
+        streaming = False
+
+        async def send_wrapper(message):
+            nonlocal start_message, streaming
+            if streaming:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+            if message.get("more_body", False) and not chunks:
+                # 스트리밍 응답은 모아두지 않고 그대로 전달
+                streaming = True
+                await send(start_message)
+                await send(message)
+                return
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+            await self._finish(send, start_message, b"".join(chunks), scope["path"],
+                               cacheable, encoding, if_none_match)
+
+        await self.app(scope, receive, send_wrapper)
+
+    async def _finish(self, send, start_message, body: bytes, path: str, cacheable: bool,
+                      encoding: Optional[str], if_none_match: Optional[str]) -> None:
+        status = start_message["status"]
+        headers = MutableHeaders(raw=list(start_message["headers"]))
+        etag = None
+
+        if cacheable and status == 200:
+            policy = cache_policy(path)
+            if policy and "cache-control" not in headers:
+                headers["cache-control"] = policy
+            if "no-store" not in headers.get("cache-control", ""):
+                etag = headers.get("etag") or f'"{hashlib.sha1(body).hexdigest()[:20]}"'
+                headers["etag"] = etag
+
+        content_type = headers.get("content-type", "")
+        compressible = content_type.startswith(_COMPRESSIBLE_TYPES) and "content-encoding" not in headers
+        if compressible:
+            headers.add_vary_header("Accept-Encoding")
+        if compressible and encoding and len(body) >= self.min_size:
+            if etag:
+                headers["etag"] = f'{etag[:-1]}-{encoding}"'
+        else:
+            encoding = None
+
+        if etag and if_none_match and etag_matches(if_none_match, etag):
+            http_not_modified.inc()
+            for name in ("content-length", "content-type", "content-encoding"):
+                if name in headers:
+                    del headers[name]
+            await send({"type": "http.response.start", "status": 304, "headers": headers.raw})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        if encoding:
+            if len(body) > _THREAD_COMPRESS_BYTES:
+                compressed = await to_thread.run_sync(_compress, body, encoding)
+            else:
+                compressed = _compress(body, encoding)
+            http_compressed.inc(encoding=encoding)
+            http_compression_saved_bytes.inc(len(body) - len(compressed))
+            body = compressed
+            headers["content-encoding"] = encoding
+            headers["content-length"] = str(len(body))
+
+        await send({**start_message, "headers": headers.raw})
+        await send({"type": "http.response.body", "body": body})
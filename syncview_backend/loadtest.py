@@ -0,0 +1,292 @@
+"""
+엔드투엔드 부하 테스트
+- 로컬 스텁(피드/기사 서버, 가짜 AI 서비스)과 백엔드(uvicorn)를 띄우고 가상 사용자로 트래픽을 보냄
+  (외부 RSS/Cloud Run 없이 재현 가능한 수치를 얻기 위함, DB는 DATABASE_URL 사용)
+- 시나리오
+  - browse: 매체별 뉴스 목록 조회
+  - popup: 기사 팝업 열기 (본문 → 요약 → 감성 분석 → 제목 번역)
+  - analytics: 읽기 기록 저장, 통계/읽기 기록 조회
+- 엔드포인트별 처리량(req/s)과 p50/p95/p99 지연 시간 출력 (워밍업 구간은 제외)
+- 사용법
+  python loadtest.py --mix mixed --users 20 --duration 60
+  python loadtest.py --mix browse=6,popup=3,analytics=1 --ai-latency summarize=1500 --ai-error-rate 0.02
+  python loadtest.py --backend-url http://localhost:8000   (이미 떠 있는 서버 대상, 스텁/서버를 띄우지 않음)
+- 가상 사용자는 loadtest-<실행 시각>-<번호> 아이디로 가입되며 테스트 후에도 DB에 남음
+"""
+import os
+import sys
+import json
+import math
+import time
+import random
+import asyncio
+import argparse
+import subprocess
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+import loadtest_stubs
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+MIXES = {
+    "browse": {"browse": 1},
+    "popup": {"popup": 1},
+    "analytics": {"analytics": 1},
+    "mixed": {"browse": 6, "popup": 3, "analytics": 1},
+}
+SOURCES = ["BBC", "Reuters", "CNN"]
+
+
+def parse_mix(spec: str) -> Dict[str, float]:
+    """프리셋 이름 또는 "browse=6,popup=3" 형식"""
+    if spec in MIXES:
+        return MIXES[spec]
+    mix = {}
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        if name not in MIXES["mixed"]:
+            raise SystemExit(f"알 수 없는 시나리오: {name} (browse, popup, analytics)")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def percentile(sorted_values: List[float], p: float) -> float:
+    """nearest-rank 백분위수"""
+    if not sorted_values:
+        return 0.0
+    index = math.ceil(p / 100 * len(sorted_values)) - 1
+    return sorted_values[max(0, min(index, len(sorted_values) - 1))]
+
+
+class Recorder:
+    """엔드포인트별 지연 시간/상태 코드 기록 (워밍업이 끝난 뒤 요청만)"""
+
+    def __init__(self, measure_from: float):
+        self.measure_from = measure_from
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.statuses: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+    def record(self, endpoint: str, started: float, status: str) -> None:
+        if started < self.measure_from:
+            return
+        self.latencies[endpoint].append(time.perf_counter() - started)
+        self.statuses[endpoint][status] += 1
+
+
+async def _call(client: httpx.AsyncClient, recorder: Recorder, endpoint: str, method: str,
+                url: str, **kwargs) -> Optional[httpx.Response]:
+    started = time.perf_counter()
+    try:
+        response = await client.request(method, url, **kwargs)
+    except httpx.HTTPError as e:
+        recorder.record(endpoint, started, type(e).__name__)
+        return None
+    recorder.record(endpoint, started, str(response.status_code))
+    return response
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 시나리오
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+async def browse(client, recorder, user_id: int, articles: List[dict]) -> None:
+    await _call(client, recorder, "GET /news/news", "GET", "/news/news",
+                params={"source": random.choice(SOURCES)})
+
+
+async def popup(client, recorder, user_id: int, articles: List[dict]) -> None:
+    article = random.choice(articles)
+    url = article["link"]
+    detail = await _call(client, recorder, "GET /news/detail", "GET", "/news/detail", params={"url": url})
+    await _call(client, recorder, "GET /news/summary", "GET", "/news/summary", params={"url": url})
+    content = detail.json().get("content", "") if detail is not None and detail.status_code == 200 else ""
+    await _call(client, recorder, "POST /news/sentiment", "POST", "/news/sentiment",
+                json={"text": content or article["title"]})
+    await _call(client, recorder, "POST /api/translate", "POST", "/api/translate",
+                json={"text": article["title"], "source_lang": "en", "target_lang": "ko"})
+
+
+async def analytics(client, recorder, user_id: int, articles: List[dict]) -> None:
+    article = random.choice(articles)
+    await _call(client, recorder, "POST /analytics/read-article", "POST", "/analytics/read-article",
+                json={"user_id": user_id, "title": article["title"], "url": article["link"],
+                      "source": article.get("source", "BBC")})
+    await _call(client, recorder, "GET /analytics/stats/{user_id}", "GET", f"/analytics/stats/{user_id}")
+    await _call(client, recorder, "GET /analytics/history/{user_id}", "GET", f"/analytics/history/{user_id}")
+
+
+SCENARIOS = {"browse": browse, "popup": popup, "analytics": analytics}
+
+
+async def _virtual_user(client, recorder, mix: Dict[str, float], user_id: int,
+                        articles: List[dict], deadline: float, think: float) -> None:
+    names, weights = list(mix), list(mix.values())
+    while time.perf_counter() < deadline:
+        scenario = random.choices(names, weights)[0]
+        await SCENARIOS[scenario](client, recorder, user_id, articles)
+        if think > 0:
+            await asyncio.sleep(random.uniform(0, 2 * think))
+
+
+async def _setup(client: httpx.AsyncClient, users: int) -> Tuple[List[int], List[dict]]:
+    """가상 사용자 가입, 팝업/읽기 기록에 쓸 기사 목록 수집"""
+    run_id = time.strftime("%m%d%H%M%S")
+    user_ids = []
+    for i in range(users):
+        response = await client.post("/auth/register", json={
+            "username": f"loadtest-{run_id}-{i}",
+            "email": f"loadtest-{run_id}-{i}@example.com",
+            "password": "loadtest-password",
+        })
+        response.raise_for_status()
+        user_ids.append(response.json()["user_id"])
+
+    articles = []
+    for source in SOURCES:
+        response = await client.get("/news/news", params={"source": source})
+        response.raise_for_status()
+        articles.extend({**a, "source": source} for a in response.json().get("articles", []))
+    if not articles:
+        raise SystemExit("피드에서 기사를 가져오지 못했습니다 (RSS 주소 설정 확인)")
+    return user_ids, articles
+
+
+async def run(base_url: str, mix: Dict[str, float], users: int, duration: float,
+              warmup: float, think: float) -> Tuple[Recorder, float]:
+    limits = httpx.Limits(max_connections=users * 2, max_keepalive_connections=users * 2)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        user_ids, articles = await _setup(client, users)
+        print(f"👥 가상 사용자 {users}명, 기사 {len(articles)}개, 워밍업 {warmup:.0f}초 + 측정 {duration:.0f}초")
+
+        started = time.perf_counter()
+        recorder = Recorder(measure_from=started + warmup)
+        deadline = started + warmup + duration
+        await asyncio.gather(*[
+            _virtual_user(client, recorder, mix, user_id, articles, deadline, think)
+            for user_id in user_ids
+        ])
+        measured = time.perf_counter() - recorder.measure_from
+    return recorder, measured
+
+
+def report(recorder: Recorder, measured: float) -> Dict[str, dict]:
+    """엔드포인트별 결과 표 출력, 같은 내용을 dict로 반환"""
+    results = {}
+    print(f"\n{'엔드포인트':<34}{'요청':>7}{'오류':>6}{'req/s':>8}{'p50':>8}{'p95':>8}{'p99':>8}{'max':>8}  (ms)")
+    total = errors = 0
+    for endpoint in sorted(recorder.latencies):
+        values = sorted(recorder.latencies[endpoint])
+        statuses = dict(recorder.statuses[endpoint])
+        failed = sum(n for status, n in statuses.items() if not status.isdigit() or int(status) >= 400)
+        row = {
+            "requests": len(values),
+            "errors": failed,
+            "rps": round(len(values) / measured, 2),
+            "p50_ms": round(percentile(values, 50) * 1000, 1),
+            "p95_ms": round(percentile(values, 95) * 1000, 1),
+            "p99_ms": round(percentile(values, 99) * 1000, 1),
+            "max_ms": round(values[-1] * 1000, 1),
+            "statuses": statuses,
+        }
+        results[endpoint] = row
+        total += row["requests"]
+        errors += failed
+        print(f"{endpoint:<34}{row['requests']:>7}{failed:>6}{row['rps']:>8.1f}"
+              f"{row['p50_ms']:>8.0f}{row['p95_ms']:>8.0f}{row['p99_ms']:>8.0f}{row['max_ms']:>8.0f}")
+    print(f"\n📈 전체 {total}건, {total / measured:.1f} req/s, 오류 {errors}건 ({errors / max(total, 1):.1%})")
+    return results
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 스텁/백엔드 프로세스
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+def _wait_ready(url: str, timeout: float) -> None:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            if httpx.get(url, timeout=2).status_code < 500:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.3)
+    raise SystemExit(f"{url} 이(가) {timeout:.0f}초 안에 준비되지 않았습니다")
+
+
+def _start_processes(args) -> Tuple[str, List[subprocess.Popen]]:
+    host = "127.0.0.1"
+    stubs = subprocess.Popen(
+        [sys.executable, "loadtest_stubs.py", "--host", host,
+         "--feed-port", str(args.feed_port), "--ai-port", str(args.ai_port),
+         "--feed-latency-ms", str(args.feed_latency_ms),
+         "--ai-latency", args.ai_latency, "--ai-error-rate", str(args.ai_error_rate)],
+        cwd=APP_DIR, stdout=subprocess.DEVNULL,
+    )
+    processes = [stubs]
+    _wait_ready(f"http://{host}:{args.ai_port}/health", 15)
+
+    env = {
+        **os.environ,
+        **loadtest_stubs.feed_env(host, args.feed_port),
+        "AI_SERVICE_URL": f"http://{host}:{args.ai_port}",
+        "USE_LOCAL_AI": "false",
+    }
+    backend = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", host, "--port", str(args.port),
+         "--workers", str(args.workers), "--log-level", "warning"],
+        cwd=APP_DIR, env=env,
+    )
+    processes.append(backend)
+    base_url = f"http://{host}:{args.port}"
+    _wait_ready(f"{base_url}/", 60)
+    return base_url, processes
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="SyncView 백엔드 부하 테스트")
+    parser.add_argument("--mix", default="mixed", help="시나리오 비율 (browse, popup, analytics, mixed 또는 browse=6,popup=3)")
+    parser.add_argument("--users", type=int, default=20, help="동시 가상 사용자 수")
+    parser.add_argument("--duration", type=float, default=60, help="측정 시간 (초)")
+    parser.add_argument("--warmup", type=float, default=5, help="측정에서 제외할 초반 시간 (초)")
+    parser.add_argument("--think-ms", type=float, default=0, help="시나리오 사이 평균 대기 시간 (ms)")
+    parser.add_argument("--backend-url", help="이미 실행 중인 백엔드 주소 (지정하면 스텁/서버를 띄우지 않음)")
+    parser.add_argument("--port", type=int, default=8800, help="테스트용 백엔드 포트")
+    parser.add_argument("--workers", type=int, default=1, help="테스트용 백엔드 uvicorn worker 수")
+    parser.add_argument("--feed-port", type=int, default=8801)
+    parser.add_argument("--ai-port", type=int, default=8802)
+    parser.add_argument("--feed-latency-ms", type=float, default=0, help="스텁 피드/기사 응답 지연 (평균 ms)")
+    parser.add_argument("--ai-latency", default=loadtest_stubs.DEFAULT_AI_LATENCY, help="가짜 AI 경로별 평균 지연 (ms)")
+    parser.add_argument("--ai-error-rate", type=float, default=0.0, help="가짜 AI 요청 실패(503) 비율")
+    parser.add_argument("--json", help="결과를 JSON 파일로 저장")
+    args = parser.parse_args()
+
+    mix = parse_mix(args.mix)
+    processes: List[subprocess.Popen] = []
+    try:
+        if args.backend_url:
+            base_url = args.backend_url.rstrip("/")
+        else:
+            base_url, processes = _start_processes(args)
+
+        recorder, measured = asyncio.run(
+            run(base_url, mix, args.users, args.duration, args.warmup, args.think_ms / 1000)
+        )
+        results = report(recorder, measured)
+        if args.json:
+            with open(args.json, "w") as f:
+                json.dump({"config": vars(args), "mix": mix, "duration": measured, "endpoints": results},
+                          f, indent=2, ensure_ascii=False)
+            print(f"💾 결과 저장: {args.json}")
+    finally:
+        for process in reversed(processes):
+            process.terminate()
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,191 @@
+"""
+부하 테스트용 로컬 스텁 서버
+- 피드 서버: bench_fixtures/의 BBC/Reuters/CNN RSS를 제공하고, 기사 링크를 이 서버의
+  /articles/<매체>/... 주소로 바꿔 기사 페이지 요청도 로컬에서 처리
+- 가짜 AI 서비스: /sentiment, /summarize, /translate를 실제 AI 서비스와 같은 응답 형식으로 제공
+  (경로별 지연 시간과 오류율 설정 가능)
+- loadtest.py가 자동으로 띄우며, 직접 실행하면 백엔드에 넣을 환경 변수를 출력
+- 사용법: python loadtest_stubs.py [--feed-port 8801] [--ai-port 8802]
+          [--ai-latency sentiment=50,summarize=800,translate=300] [--ai-error-rate 0.01]
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+FIXTURES_DIR = os.path.join(APP_DIR, "bench_fixtures")
+
+# 매체 → (RSS 픽스처, 기사 페이지 픽스처, 실제 기사 링크 접두어)
+SOURCES = {
+    "bbc": ("bbc_world.xml", "bbc_article.html", "https://www.bbc.co.uk/"),
+    "reuters": ("reuters.xml", "reuters_article.html", "https://www.reuters.com/"),
+    "cnn": ("cnn_edition.xml", "cnn_article.html", "https://edition.cnn.com/"),
+}
+
+DEFAULT_AI_LATENCY = "sentiment=50,summarize=800,translate=300"
+
+
+def _read(name: str) -> bytes:
+    with open(os.path.join(FIXTURES_DIR, name), "rb") as f:
+        return f.read()
+
+
+def parse_latency(spec: str) -> Dict[str, float]:
+    """"sentiment=50,summarize=800" → {"/sentiment": 0.05, "/summarize": 0.8} (초)"""
+    result = {}
+    for part in filter(None, spec.split(",")):
+        path, _, ms = part.partition("=")
+        result["/" + path.strip().lstrip("/")] = float(ms) / 1000
+    return result
+
+
+def _sleep(seconds: float) -> None:
+    """평균 seconds, ±50% 범위에서 고르게 흔들리는 지연"""
+    if seconds > 0:
+        time.sleep(seconds * random.uniform(0.5, 1.5))
+
+
+class _QuietHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, body: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status: int, data) -> None:
+        self._send(status, json.dumps(data, ensure_ascii=False).encode(), "application/json")
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 피드/기사 서버
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+def make_feed_server(host: str, port: int, latency: float = 0.0) -> ThreadingHTTPServer:
+    base = f"http://{host}:{port}"
+    feeds, pages = {}, {}
+    for source, (rss, page, prefix) in SOURCES.items():
+        feeds[f"/rss/{source}.xml"] = _read(rss).replace(prefix.encode(), f"{base}/articles/{source}/".encode())
+        pages[source] = _read(page)
+
+    class Handler(_QuietHandler):
+        def do_GET(self):
+            _sleep(latency)
+            path = self.path.split("?", 1)[0]
+            if path in feeds:
+                self._send(200, feeds[path], "application/rss+xml; charset=utf-8")
+                return
+            parts = path.split("/")
+            if len(parts) > 2 and parts[1] == "articles" and parts[2] in pages:
+                self._send(200, pages[parts[2]], "text/html; charset=utf-8")
+                return
+            self._send(404, b"not found", "text/plain")
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    return server
+
+
+def feed_env(host: str, port: int) -> Dict[str, str]:
+    """백엔드가 스텁 피드를 읽도록 하는 환경 변수"""
+    base = f"http://{host}:{port}"
+    return {f"{source.upper()}_RSS_URL": f"{base}/rss/{source}.xml" for source in SOURCES}
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 가짜 AI 서비스
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+def _fake_result(path: str, payload: dict):
+    text = str(payload.get("text", ""))
+    if path == "/sentiment":
+        label = [("negative", "부정"), ("neutral", "중립"), ("positive", "긍정")][len(text) % 3]
+        return {"sentiment": label[0], "label": label[1], "score": 0.8}
+    if path == "/summarize":
+        return {"summary": " ".join(text.split(". ")[:3])[:500]}
+    if path == "/summarize/batch":
+        return {"results": [{"summary": " ".join(str(t).split(". ")[:3])[:500]} for t in payload.get("texts", [])]}
+    if path == "/translate":
+        return {"translated_text": f"[ko] {text}"}
+    return None
+
+
+def make_ai_server(host: str, port: int, latency: Dict[str, float], error_rate: float) -> ThreadingHTTPServer:
+    lock = threading.Lock()
+    counts = {"requests": 0, "errors": 0}
+
+    class Handler(_QuietHandler):
+        def do_GET(self):
+            if self.path.startswith("/health"):
+                self._send_json(200, {"status": "healthy", **counts})
+            else:
+                self._send(404, b"not found", "text/plain")
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            try:
+                payload = json.loads(self.rfile.read(length) or b"{}")
+            except ValueError:
+                self._send_json(422, {"detail": "invalid json"})
+                return
+
+            _sleep(latency.get(self.path, 0.0))
+            with lock:
+                counts["requests"] += 1
+                failed = random.random() < error_rate
+                if failed:
+                    counts["errors"] += 1
+            if failed:
+                self._send_json(503, {"detail": "가짜 AI 서비스 오류 (주입된 장애)"})
+                return
+
+            result = _fake_result(self.path, payload)
+            if result is None:
+                self._send_json(404, {"detail": "Not Found"})
+            else:
+                self._send_json(200, result)
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    return server
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="부하 테스트용 피드/AI 스텁 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--feed-port", type=int, default=8801)
+    parser.add_argument("--ai-port", type=int, default=8802)
+    parser.add_argument("--feed-latency-ms", type=float, default=0, help="피드/기사 페이지 응답 지연 (평균 ms)")
+    parser.add_argument("--ai-latency", default=DEFAULT_AI_LATENCY, help="AI 경로별 평균 지연 (ms)")
+    parser.add_argument("--ai-error-rate", type=float, default=0.0, help="AI 요청 중 503으로 실패시킬 비율")
+    args = parser.parse_args()
+
+    feed_server = make_feed_server(args.host, args.feed_port, args.feed_latency_ms / 1000)
+    ai_server = make_ai_server(args.host, args.ai_port, parse_latency(args.ai_latency), args.ai_error_rate)
+    threading.Thread(target=feed_server.serve_forever, daemon=True).start()
+
+    print(f"📰 피드/기사 스텁: http://{args.host}:{args.feed_port}")
+    print(f"🤖 가짜 AI 서비스: http://{args.host}:{args.ai_port} (지연 {args.ai_latency}, 오류율 {args.ai_error_rate})")
+    print("백엔드 환경 변수:")
+    for key, value in {**feed_env(args.host, args.feed_port), "AI_SERVICE_URL": f"http://{args.host}:{args.ai_port}"}.items():
+        print(f"  {key}={value}")
+    sys.stdout.flush()
+
+    try:
+        ai_server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,15 +1,19 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.sessions import SessionMiddleware
-from database import engine
-from models import Base
+from database import engine, async_engine
+from password_hasher import password_hasher
+import migrations
+import warmup
+import enrichment
+from metrics import registry, MetricsMiddleware, threadpool_gauges, CONTENT_TYPE
+import profiler
+import http_cache
+from response_cache import analytics_cache
 import os
 import secrets
 from routes import auth, news, translate, bookmark, subscription, analytics
 
-# ✅ DB 테이블 생성
-Base.metadata.create_all(bind=engine)
-
 # ✅ FastAPI 앱 생성
 app = FastAPI(title="SyncView Backend")
 
@@ -30,6 +34,23 @@ async def startup_event():
     logger.info("🚀 SyncView 백엔드 서버 시작")
     logger.info("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
     
+    # ✅ DB 스키마 마이그레이션 (적용되지 않은 버전만 실행)
+    applied = migrations.upgrade(engine)
+    if applied:
+        logger.info(f"🗄️  DB 마이그레이션 적용: {', '.join(applied)}")
+    
+    # ✅ 읽기 기록 쓰기 지연 버퍼 시작
+    analytics.read_buffer.start()
+    
+    # ✅ 비밀번호 해시 프로세스 풀 시작
+    password_hasher.start()
+    
+    # ✅ 무거운 의존성(bs4, feedparser, numpy, scikit-learn) 백그라운드 워밍업
+    warmup.start()
+    
+    # ✅ 새 피드 기사 사전 처리 (본문/감성 분석/요약을 미리 캐시)
+    enrichment.start()
+    
     if USE_LOCAL_AI:
         # ✅ 로컬 AI 모델 사용 (개발/테스트 환경)
         logger.info("🏠 AI 모드: 로컬 모델 (USE_LOCAL_AI=true)")
@@ -93,6 +114,15 @@ app.add_middleware(
     https_only=bool(os.getenv("RENDER"))  # Render에서만 HTTPS 쿠키
 )
 
+# ✅ 응답 캐시 헤더(Cache-Control/ETag/304) + gzip/brotli 압축
+app.add_middleware(http_cache.HttpCacheMiddleware)
+
+# ✅ 요청 샘플링 프로파일러 (PROFILING_ENABLED 또는 서명 헤더로 켜짐, 꺼져 있으면 그대로 통과)
+app.add_middleware(profiler.ProfilerMiddleware)
+
+# ✅ 라우트별 요청 지연 시간 지표 (가장 바깥에서 측정)
+app.add_middleware(MetricsMiddleware)
+
 # ✅ 라우터 등록
 app.include_router(auth.router, prefix="/auth", tags=["auth"])
 app.include_router(news.router, prefix="/news", tags=["news"])
@@ -100,6 +130,35 @@ app.include_router(translate.router, prefix="/api", tags=["translate"])
 app.include_router(bookmark.router, prefix="/bookmarks", tags=["bookmarks"])
 app.include_router(subscription.router, prefix="/subscriptions", tags=["subscriptions"])
 app.include_router(analytics.router, prefix="/analytics", tags=["analytics"])
+app.include_router(profiler.router, tags=["admin"])
+
+# ✅ 서버 종료 이벤트 (버퍼에 남은 읽기 기록 저장, 커넥션 풀 정리)
+@app.on_event("shutdown")
+async def shutdown_event():
+    from starlette.concurrency import run_in_threadpool
+    await run_in_threadpool(analytics.read_buffer.stop)
+    await run_in_threadpool(enrichment.worker.stop)
+    await async_engine.dispose()
+    password_hasher.shutdown()
+
+# ✅ 지표 (/metrics, Prometheus 텍스트 형식)
+# 스레드풀 포화도, 캐시 적중률, 쓰기 버퍼/비밀번호 해시 대기열은 수집 시점에 계산
+threadpool_gauges("backend")
+registry.counter("analytics_cache_hits", "분석 응답 캐시 적중 수", callback=lambda: analytics_cache.hits)
+registry.counter("analytics_cache_misses", "분석 응답 캐시 미스 수", callback=lambda: analytics_cache.misses)
+registry.gauge("read_buffer_depth", "저장 대기 중인 읽기 이벤트 수",
+               callback=lambda: analytics.read_buffer.stats()["depth"])
+registry.gauge("read_buffer_last_flush_seconds", "마지막 읽기 버퍼 flush 시간",
+               callback=lambda: analytics.read_buffer.last_flush_ms / 1000)
+registry.gauge("password_hash_queue_depth", "비밀번호 해시 대기 요청 수",
+               callback=lambda: password_hasher.stats()["queue_depth"])
+registry.gauge("enrichment_queue_depth", "사전 처리 대기 중인 기사 수", callback=enrichment.worker.depth)
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    # async로 두어야 이벤트 루프에서 스레드풀 상태를 읽을 수 있음
+    return Response(registry.render(), media_type=CONTENT_TYPE)
 
 # ✅ 루트 엔드포인트
 @app.get("/")
@@ -121,6 +180,10 @@ def health_check():
                 "database": "connected",
                 "translation": translate_status.get("status", "unknown")
             },
+            "read_buffer": analytics.read_buffer.stats(),
+            "password_hasher": password_hasher.stats(),
+            "warmup": warmup.status(),
+            "enrichment": enrichment.worker.stats(),
             "timestamp": "2025-01-27T00:00:00Z"
         }
     except Exception as e:
@@ -0,0 +1,33 @@
+"""
+DB 마이그레이션 명령
+- python migrate.py           : 적용되지 않은 마이그레이션 실행
+- python migrate.py --status  : 적용 현황 출력
+- python migrate.py --reset   : 모든 테이블 삭제 후 처음부터 다시 적용 (로컬 개발용)
+"""
+import sys
+import logging
+from sqlalchemy import text
+
+import migrations
+from database import engine
+from models import Base
+
+logging.basicConfig(level=logging.INFO)
+
+if "--status" in sys.argv:
+    with engine.begin() as conn:
+        applied = set(migrations.applied_versions(conn))
+    for version, module in migrations.discover():
+        mark = "✅" if version in applied else "⏳"
+        print(f"{mark} {module.__name__.split('.')[-1]}")
+    sys.exit(0)
+
+if "--reset" in sys.argv:
+    print("기존 테이블 삭제 중...")
+    Base.metadata.drop_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(text("DROP TABLE IF EXISTS schema_migrations"))
+    print("테이블 삭제 완료")
+
+applied = migrations.upgrade(engine)
+print(f"마이그레이션 {len(applied)}개 적용 완료" if applied else "이미 최신 스키마입니다")
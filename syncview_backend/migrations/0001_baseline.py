@@ -0,0 +1,109 @@
+"""
+기준 스키마 (users, bookmarks, subscriptions, read_articles, user_profiles,
+read_stats_daily, analytics_versions)
+- 마이그레이션 도입 시점의 스키마를 DDL로 고정 (이후 모델이 바뀌어도 0001이 만드는 테이블은 그대로,
+  스키마 변경은 새 마이그레이션으로 추가)
+- 기존에 create_all로 만들어진 DB에서는 이미 있는 테이블/인덱스를 건너뜀
+"""
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+STATEMENTS = [
+    """
+    CREATE TABLE IF NOT EXISTS users (
+        id SERIAL NOT NULL,
+        username VARCHAR NOT NULL,
+        email VARCHAR NOT NULL,
+        password VARCHAR NOT NULL,
+        interest VARCHAR,
+        PRIMARY KEY (id)
+    )
+    """,
+    "CREATE UNIQUE INDEX IF NOT EXISTS ix_users_email ON users (email)",
+    "CREATE INDEX IF NOT EXISTS ix_users_id ON users (id)",
+    "CREATE UNIQUE INDEX IF NOT EXISTS ix_users_username ON users (username)",
+    """
+    CREATE TABLE IF NOT EXISTS bookmarks (
+        id SERIAL NOT NULL,
+        user_id INTEGER NOT NULL,
+        title VARCHAR NOT NULL,
+        url VARCHAR NOT NULL,
+        summary TEXT,
+        source VARCHAR,
+        published VARCHAR,
+        saved_at TIMESTAMP WITHOUT TIME ZONE,
+        PRIMARY KEY (id),
+        FOREIGN KEY (user_id) REFERENCES users (id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_bookmarks_id ON bookmarks (id)",
+    """
+    CREATE TABLE IF NOT EXISTS subscriptions (
+        id SERIAL NOT NULL,
+        user_id INTEGER NOT NULL,
+        topic VARCHAR,
+        source VARCHAR NOT NULL,
+        created_at TIMESTAMP WITHOUT TIME ZONE,
+        updated_at TIMESTAMP WITHOUT TIME ZONE,
+        PRIMARY KEY (id),
+        UNIQUE (user_id),
+        FOREIGN KEY (user_id) REFERENCES users (id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_subscriptions_id ON subscriptions (id)",
+    """
+    CREATE TABLE IF NOT EXISTS read_articles (
+        id SERIAL NOT NULL,
+        user_id INTEGER NOT NULL,
+        title VARCHAR NOT NULL,
+        url VARCHAR NOT NULL,
+        source VARCHAR,
+        category VARCHAR,
+        sentiment VARCHAR,
+        sentiment_score FLOAT,
+        read_at TIMESTAMP WITHOUT TIME ZONE,
+        PRIMARY KEY (id),
+        FOREIGN KEY (user_id) REFERENCES users (id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_read_articles_id ON read_articles (id)",
+    """
+    CREATE TABLE IF NOT EXISTS user_profiles (
+        id SERIAL NOT NULL,
+        user_id INTEGER NOT NULL,
+        term_weights JSON NOT NULL,
+        category_weights JSON NOT NULL,
+        article_count INTEGER NOT NULL,
+        updated_at TIMESTAMP WITHOUT TIME ZONE,
+        PRIMARY KEY (id),
+        UNIQUE (user_id),
+        FOREIGN KEY (user_id) REFERENCES users (id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_user_profiles_id ON user_profiles (id)",
+    """
+    CREATE TABLE IF NOT EXISTS read_stats_daily (
+        user_id INTEGER NOT NULL,
+        day DATE NOT NULL,
+        hour INTEGER NOT NULL,
+        sentiment VARCHAR NOT NULL,
+        category VARCHAR NOT NULL,
+        count INTEGER NOT NULL,
+        PRIMARY KEY (user_id, day, hour, sentiment, category),
+        FOREIGN KEY (user_id) REFERENCES users (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS analytics_versions (
+        user_id INTEGER NOT NULL,
+        version INTEGER NOT NULL,
+        PRIMARY KEY (user_id),
+        FOREIGN KEY (user_id) REFERENCES users (id)
+    )
+    """,
+]
+
+
+def upgrade(conn: Connection) -> None:
+    for statement in STATEMENTS:
+        conn.execute(text(statement))
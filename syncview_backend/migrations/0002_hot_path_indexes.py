@@ -0,0 +1,41 @@
+"""
+자주 호출되는 조회 경로용 복합/커버링 인덱스
+- read_articles (user_id, read_at DESC, id DESC): 읽기 기록 최신순 조회
+- read_articles (user_id, url): 추천 시 이미 읽은 기사 제외
+- read_stats_daily (user_id, day) INCLUDE (...): 통계 집계 index-only scan
+- bookmarks (user_id, saved_at DESC, id DESC): 북마크 최신순 조회
+- bookmarks UNIQUE (user_id, url): 중복 북마크 방지 (기존 중복은 가장 오래된 것만 남김)
+"""
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+
+def upgrade(conn: Connection) -> None:
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_read_articles_user_read_at "
+        "ON read_articles (user_id, read_at DESC, id DESC)"
+    ))
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_read_articles_user_url "
+        "ON read_articles (user_id, url)"
+    ))
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_read_stats_daily_user_day "
+        "ON read_stats_daily (user_id, day) INCLUDE (hour, sentiment, category, count)"
+    ))
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_bookmarks_user_saved_at "
+        "ON bookmarks (user_id, saved_at DESC, id DESC)"
+    ))
+
+    exists = conn.execute(text(
+        "SELECT 1 FROM pg_constraint WHERE conname = 'uq_bookmarks_user_url'"
+    )).first()
+    if not exists:
+        conn.execute(text(
+            "DELETE FROM bookmarks b USING bookmarks older "
+            "WHERE b.user_id = older.user_id AND b.url = older.url AND b.id > older.id"
+        ))
+        conn.execute(text(
+            "ALTER TABLE bookmarks ADD CONSTRAINT uq_bookmarks_user_url UNIQUE (user_id, url)"
+        ))
@@ -0,0 +1,80 @@
+"""
+DB 스키마 마이그레이션 실행기
+- migrations/NNNN_설명.py 모듈을 버전 순서대로 적용
+- 적용된 버전은 schema_migrations 테이블에 기록
+- 여러 인스턴스가 동시에 시작해도 advisory lock으로 한 곳에서만 실행
+"""
+import re
+import pkgutil
+import logging
+import importlib
+from types import ModuleType
+from typing import List, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+logger = logging.getLogger(__name__)
+
+# pg_advisory_lock 키 (임의의 고정값)
+_LOCK_KEY = 4_830_017
+_MODULE_RE = re.compile(r"^(\d{4})_\w+$")
+
+
+def discover() -> List[Tuple[str, ModuleType]]:
+    """마이그레이션 모듈 목록 (버전 오름차순)"""
+    found = []
+    for info in pkgutil.iter_modules(__path__):
+        match = _MODULE_RE.match(info.name)
+        if match:
+            found.append((match.group(1), importlib.import_module(f"{__name__}.{info.name}")))
+    return sorted(found, key=lambda x: x[0])
+
+
+def _ensure_version_table(conn: Connection) -> None:
+    conn.execute(text(
+        "CREATE TABLE IF NOT EXISTS schema_migrations ("
+        " version VARCHAR PRIMARY KEY,"
+        " applied_at TIMESTAMP NOT NULL DEFAULT now())"
+    ))
+
+
+def applied_versions(conn: Connection) -> List[str]:
+    """적용된 버전 목록"""
+    _ensure_version_table(conn)
+    rows = conn.execute(text("SELECT version FROM schema_migrations ORDER BY version"))
+    return [version for (version,) in rows]
+
+
+def upgrade(engine: Engine) -> List[str]:
+    """
+    아직 적용되지 않은 마이그레이션을 순서대로 실행 (각각 별도 트랜잭션)
+
+    Returns:
+        이번에 적용된 버전 목록
+    """
+    applied_now = []
+    with engine.connect() as conn:
+        with conn.begin():
+            conn.execute(text("SELECT pg_advisory_lock(:key)"), {"key": _LOCK_KEY})
+        try:
+            with conn.begin():
+                applied = set(applied_versions(conn))
+
+            for version, module in discover():
+                if version in applied:
+                    continue
+                logger.info(f"🔄 마이그레이션 적용 중: {module.__name__}")
+                with conn.begin():
+                    module.upgrade(conn)
+                    conn.execute(
+                        text("INSERT INTO schema_migrations (version) VALUES (:version)"),
+                        {"version": version}
+                    )
+                applied_now.append(version)
+                logger.info(f"✅ 마이그레이션 완료: {version}")
+        finally:
+            with conn.begin():
+                conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": _LOCK_KEY})
+
+    return applied_now
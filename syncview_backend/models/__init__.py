@@ -1,6 +1,7 @@
-치from database import Base
+from database import Base
 from models.user import User
-from models.news import Bookmark, Subscription, ReadArticle
+from models.news import Bookmark, Subscription, ReadArticle, UserProfile
+from models.analytics import ReadStatsDaily, AnalyticsVersion
 
-__all__ = ["Base", "User", "Bookmark", "Subscription", "ReadArticle"]
+__all__ = ["Base", "User", "Bookmark", "Subscription", "ReadArticle", "UserProfile", "ReadStatsDaily", "AnalyticsVersion"]
 
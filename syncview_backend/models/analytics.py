@@ -0,0 +1,45 @@
+from sqlalchemy import Column, Integer, String, Date, ForeignKey, Index
+from sqlalchemy.orm import relationship
+from database import Base
+
+
+class ReadStatsDaily(Base):
+    """
+    사용자별 일일 읽기 통계 롤업 (일자 × 시간대 × 감성 × 카테고리별 기사 수)
+    - record_read_article에서 같은 트랜잭션으로 증가
+    - 감성/카테고리가 없으면 NULL 대신 빈 문자열 (복합 키로 사용하기 위함)
+    """
+    __tablename__ = "read_stats_daily"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    day = Column(Date, primary_key=True)
+    hour = Column(Integer, primary_key=True)
+    sentiment = Column(String, primary_key=True, default="")
+    category = Column(String, primary_key=True, default="")
+    count = Column(Integer, nullable=False, default=0)
+
+    # 관계
+    user = relationship("User", back_populates="read_stats")
+
+
+# 통계 집계 index-only scan용 커버링 인덱스 (migrations/0002)
+Index(
+    "ix_read_stats_daily_user_day",
+    ReadStatsDaily.user_id,
+    ReadStatsDaily.day,
+    postgresql_include=["hour", "sentiment", "category", "count"],
+)
+
+
+class AnalyticsVersion(Base):
+    """
+    사용자별 분석 데이터 버전 (읽기 기록이 추가될 때마다 +1)
+    - 통계/히스토리 응답 캐시 키와 ETag에 사용
+    """
+    __tablename__ = "analytics_versions"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+
+    # 관계
+    user = relationship("User", back_populates="analytics_version")
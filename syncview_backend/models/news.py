@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Float
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Float, JSON, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from database import Base
@@ -7,6 +7,9 @@ from database import Base
 class Bookmark(Base):
     """북마크 모델"""
     __tablename__ = "bookmarks"
+    __table_args__ = (
+        UniqueConstraint("user_id", "url", name="uq_bookmarks_user_url"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -21,6 +24,10 @@ class Bookmark(Base):
     user = relationship("User", back_populates="bookmarks")
 
 
+# 북마크 최신순 조회용 (migrations/0002)
+Index("ix_bookmarks_user_saved_at", Bookmark.user_id, Bookmark.saved_at.desc(), Bookmark.id.desc())
+
+
 class Subscription(Base):
     """구독 설정 모델"""
     __tablename__ = "subscriptions"
@@ -53,3 +60,23 @@ class ReadArticle(Base):
     # 관계
     user = relationship("User", back_populates="read_articles")
 
+
+# 읽기 기록 최신순 조회 / 이미 읽은 기사 확인용 (migrations/0002)
+Index("ix_read_articles_user_read_at", ReadArticle.user_id, ReadArticle.read_at.desc(), ReadArticle.id.desc())
+Index("ix_read_articles_user_url", ReadArticle.user_id, ReadArticle.url)
+
+
+class UserProfile(Base):
+    """사용자 관심사 프로필 (읽은 기사 기반 단어/카테고리 가중치)"""
+    __tablename__ = "user_profiles"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, unique=True)
+    term_weights = Column(JSON, nullable=False, default=dict)  # {"election": 3.0, ...}
+    category_weights = Column(JSON, nullable=False, default=dict)  # {"정치": 2.0, ...}
+    article_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # 관계
+    user = relationship("User", back_populates="profile")
+
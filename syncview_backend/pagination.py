@@ -0,0 +1,62 @@
+"""
+커서(keyset) 기반 페이지네이션 모듈
+- (시각, id) 내림차순으로 정렬된 목록을 "마지막으로 본 행 이후"부터 조회
+- OFFSET을 쓰지 않으므로 몇 페이지를 넘기든 인덱스에서 limit+1행만 읽음
+- 커서는 마지막 행의 (시각, id)를 base64로 감싼 불투명 토큰
+"""
+import base64
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import Select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# 한 페이지 최대 크기
+MAX_PAGE_SIZE = 200
+# 다음 페이지 커서를 전달하는 응답 헤더 (본문은 기존처럼 목록 그대로 유지)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(at: datetime, row_id: int) -> str:
+    """(시각, id)를 커서 토큰으로 변환"""
+    raw = f"{at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    커서 토큰을 (시각, id)로 변환
+
+    Raises:
+        ValueError: 형식이 잘못된 커서
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        at, row_id = base64.urlsafe_b64decode(padded.encode()).decode().split("|")
+        return datetime.fromisoformat(at), int(row_id)
+    except Exception:
+        raise ValueError("잘못된 커서입니다.")
+
+
+async def keyset_page(
+    db: AsyncSession, stmt: Select, at_column, id_column, cursor: Optional[str], limit: int
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    (at_column, id_column) 내림차순으로 한 페이지 조회
+
+    Returns:
+        (이번 페이지 행 목록, 다음 페이지 커서 — 마지막 페이지면 None)
+    """
+    if cursor:
+        at, row_id = decode_cursor(cursor)
+        # 행 값 비교 (at, id) < (:at, :id) → (user_id, at desc, id desc) 인덱스 범위 스캔
+        stmt = stmt.where(tuple_(at_column, id_column) < tuple_(at, row_id))
+
+    stmt = stmt.order_by(at_column.desc(), id_column.desc()).limit(limit + 1)
+    rows = (await db.scalars(stmt)).all()
+    if len(rows) <= limit:
+        return list(rows), None
+
+    rows = rows[:limit]
+    last = rows[-1]
+    return list(rows), encode_cursor(getattr(last, at_column.key), getattr(last, id_column.key))
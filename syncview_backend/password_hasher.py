@@ -0,0 +1,134 @@
+"""
+비밀번호 해시 모듈
+- bcrypt 해시/검증을 전용 프로세스 풀에서 실행해 이벤트 루프와 API 스레드풀을 막지 않음
+- 동시 실행 수는 워커 수로, 대기 요청 수는 PASSWORD_HASH_MAX_PENDING으로 제한
+  (초과하면 HasherBusyError → 라우트에서 503으로 응답)
+- cost(rounds)는 BCRYPT_ROUNDS로 설정, 로그인 시 cost가 다른 해시는 새 cost로 재해시
+"""
+import os
+import time
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Optional
+
+import bcrypt
+
+logger = logging.getLogger(__name__)
+
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(2, os.cpu_count() or 1))))
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "64"))
+
+
+class HasherBusyError(RuntimeError):
+    """대기 중인 해시 요청이 한도를 넘음"""
+
+
+# 프로세스 풀에서 실행되는 함수 (pickle 가능하도록 모듈 최상위에 정의)
+def _hash(password: str, rounds: int) -> str:
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds)).decode()
+
+
+def _verify(password: str, hashed: str) -> bool:
+    try:
+        return bcrypt.checkpw(password.encode(), hashed.encode())
+    except ValueError:
+        # bcrypt 형식이 아닌 해시
+        return False
+
+
+def hash_rounds(hashed: str) -> Optional[int]:
+    """bcrypt 해시 문자열에서 cost 추출 ($2b$12$... → 12)"""
+    try:
+        return int(hashed.split("$")[2])
+    except (IndexError, ValueError):
+        return None
+
+
+class PasswordHasher:
+    """프로세스 풀 기반 bcrypt 해시/검증기"""
+
+    def __init__(self, rounds: int, workers: int, max_pending: int):
+        self.rounds = rounds
+        self.workers = max(workers, 1)
+        self.max_pending = max_pending
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+
+        # 지표
+        self.pending = 0
+        self.running = 0
+        self.completed = 0
+        self.rejected = 0
+        self._total_ms = 0.0
+
+    def start(self) -> None:
+        """프로세스 풀 생성 후 워커를 미리 띄움 (첫 로그인에서 프로세스 시작 비용 제거)"""
+        if self._executor is not None:
+            return
+        # 스레드가 있는 서버 프로세스를 fork하지 않도록 spawn 사용
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        for _ in range(self.workers):
+            self._executor.submit(os.getpid)
+        logger.info(f"✅ 비밀번호 해시 프로세스 풀 시작 (workers={self.workers}, rounds={self.rounds})")
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def _run(self, fn, *args) -> Any:
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise HasherBusyError("비밀번호 처리 요청이 많습니다. 잠시 후 다시 시도해주세요.")
+
+        self.start()
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.workers)
+
+        self.pending += 1
+        try:
+            # 워커 수만큼만 프로세스에 넘기고 나머지는 여기서 대기 (대기열 길이 = pending - running)
+            async with self._slots:
+                self.running += 1
+                started = time.perf_counter()
+                try:
+                    return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+                finally:
+                    self.running -= 1
+                    self.completed += 1
+                    self._total_ms += (time.perf_counter() - started) * 1000
+        finally:
+            self.pending -= 1
+
+    async def hash(self, password: str) -> str:
+        """현재 cost로 비밀번호 해시"""
+        return await self._run(_hash, password, self.rounds)
+
+    async def verify(self, password: str, hashed: str) -> bool:
+        """비밀번호 검증"""
+        return await self._run(_verify, password, hashed)
+
+    def needs_rehash(self, hashed: str) -> bool:
+        """설정된 cost와 다른 해시인지"""
+        return hash_rounds(hashed) != self.rounds
+
+    def stats(self) -> Dict[str, Any]:
+        """동시 실행/대기열 지표"""
+        return {
+            "workers": self.workers,
+            "rounds": self.rounds,
+            "running": self.running,
+            "queue_depth": self.pending - self.running,
+            "max_pending": self.max_pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "avg_ms": round(self._total_ms / self.completed, 2) if self.completed else 0.0,
+        }
+
+
+password_hasher = PasswordHasher(BCRYPT_ROUNDS, PASSWORD_HASH_WORKERS, PASSWORD_HASH_MAX_PENDING)
@@ -0,0 +1,193 @@
+"""
+사용자 관심사 프로필 & 추천 점수 계산 모듈
+- 읽은 기사(ReadArticle) 기반으로 단어/카테고리 가중치 벡터를 만들고
+  읽기 기록이 저장될 때마다 점진적으로 갱신
+- 캐시된 피드 기사들을 프로필 벡터와 내적(dot product)하여 한 번에 점수 계산
+- 카테고리 점수는 topic_classifier가 피드 수집 시 태깅한 값을 사용
+"""
+import re
+import logging
+from typing import Dict, Any, List, Optional, TYPE_CHECKING
+
+from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from models import ReadArticle, UserProfile
+from topic_classifier import TOPIC_KEYWORDS, CATEGORIES, classify
+import feed_cache
+
+# numpy는 추천 점수를 처음 계산할 때 import (서버 시작 시간 단축)
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# 프로필에 유지할 최대 단어 수 (가중치 낮은 단어부터 제거)
+MAX_PROFILE_TERMS = 300
+# 기사 1건을 읽을 때마다 기존 가중치에 곱하는 감쇠율 (최근 관심사 우선)
+PROFILE_DECAY = 0.98
+# 단어 점수 대비 카테고리 점수 비중
+CATEGORY_WEIGHT = 0.5
+
+_CATEGORY_INDEX = {name: i for i, name in enumerate(CATEGORIES)}
+
+_TOKEN_RE = re.compile(r"[a-z][a-z0-9']{2,}")
+_STOPWORDS = frozenset("""
+    the and for are but not you all any can had her was one our out day get has him his how new now
+    see two way who did its let put say she too use that with have this will your from they know
+    want been some time very when come here just like make many over such take than them well were
+    what into after about also says said could would should their there these those which while
+    where being more most other then only news year years first last back amid under again still
+""".split())
+
+
+def tokenize(text: str) -> List[str]:
+    """소문자 영단어 토큰 추출 (불용어 제외)"""
+    return [t for t in _TOKEN_RE.findall(text.lower()) if t not in _STOPWORDS]
+
+
+def article_categories(article: Dict[str, Any]) -> Dict[str, float]:
+    """기사의 카테고리 점수 (피드 수집 시 태깅된 값 우선)"""
+    categories = article.get("categories")
+    # 클라이언트가 보낸 기사 목록이면 형식이 다를 수 있음 (dict가 아니면 다시 분류)
+    if isinstance(categories, dict):
+        return categories
+    return classify(f"{article.get('title', '')} {article.get('summary', '')}")
+
+
+def _apply_article(profile: UserProfile, title: str, url: str, category: Optional[str]) -> None:
+    """읽은 기사 1건을 프로필 가중치에 반영"""
+    # 피드 캐시에 있으면 요약까지 포함해서 단어 추출
+    cached = feed_cache.find_article(url) or {"title": title}
+    text = f"{title} {cached.get('summary', '')}"
+
+    terms = {t: w * PROFILE_DECAY for t, w in (profile.term_weights or {}).items()}
+    for token in set(tokenize(text)):
+        terms[token] = terms.get(token, 0.0) + 1.0
+
+    if len(terms) > MAX_PROFILE_TERMS:
+        kept = sorted(terms.items(), key=lambda x: x[1], reverse=True)[:MAX_PROFILE_TERMS]
+        terms = dict(kept)
+
+    categories = {c: w * PROFILE_DECAY for c, w in (profile.category_weights or {}).items()}
+    if category and category in TOPIC_KEYWORDS:
+        categories[category] = categories.get(category, 0.0) + 1.0
+    else:
+        for name, score in article_categories(cached).items():
+            categories[name] = categories.get(name, 0.0) + score
+
+    # JSON 컬럼은 새 객체를 할당해야 변경이 감지됨
+    profile.term_weights = terms
+    profile.category_weights = categories
+    profile.article_count = (profile.article_count or 0) + 1
+
+
+def build_profile(db: Session, user_id: int) -> UserProfile:
+    """
+    기존 읽기 기록 전체로 프로필 생성 (프로필이 아직 없는 사용자용)
+    - 추천 요청과 읽기 기록 flush가 같은 사용자 프로필을 동시에 만들 수 있으므로
+      INSERT ... ON CONFLICT (user_id) DO NOTHING 후 다시 조회 (먼저 만든 쪽을 사용)
+    """
+    # 세션에 추가하지 않는 임시 객체에 가중치를 계산
+    draft = UserProfile(user_id=user_id, term_weights={}, category_weights={}, article_count=0)
+
+    history = db.query(ReadArticle.title, ReadArticle.url, ReadArticle.category).filter(
+        ReadArticle.user_id == user_id
+    ).all()
+    for title, url, category in history:
+        _apply_article(draft, title, url, category)
+
+    stmt = pg_insert(UserProfile).values(
+        user_id=user_id,
+        term_weights=draft.term_weights,
+        category_weights=draft.category_weights,
+        article_count=draft.article_count,
+    ).on_conflict_do_nothing(index_elements=["user_id"])
+    if db.execute(stmt).rowcount:
+        logger.info(f"사용자 프로필 생성: user_id={user_id}, articles={len(history)}")
+    return db.query(UserProfile).filter(UserProfile.user_id == user_id).one()
+
+
+def get_profile(db: Session, user_id: int) -> UserProfile:
+    """사용자 프로필 조회 (없으면 읽기 기록으로 생성)"""
+    profile = db.query(UserProfile).filter(UserProfile.user_id == user_id).first()
+    if profile is None:
+        profile = build_profile(db, user_id)
+    return profile
+
+
+def update_profile(db: Session, article: ReadArticle) -> UserProfile:
+    """
+    읽기 기록 저장 시 프로필 점진 갱신 (커밋은 호출자가 담당)
+    - 새 기록을 세션에 추가하기 전에 호출해야 함 (build_profile 중복 반영 방지)
+    """
+    profile = get_profile(db, article.user_id)
+    _apply_article(profile, article.title, article.url, article.category)
+    return profile
+
+
+def update_profiles(db: Session, articles: List[ReadArticle]) -> None:
+    """
+    여러 읽기 기록을 사용자별로 묶어 프로필 갱신 (일괄 저장용, 커밋은 호출자가 담당)
+    - 사용자마다 프로필을 한 번만 조회/생성하고 기록 순서대로 반영
+    - update_profile과 마찬가지로 기록을 세션에 추가하기 전에 호출해야 함
+    """
+    by_user: Dict[int, List[ReadArticle]] = {}
+    for article in articles:
+        by_user.setdefault(article.user_id, []).append(article)
+
+    for user_id, records in by_user.items():
+        profile = get_profile(db, user_id)
+        for record in records:
+            _apply_article(profile, record.title, record.url, record.category)
+
+
+def rank_articles(profile: UserProfile, articles: List[Dict[str, Any]]) -> "np.ndarray":
+    """
+    프로필 벡터와 기사 벡터의 내적으로 기사별 관심도 점수 계산
+
+    Returns:
+        articles와 같은 순서의 점수 배열
+    """
+    import numpy as np
+
+    n = len(articles)
+    terms = profile.term_weights or {}
+    vocab = {term: i for i, term in enumerate(terms)}
+
+    term_vector = np.fromiter(terms.values(), dtype=np.float32, count=len(terms))
+    category_vector = np.array(
+        [(profile.category_weights or {}).get(c, 0.0) for c in CATEGORIES], dtype=np.float32
+    )
+
+    article_terms = np.zeros((n, len(vocab)), dtype=np.float32)
+    article_cats = np.zeros((n, len(CATEGORIES)), dtype=np.float32)
+    lengths = np.ones(n, dtype=np.float32)
+
+    rows, cols = [], []
+    for i, article in enumerate(articles):
+        tokens = set(tokenize(f"{article.get('title', '')} {article.get('summary', '')}"))
+        lengths[i] = max(len(tokens), 1)
+        for token in tokens:
+            j = vocab.get(token)
+            if j is not None:
+                rows.append(i)
+                cols.append(j)
+        for name, score in article_categories(article).items():
+            j = _CATEGORY_INDEX.get(name)
+            if j is not None and isinstance(score, (int, float)):
+                article_cats[i, j] = score
+
+    if rows:
+        article_terms[rows, cols] = 1.0
+
+    # 길이/크기 정규화 (긴 기사나 읽은 양이 많은 사용자가 점수를 독점하지 않도록)
+    article_terms /= np.sqrt(lengths)[:, None]
+    term_norm = np.linalg.norm(term_vector)
+    category_norm = np.linalg.norm(category_vector)
+    if term_norm > 0:
+        term_vector /= term_norm
+    if category_norm > 0:
+        category_vector /= category_norm
+
+    return article_terms @ term_vector + CATEGORY_WEIGHT * (article_cats @ category_vector)
@@ -0,0 +1,64 @@
+"""
+응답 캐시 모듈
+- 버전이 포함된 키로 저장하므로 데이터가 바뀌면(버전 증가) 자동으로 새 키를 사용
+- 오래된 항목은 LRU 방식으로 제거
+"""
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+
+class ResponseCache:
+    """스레드 안전한 LRU 응답 캐시"""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def peek(self, key: Hashable) -> Optional[Any]:
+        """적중/미스 집계와 LRU 순서 변경 없이 조회 (내부 갱신용)"""
+        with self._lock:
+            return self._entries.get(key)
+
+    def update(self, key: Hashable, **fields: Any) -> Dict[str, Any]:
+        """dict 값에 필드를 합쳐 저장 (없으면 새로 만듦), 합친 값을 반환"""
+        with self._lock:
+            value = {**self._entries.get(key, {}), **fields}
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return value
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# 분석 대시보드 응답 캐시 (통계, 읽기 기록)
+analytics_cache = ResponseCache(int(os.getenv("ANALYTICS_CACHE_SIZE", "1000")))
+
+# 기사별 사전 처리 결과 (URL → 본문/요약/감성 분석/제목 번역)
+article_cache = ResponseCache(int(os.getenv("ARTICLE_CACHE_SIZE", "2000")))
+
+# 번역 결과 ((대상 언어, 원문) → 번역문)
+translation_cache = ResponseCache(int(os.getenv("TRANSLATION_CACHE_SIZE", "5000")))
@@ -1,13 +1,23 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Request, Response, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import func, extract
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, case, tuple_, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError, DataError
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
+import os
 import logging
 
-from database import get_db
-from models import ReadArticle, User
+from database import get_async_db, SessionLocal
+from models import ReadArticle, User, ReadStatsDaily, AnalyticsVersion
+from response_cache import analytics_cache
+from write_buffer import WriteBehindBuffer
+from pagination import keyset_page, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER
+import recommender
+import feed_cache
+from topic_classifier import CATEGORIES, classify, top_category
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -38,39 +48,264 @@ class ReadArticleResponse(BaseModel):
         from_attributes = True
 
 
-@router.post("/read-article", response_model=ReadArticleResponse)
-def record_read_article(article: ReadArticleCreate, db: Session = Depends(get_db)):
-    """읽은 기사 기록"""
+def _resolve_category(article: ReadArticleCreate) -> Optional[str]:
+    """
+    읽은 기사의 카테고리 결정
+    - 피드 수집 시 태깅된 값 → 클라이언트가 보낸 값 → 제목 분류 순서
+    """
+    cached = feed_cache.find_article(article.url)
+    if cached and cached.get("category"):
+        return cached["category"]
+    if article.category in CATEGORIES:
+        return article.category
+    return top_category(classify(article.title))
+
+
+def _bump_version(db: Session, user_id: int) -> None:
+    """분석 데이터 버전 +1 (캐시 무효화용, 커밋은 호출자가 담당)"""
+    stmt = pg_insert(AnalyticsVersion).values(user_id=user_id, version=1)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["user_id"],
+        set_={"version": AnalyticsVersion.version + 1},
+    )
+    db.execute(stmt)
+
+
+async def _current_version(db: AsyncSession, user_id: int) -> int:
+    """사용자의 분석 데이터 버전 (기록이 없으면 0)"""
+    version = await db.scalar(
+        select(AnalyticsVersion.version).where(AnalyticsVersion.user_id == user_id)
+    )
+    return version or 0
+
+
+def _not_modified(request: Request, etag: str) -> Optional[Response]:
+    """클라이언트가 같은 ETag를 갖고 있으면 304 응답"""
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "private, no-cache"})
+    return None
+
+
+def _rollup_rows(records: List[ReadArticle]) -> List[Dict[str, Any]]:
+    """읽기 기록 목록을 롤업 키(user_id, day, hour, sentiment, category)별 건수로 집계"""
+    counts: Dict[tuple, int] = {}
+    for record in records:
+        key = (
+            record.user_id,
+            record.read_at.date(),
+            record.read_at.hour,
+            record.sentiment or "",
+            record.category or "",
+        )
+        counts[key] = counts.get(key, 0) + 1
+    return [
+        {"user_id": u, "day": d, "hour": h, "sentiment": s, "category": c, "count": n}
+        for (u, d, h, s, c), n in counts.items()
+    ]
+
+
+def _flush_read_events(events: List[Dict[str, Any]]) -> None:
+    """
+    버퍼에 모인 읽기 이벤트를 한 트랜잭션으로 저장
+    - 프로필은 사용자별로 한 번씩 갱신
+    - 기록은 multi-row INSERT, 롤업은 키별로 합산한 뒤 한 번의 UPSERT
+    - 분석 데이터 버전은 사용자마다 한 번만 올림
+    """
+    db = SessionLocal()
     try:
-        new_record = ReadArticle(**article.dict())
-        db.add(new_record)
+        records = [ReadArticle(**event) for event in events]
+        recommender.update_profiles(db, records)
+
+        db.execute(insert(ReadArticle), events)
+
+        stmt = pg_insert(ReadStatsDaily).values(_rollup_rows(records))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id", "day", "hour", "sentiment", "category"],
+            set_={"count": ReadStatsDaily.count + stmt.excluded.count},
+        )
+        db.execute(stmt)
+
+        for user_id in sorted({record.user_id for record in records}):
+            _bump_version(db, user_id)
         db.commit()
-        db.refresh(new_record)
-        
-        logger.info(f"읽은 기사 기록 완료: user_id={article.user_id}, url={article.url}")
-        return new_record
-        
-    except Exception as e:
+    except Exception:
         db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+# 읽기 이벤트 쓰기 지연 버퍼 (N건 또는 T밀리초마다 일괄 저장)
+read_buffer = WriteBehindBuffer(
+    "read-articles",
+    _flush_read_events,
+    max_events=int(os.getenv("READ_BUFFER_MAX_EVENTS", "100")),
+    max_delay_ms=int(os.getenv("READ_BUFFER_MAX_DELAY_MS", "500")),
+    # 버퍼에 있는 동안 사용자가 삭제되는 등 일부 이벤트만 저장할 수 없는 경우
+    isolate_errors=(IntegrityError, DataError),
+)
+
+# 일괄 기록 요청당 최대 이벤트 수
+MAX_READ_BATCH = 500
+
+
+def _read_event(article: ReadArticleCreate) -> Dict[str, Any]:
+    """요청 데이터를 버퍼에 넣을 이벤트로 변환 (카테고리/읽은 시각은 요청 시점에 확정)"""
+    return {
+        **article.dict(),
+        "category": _resolve_category(article),
+        "read_at": datetime.utcnow(),
+    }
+
+
+async def _check_users(db: AsyncSession, user_ids: List[int]) -> None:
+    """
+    기록할 사용자가 모두 있는지 확인 (없으면 404)
+    - 저장은 나중에 버퍼에서 하므로, 잘못된 요청은 버퍼에 넣기 전에 여기서 거절
+    """
+    wanted = set(user_ids)
+    found = set((await db.scalars(select(User.id).where(User.id.in_(wanted)))).all())
+    missing = sorted(wanted - found)
+    if missing:
+        raise HTTPException(
+            status_code=404,
+            detail=f"사용자를 찾을 수 없습니다: {', '.join(map(str, missing))}"
+        )
+
+
+@router.post("/read-article", status_code=202)
+async def record_read_article(article: ReadArticleCreate, db: AsyncSession = Depends(get_async_db)):
+    """
+    읽은 기사 기록
+    - 사용자를 확인한 뒤 버퍼에 넣고 바로 응답, 저장(프로필/일일 통계 롤업 포함)은 백그라운드에서 일괄 처리
+    - 응답: 202 {"status": "queued", "queued": 1, "buffer_depth": 버퍼에 쌓인 이벤트 수}
+      (저장 전에 응답하므로 기록 id/read_at은 돌려주지 않음)
+    - 없는 사용자면 404
+    """
+    try:
+        await _check_users(db, [article.user_id])
+        depth = read_buffer.add([_read_event(article)])
+        logger.info(f"읽은 기사 기록 접수: user_id={article.user_id}, url={article.url}")
+        return {"status": "queued", "queued": 1, "buffer_depth": depth}
+
+    except HTTPException:
+        raise
+    except Exception as e:
         logger.error(f"읽은 기사 기록 실패: {e}")
         raise HTTPException(status_code=500, detail=f"읽은 기사 기록 중 오류가 발생했습니다: {str(e)}")
 
 
+@router.post("/read-articles", status_code=202)
+async def record_read_articles(articles: List[ReadArticleCreate], db: AsyncSession = Depends(get_async_db)):
+    """
+    읽은 기사 여러 건을 한 번에 기록 (오프라인 동기화 등)
+    - 응답: 202 {"status": "queued", "queued": 건수, "buffer_depth": 버퍼에 쌓인 이벤트 수}
+    - 없는 사용자가 하나라도 있으면 아무것도 기록하지 않고 404
+    """
+    if len(articles) > MAX_READ_BATCH:
+        raise HTTPException(status_code=413, detail=f"한 번에 최대 {MAX_READ_BATCH}건까지 기록할 수 있습니다")
+    try:
+        await _check_users(db, [article.user_id for article in articles])
+        depth = read_buffer.add([_read_event(article) for article in articles])
+        logger.info(f"읽은 기사 일괄 기록 접수: {len(articles)}건")
+        return {"status": "queued", "queued": len(articles), "buffer_depth": depth}
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"읽은 기사 일괄 기록 실패: {e}")
+        raise HTTPException(status_code=500, detail=f"읽은 기사 기록 중 오류가 발생했습니다: {str(e)}")
+
+
+@router.get("/buffer")
+async def get_buffer_stats():
+    """읽기 이벤트 버퍼 상태 (대기 중인 이벤트 수, flush 지연 시간)"""
+    return read_buffer.stats()
+
+
+# GROUPING(sentiment, category, day, hour) 비트마스크 → 집계 종류
+# (비트가 1이면 해당 컬럼이 그 grouping set에 포함되지 않음)
+_GROUP_TOTAL = 0b1111
+_GROUP_SENTIMENT = 0b0111
+_GROUP_CATEGORY = 0b1011
+_GROUP_DAILY = 0b1101
+_GROUP_HOURLY_SENTIMENT = 0b0110
+
+
+def _stats_query(user_id: int, since: datetime):
+    """
+    통계용 집계를 일일 롤업 테이블에서 한 번의 SQL(GROUPING SETS)로 조회
+    - 전체 수 / 감성별 / 카테고리별 / 최근 7일 일자별 / 최근 7일 시간대×감성별
+    - 읽은 기사 수가 아니라 사용 일수에 비례하는 행만 읽음
+    - 7일 이전 롤업은 day, hour가 NULL이 되어 하나의 그룹으로 합쳐짐
+    """
+    recent = ReadStatsDaily.day >= since.date()
+    day = case((recent, ReadStatsDaily.day))
+    hour = case((recent, ReadStatsDaily.hour))
+
+    return select(
+        func.grouping(ReadStatsDaily.sentiment, ReadStatsDaily.category, day, hour).label('grouping_id'),
+        ReadStatsDaily.sentiment,
+        ReadStatsDaily.category,
+        day.label('date'),
+        hour.label('hour'),
+        func.sum(ReadStatsDaily.count).label('count')
+    ).where(
+        ReadStatsDaily.user_id == user_id
+    ).group_by(
+        func.grouping_sets(
+            tuple_(),
+            tuple_(ReadStatsDaily.sentiment),
+            tuple_(ReadStatsDaily.category),
+            tuple_(day),
+            tuple_(hour, ReadStatsDaily.sentiment),
+        )
+    )
+
+
 @router.get("/stats/{user_id}")
-def get_user_stats(user_id: int, db: Session = Depends(get_db)):
-    """사용자의 통계 데이터 조회"""
+async def get_user_stats(user_id: int, request: Request, response: Response, db: AsyncSession = Depends(get_async_db)):
+    """
+    사용자의 통계 데이터 조회
+    - 읽기 기록 버전과 최근 7일 구간의 시작 날짜가 같으면 캐시된 응답 사용, ETag가 같으면 304
+      (새 기록이 없어도 날짜가 바뀌면 오래된 날이 구간에서 빠지므로 다시 계산)
+    """
     try:
-        # 총 읽은 기사 수
-        total_articles = db.query(ReadArticle).filter(ReadArticle.user_id == user_id).count()
-        
-        # 감성 분석 통계
-        sentiment_stats = db.query(
-            ReadArticle.sentiment,
-            func.count(ReadArticle.id).label('count')
-        ).filter(
-            ReadArticle.user_id == user_id,
-            ReadArticle.sentiment.isnot(None)
-        ).group_by(ReadArticle.sentiment).all()
+        version = await _current_version(db, user_id)
+        seven_days_ago = datetime.utcnow() - timedelta(days=7)
+        window = seven_days_ago.date().isoformat()
+        etag = f'"stats-{user_id}-v{version}-{window}"'
+        not_modified = _not_modified(request, etag)
+        if not_modified:
+            return not_modified
+
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = "private, no-cache"
+        cache_key = ("stats", user_id, version, window)
+        cached = analytics_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        rows = (await db.execute(_stats_query(user_id, seven_days_ago))).all()
+
+        total_articles = 0
+        sentiment_stats = []
+        category_stats = []
+        daily_stats = []
+        hourly_sentiment = []
+        for grouping_id, sentiment, category, date, hour, count in rows:
+            count = int(count or 0)
+            # 롤업은 감성/카테고리 없음을 빈 문자열로 저장
+            if grouping_id == _GROUP_TOTAL:
+                total_articles = count
+            elif grouping_id == _GROUP_SENTIMENT and sentiment:
+                sentiment_stats.append((sentiment, count))
+            elif grouping_id == _GROUP_CATEGORY and category:
+                category_stats.append((category, count))
+            elif grouping_id == _GROUP_DAILY and date is not None:
+                daily_stats.append((date, count))
+            elif grouping_id == _GROUP_HOURLY_SENTIMENT and hour is not None and sentiment:
+                hourly_sentiment.append((hour, sentiment, count))
         
         sentiment_data = {
             "positive": 0,
@@ -92,29 +327,11 @@ def get_user_stats(user_id: int, db: Session = Depends(get_db)):
         positive_ratio = round((sentiment_data["positive"] / total_sentiment * 100) if total_sentiment > 0 else 0, 1)
         
         # 카테고리별 통계
-        category_stats = db.query(
-            ReadArticle.category,
-            func.count(ReadArticle.id).label('count')
-        ).filter(
-            ReadArticle.user_id == user_id,
-            ReadArticle.category.isnot(None)
-        ).group_by(ReadArticle.category).all()
-        
         category_data = [{"category": cat, "count": count} for cat, count in category_stats]
         
         # 인기 카테고리
         popular_category = category_stats[0][0] if category_stats else "없음"
         
-        # 요일별 읽기 활동 (최근 7일)
-        seven_days_ago = datetime.utcnow() - timedelta(days=7)
-        daily_stats = db.query(
-            func.date(ReadArticle.read_at).label('date'),
-            func.count(ReadArticle.id).label('count')
-        ).filter(
-            ReadArticle.user_id == user_id,
-            ReadArticle.read_at >= seven_days_ago
-        ).group_by(func.date(ReadArticle.read_at)).all()
-        
         # 날짜별 데이터 (프론트엔드 요구사항)
         daily_read_counts = []
         for date, count in daily_stats:
@@ -123,17 +340,6 @@ def get_user_stats(user_id: int, db: Session = Depends(get_db)):
                 "count": count
             })
         
-        # 시간대별 감성 트렌드 (최근 7일)
-        hourly_sentiment = db.query(
-            extract('hour', ReadArticle.read_at).label('hour'),
-            ReadArticle.sentiment,
-            func.count(ReadArticle.id).label('count')
-        ).filter(
-            ReadArticle.user_id == user_id,
-            ReadArticle.read_at >= seven_days_ago,
-            ReadArticle.sentiment.isnot(None)
-        ).group_by('hour', ReadArticle.sentiment).all()
-        
         # 시간대별 데이터 구조화
         hourly_data = {}
         for hour, sentiment, count in hourly_sentiment:
@@ -147,7 +353,7 @@ def get_user_stats(user_id: int, db: Session = Depends(get_db)):
         # 평균 읽기 속도 (임의 계산)
         avg_reading_speed = round(total_articles / 7 if total_articles > 0 else 0, 1)
         
-        return {
+        stats = {
             "total_read_articles": total_articles,
             "positive_ratio": positive_ratio,
             "popular_category": popular_category,
@@ -163,6 +369,8 @@ def get_user_stats(user_id: int, db: Session = Depends(get_db)):
                 sentiment_data
             )
         }
+        analytics_cache.set(cache_key, stats)
+        return stats
         
     except Exception as e:
         logger.error(f"통계 데이터 조회 실패: {e}")
@@ -208,16 +416,43 @@ def _generate_insights(total_articles: int, positive_ratio: float, popular_categ
 
 
 @router.get("/history/{user_id}", response_model=List[ReadArticleResponse])
-def get_read_history(user_id: int, limit: int = 50, db: Session = Depends(get_db)):
-    """읽은 기사 기록 조회"""
+async def get_read_history(
+    user_id: int,
+    request: Request,
+    response: Response,
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    읽은 기사 기록 최신순 조회 (커서 페이지네이션, 통계와 같은 버전 기반 캐시/ETag)
+    - 다음 페이지가 있으면 X-Next-Cursor 헤더로 커서 전달
+    """
     try:
-        history = db.query(ReadArticle).filter(
-            ReadArticle.user_id == user_id
-        ).order_by(ReadArticle.read_at.desc()).limit(limit).all()
-        
+        version = await _current_version(db, user_id)
+        etag = f'"history-{user_id}-{limit}-{cursor or "first"}-v{version}"'
+        not_modified = _not_modified(request, etag)
+        if not_modified:
+            return not_modified
+
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = "private, no-cache"
+        cache_key = ("history", user_id, limit, cursor, version)
+        cached = analytics_cache.get(cache_key)
+        if cached is None:
+            stmt = select(ReadArticle).where(ReadArticle.user_id == user_id)
+            history, next_cursor = await keyset_page(db, stmt, ReadArticle.read_at, ReadArticle.id, cursor, limit)
+            history = [ReadArticleResponse.model_validate(h).model_dump() for h in history]
+            cached = (history, next_cursor)
+            analytics_cache.set(cache_key, cached)
+
+        history, next_cursor = cached
+        if next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = next_cursor
         return history
         
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"읽은 기사 기록 조회 실패: {e}")
         raise HTTPException(status_code=500, detail=f"읽은 기사 기록 조회 중 오류가 발생했습니다: {str(e)}")
-
@@ -1,9 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import RedirectResponse
-from sqlalchemy.orm import Session
+from sqlalchemy import select, or_
+from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel, EmailStr
-from passlib.hash import bcrypt
-from database import SessionLocal
+from database import get_async_db
+from password_hasher import password_hasher, HasherBusyError
 from models import User
 from authlib.integrations.starlette_client import OAuth
 from starlette.config import Config
@@ -53,23 +54,36 @@ class DeleteUserRequest(BaseModel):
   user_id: int
 
 
-def get_db():
-  db = SessionLocal()
+async def _hash_password(password: str) -> str:
   try:
-    yield db
-  finally:
-    db.close()
+    return await password_hasher.hash(password)
+  except HasherBusyError as e:
+    raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+
+
+async def _verify_password(password: str, hashed: str) -> bool:
+  try:
+    return await password_hasher.verify(password, hashed)
+  except HasherBusyError as e:
+    raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
 
 
 # 회원가입
 @router.post("/register")
-def register(req: RegisterRequest, db: Session = Depends(get_db)):
-  if db.query(User).filter(User.username == req.username).first():
+async def register(req: RegisterRequest, db: AsyncSession = Depends(get_async_db)):
+  # 아이디/이메일 중복을 한 번의 조회로 확인
+  existing = (await db.execute(
+      select(User.username, User.email).where(
+          or_(User.username == req.username, User.email == req.email)
+      )
+  )).all()
+  if any(username == req.username for username, _ in existing):
     raise HTTPException(status_code=400, detail="이미 존재하는 아이디입니다.")
-  if db.query(User).filter(User.email == req.email).first():
+  if existing:
     raise HTTPException(status_code=400, detail="이미 존재하는 이메일입니다.")
 
-  hashed_pw = bcrypt.hash(req.password)
+  # bcrypt는 CPU 작업이므로 전용 프로세스 풀에서 실행
+  hashed_pw = await _hash_password(req.password)
   new_user = User(
       username=req.username,
       password=hashed_pw,
@@ -77,17 +91,24 @@ def register(req: RegisterRequest, db: Session = Depends(get_db)):
       interest=req.interest,
   )
   db.add(new_user)
-  db.commit()
-  db.refresh(new_user)
+  await db.commit()
   return {"msg": "회원가입 성공", "user_id": new_user.id}
 
 
 # 로그인 (이메일 + 비밀번호)
 @router.post("/login")
-def login(req: LoginRequest, db: Session = Depends(get_db)):
-  user = db.query(User).filter(User.email == req.email).first()
-  if not user or not bcrypt.verify(req.password, user.password):
+async def login(req: LoginRequest, db: AsyncSession = Depends(get_async_db)):
+  user = (await db.scalars(select(User).where(User.email == req.email))).first()
+  if not user or not await _verify_password(req.password, user.password):
     raise HTTPException(status_code=400, detail="이메일 또는 비밀번호가 올바르지 않습니다.")
+
+  # cost 설정이 바뀌었으면 로그인 성공 시점에 새 cost로 재해시
+  if password_hasher.needs_rehash(user.password):
+    try:
+      user.password = await password_hasher.hash(req.password)
+      await db.commit()
+    except HasherBusyError:
+      pass  # 다음 로그인 때 다시 시도
   return {
       "msg": "로그인 성공",
       "user_id": user.id,
@@ -98,19 +119,18 @@ def login(req: LoginRequest, db: Session = Depends(get_db)):
 
 # 🔥 회원 탈퇴
 @router.delete("/delete-account")
-def delete_account(req: DeleteUserRequest, db: Session = Depends(get_db)):
+async def delete_account(req: DeleteUserRequest, db: AsyncSession = Depends(get_async_db)):
   """
   간단한 회원 탈퇴 API (데모용)
   - 요청 바디: { "user_id": 1 }
   """
-  user = db.query(User).filter(User.id == req.user_id).first()
+  user = await db.get(User, req.user_id)
   if not user:
     raise HTTPException(status_code=404, detail="존재하지 않는 사용자입니다.")
 
-  # TODO: 북마크, 뉴스 기록 등 User에 FK 걸린 테이블이 있으면
-  # ON DELETE CASCADE 또는 여기서 같이 삭제해줘야 함.
-  db.delete(user)
-  db.commit()
+  # 북마크, 읽기 기록 등은 User 관계의 cascade로 같이 삭제됨
+  await db.delete(user)
+  await db.commit()
 
   return {"msg": "회원 탈퇴가 완료되었습니다."}
 
@@ -124,7 +144,7 @@ async def google_login(request: Request):
 
 # Google OAuth 콜백
 @router.get("/google/callback")
-async def google_callback(request: Request, db: Session = Depends(get_db)):
+async def google_callback(request: Request, db: AsyncSession = Depends(get_async_db)):
   """Google OAuth 콜백 처리"""
   try:
     # Google에서 토큰 받기
@@ -141,19 +161,18 @@ async def google_callback(request: Request, db: Session = Depends(get_db)):
     google_id = user_info.get("sub")
 
     # 기존 사용자 확인
-    user = db.query(User).filter(User.email == email).first()
+    user = (await db.scalars(select(User).where(User.email == email))).first()
 
     if not user:
       # 새로운 사용자 생성 (Google 로그인은 비밀번호 없음)
       user = User(
           username=name or email.split("@")[0],
           email=email,
-          password=bcrypt.hash(google_id),  # Google ID를 해시화하여 저장
+          password=await _hash_password(google_id),  # Google ID를 해시화하여 저장
           interest=None,  # 선택사항
       )
       db.add(user)
-      db.commit()
-      db.refresh(user)
+      await db.commit()
 
     # 세션에 사용자 정보 저장 (민감 정보 노출 방지)
     request.session["user_id"] = user.id
@@ -1,12 +1,15 @@
-from fastapi import APIRouter, HTTPException, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from pydantic import BaseModel
 from typing import List, Optional
 from datetime import datetime
 import logging
 
-from database import get_db
+from database import get_async_db
 from models import Bookmark, User
+from pagination import keyset_page, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -36,22 +39,23 @@ class BookmarkResponse(BaseModel):
 
 
 @router.post("/", response_model=BookmarkResponse)
-def create_bookmark(bookmark: BookmarkCreate, db: Session = Depends(get_db)):
-    """북마크 생성"""
+async def create_bookmark(bookmark: BookmarkCreate, db: AsyncSession = Depends(get_async_db)):
+    """
+    북마크 생성
+    - INSERT ... ON CONFLICT DO NOTHING RETURNING 한 번으로 중복 확인과 저장을 처리
+      (uq_bookmarks_user_url 제약 조건이 동시 요청도 막아줌)
+    """
     try:
-        # 중복 확인
-        existing = db.query(Bookmark).filter(
-            Bookmark.user_id == bookmark.user_id,
-            Bookmark.url == bookmark.url
-        ).first()
+        stmt = pg_insert(Bookmark).values(**bookmark.dict()).on_conflict_do_nothing(
+            constraint="uq_bookmarks_user_url"
+        ).returning(Bookmark)
+        new_bookmark = (await db.scalars(stmt)).first()
         
-        if existing:
+        if new_bookmark is None:
+            await db.rollback()
             raise HTTPException(status_code=400, detail="이미 북마크된 뉴스입니다.")
         
-        new_bookmark = Bookmark(**bookmark.dict())
-        db.add(new_bookmark)
-        db.commit()
-        db.refresh(new_bookmark)
+        await db.commit()
         
         logger.info(f"북마크 생성 완료: user_id={bookmark.user_id}, url={bookmark.url}")
         return new_bookmark
@@ -59,37 +63,51 @@ def create_bookmark(bookmark: BookmarkCreate, db: Session = Depends(get_db)):
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error(f"북마크 생성 실패: {e}")
         raise HTTPException(status_code=500, detail=f"북마크 생성 중 오류가 발생했습니다: {str(e)}")
 
 
 @router.get("/{user_id}", response_model=List[BookmarkResponse])
-def get_bookmarks(user_id: int, db: Session = Depends(get_db)):
-    """사용자의 모든 북마크 조회"""
+async def get_bookmarks(
+    user_id: int,
+    response: Response,
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    사용자의 북마크 최신순 조회 (커서 페이지네이션)
+    - 다음 페이지가 있으면 X-Next-Cursor 헤더로 커서 전달
+    """
     try:
-        bookmarks = db.query(Bookmark).filter(Bookmark.user_id == user_id).order_by(Bookmark.saved_at.desc()).all()
+        stmt = select(Bookmark).where(Bookmark.user_id == user_id)
+        bookmarks, next_cursor = await keyset_page(db, stmt, Bookmark.saved_at, Bookmark.id, cursor, limit)
+        if next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = next_cursor
         return bookmarks
         
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"북마크 조회 실패: {e}")
         raise HTTPException(status_code=500, detail=f"북마크 조회 중 오류가 발생했습니다: {str(e)}")
 
 
 @router.delete("/{bookmark_id}")
-def delete_bookmark(bookmark_id: int, user_id: int, db: Session = Depends(get_db)):
+async def delete_bookmark(bookmark_id: int, user_id: int, db: AsyncSession = Depends(get_async_db)):
     """북마크 삭제"""
     try:
-        bookmark = db.query(Bookmark).filter(
+        bookmark = (await db.scalars(select(Bookmark).where(
             Bookmark.id == bookmark_id,
             Bookmark.user_id == user_id
-        ).first()
+        ))).first()
         
         if not bookmark:
             raise HTTPException(status_code=404, detail="북마크를 찾을 수 없습니다.")
         
-        db.delete(bookmark)
-        db.commit()
+        await db.delete(bookmark)
+        await db.commit()
         
         logger.info(f"북마크 삭제 완료: bookmark_id={bookmark_id}")
         return {"message": "북마크가 삭제되었습니다."}
@@ -97,7 +115,7 @@ def delete_bookmark(bookmark_id: int, user_id: int, db: Session = Depends(get_db
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error(f"북마크 삭제 실패: {e}")
         raise HTTPException(status_code=500, detail=f"북마크 삭제 중 오류가 발생했습니다: {str(e)}")
 
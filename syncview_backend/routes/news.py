@@ -1,32 +1,57 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Response
 from pydantic import BaseModel
-import feedparser
 import requests
-from bs4 import BeautifulSoup
 import logging
-from typing import List, Dict, Any, Optional
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-import numpy as np
+from typing import List, Dict, Any, Optional, Tuple, TYPE_CHECKING
 import os
 import random
-from datetime import datetime
-from dateutil import parser as date_parser
+import time
+import calendar
+import hashlib
+from datetime import timezone
+from email.utils import parsedate_to_datetime
 from sqlalchemy.orm import Session
 from database import get_db
-from models import ReadArticle
+from models import ReadArticle, Subscription
 from urllib.parse import urlparse
 from utils import call_ai_service
+from response_cache import ResponseCache
+import feed_cache
+import enrichment
+import recommender
+import topic_classifier
+
+# bs4, feedparser, scikit-learn은 무거우므로 처음 사용할 때 import (서버 시작 시간 단축)
+# 시작 후에는 warmup 모듈이 백그라운드에서 미리 로딩
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
 
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# 매체별 RSS 주소 (부하 테스트 등에서 로컬 스텁 서버로 바꿀 수 있도록 환경 변수 우선)
+BBC_RSS_URL = os.getenv("BBC_RSS_URL", "http://feeds.bbci.co.uk/news/world/rss.xml")
+REUTERS_RSS_URL = os.getenv("REUTERS_RSS_URL", "https://www.reutersagency.com/feed/?taxonomy=best-topics&post_type=best")
+CNN_RSS_URL = os.getenv("CNN_RSS_URL", "http://rss.cnn.com/rss/edition.rss")
+
+
+def _soup(markup: str) -> "BeautifulSoup":
+    """HTML 파싱 (bs4는 처음 사용할 때 import)"""
+    from bs4 import BeautifulSoup
+    return BeautifulSoup(markup, "html.parser")
+
+
+def _parse_feed(rss_url: str):
+    """RSS 파싱 (feedparser는 처음 사용할 때 import)"""
+    import feedparser
+    return feedparser.parse(rss_url)
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # (기존) 기사 본문 추출 유틸 - 지금은 직접 호출하진 않지만 남겨둠
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-def extract_reuters_article(soup: BeautifulSoup) -> str:
+def extract_reuters_article(soup: "BeautifulSoup") -> str:
     """
     Reuters 전용 본문 추출 로직
     - <article> 또는 data-testid="BodyWrapper" 같은 컨테이너 안의 <p>를 모음
@@ -57,7 +82,7 @@ def extract_reuters_article(soup: BeautifulSoup) -> str:
     return "\n\n".join(paragraphs).strip()
 
 
-def extract_generic_article(soup: BeautifulSoup) -> str:
+def extract_generic_article(soup: "BeautifulSoup") -> str:
     """
     기본 본문 추출 로직 (BBC, CNN 등)
     - <article> 있으면 그 안의 <p>, 없으면 전체에서 <p>
@@ -78,7 +103,7 @@ def extract_article_content(url: str) -> str:
     res = requests.get(url, headers={"User-Agent": "Mozilla/5.0"}, timeout=10)
     res.raise_for_status()
 
-    soup = BeautifulSoup(res.text, "html.parser")
+    soup = _soup(res.text)
     domain = urlparse(url).netloc.lower()
 
     if "reuters.com" in domain:
@@ -133,16 +158,48 @@ def _get_sentiment_analyzer():
             raise HTTPException(status_code=503, detail="감성 분석 모델을 로딩할 수 없습니다.")
     return sentiment_analyzer
 
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 발행 시각 정규화 (피드 수집 시 1회만 파싱)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def _parse_published(published: str) -> Optional[int]:
+    """RFC-822 발행 시각 문자열 → UTC epoch(초), 파싱 실패 시 None"""
+    if not published:
+        return None
+    try:
+        published_date = parsedate_to_datetime(published)
+    except (TypeError, ValueError):
+        return None
+    if published_date.tzinfo is None:
+        published_date = published_date.replace(tzinfo=timezone.utc)
+    return int(published_date.timestamp())
+
+
+def _published_ts(entry) -> Optional[int]:
+    """
+    RSS 항목의 발행 시각을 UTC epoch(초)로 변환
+    - feedparser가 이미 파싱한 published_parsed(UTC struct_time)를 우선 사용
+    """
+    parsed = entry.get("published_parsed") or entry.get("updated_parsed")
+    if parsed:
+        return calendar.timegm(parsed)
+    return _parse_published(entry.get("published", ""))
+
+
 # -------------------------------
 # 1. BBC RSS 뉴스 목록 가져오기
 # -------------------------------
 @router.get("/bbc")
 def get_bbc_news():
+    return feed_cache.get_feed("bbc", _fetch_bbc_news)
+
+
+def _fetch_bbc_news():
     try:
-        rss_url = "http://feeds.bbci.co.uk/news/world/rss.xml"
+        rss_url = BBC_RSS_URL
         logger.info(f"BBC RSS 피드 요청: {rss_url}")
         
-        feed = feedparser.parse(rss_url)
+        feed = _parse_feed(rss_url)
         
         if not feed.entries:
             logger.warning("BBC RSS 피드에서 뉴스를 찾을 수 없습니다.")
@@ -155,8 +212,10 @@ def get_bbc_news():
                     "title": entry.get("title", "제목 없음"),
                     "link": entry.get("link", ""),
                     "summary": entry.get("summary", entry.get("description", "요약 없음")),
-                    "published": entry.get("published", "")
+                    "published": entry.get("published", ""),
+                    "published_ts": _published_ts(entry)
                 }
+                article.update(topic_classifier.tag(f"{article['title']} {article['summary']}"))
                 articles.append(article)
             except Exception as e:
                 logger.warning(f"뉴스 항목 처리 중 오류: {e}")
@@ -177,12 +236,16 @@ def get_bbc_news():
 # -------------------------------
 @router.get("/reuters")
 def get_reuters_news():
+    return feed_cache.get_feed("reuters", _fetch_reuters_news)
+
+
+def _fetch_reuters_news():
     try:
         # Reuters 공식 RSS 피드 사용
-        rss_url = "https://www.reutersagency.com/feed/?taxonomy=best-topics&post_type=best"
+        rss_url = REUTERS_RSS_URL
         logger.info(f"Reuters RSS 피드 요청: {rss_url}")
         
-        feed = feedparser.parse(rss_url)
+        feed = _parse_feed(rss_url)
         logger.info(f"파싱된 entries 개수: {len(feed.entries)}")
         
         if not feed.entries:
@@ -197,15 +260,17 @@ def get_reuters_news():
                 # summary에서 HTML 태그 제거
                 summary = entry.get("summary", entry.get("description", ""))
                 if summary:
-                    soup = BeautifulSoup(summary, "html.parser")
+                    soup = _soup(summary)
                     summary = soup.get_text().strip()
 
                 article = {
                     "title": title,
                     "link": entry.get("link", ""),
                     "summary": summary if summary else "",
-                    "published": entry.get("published", "")
+                    "published": entry.get("published", ""),
+                    "published_ts": _published_ts(entry)
                 }
+                article.update(topic_classifier.tag(f"{title} {summary}"))
                 articles.append(article)
             except Exception as e:
                 logger.warning(f"뉴스 항목 처리 중 오류: {e}")
@@ -226,12 +291,16 @@ def get_reuters_news():
 # -------------------------------
 @router.get("/cnn")
 def get_cnn_news():
+    return feed_cache.get_feed("cnn", _fetch_cnn_news)
+
+
+def _fetch_cnn_news():
     try:
         # CNN 공식 RSS 피드 사용 (Top Stories)
-        rss_url = "http://rss.cnn.com/rss/edition.rss"
+        rss_url = CNN_RSS_URL
         logger.info(f"CNN RSS 피드 요청: {rss_url}")
         
-        feed = feedparser.parse(rss_url)
+        feed = _parse_feed(rss_url)
         logger.info(f"파싱된 entries 개수: {len(feed.entries)}")
         
         if not feed.entries:
@@ -248,7 +317,7 @@ def get_cnn_news():
                 # Google News는 summary에 HTML이 포함될 수 있음
                 description = entry.get("description", entry.get("summary", ""))
                 if description:
-                    soup = BeautifulSoup(description, "html.parser")
+                    soup = _soup(description)
                     clean_desc = soup.get_text(strip=True)
                 else:
                     clean_desc = ""
@@ -257,8 +326,11 @@ def get_cnn_news():
                     "title": title,
                     "link": entry.get("link", ""),
                     "summary": "",  # Google News CNN은 요약 표시 안 함 (Reuters와 동일)
-                    "published": entry.get("published", "")
+                    "published": entry.get("published", ""),
+                    "published_ts": _published_ts(entry)
                 }
+                # 요약은 표시하지 않지만 주제 분류에는 설명문까지 사용
+                article.update(topic_classifier.tag(f"{title} {clean_desc}"))
                 articles.append(article)
             except Exception as e:
                 logger.warning(f"뉴스 항목 처리 중 오류: {e}")
@@ -277,26 +349,155 @@ def get_cnn_news():
 # -------------------------------
 # 통합 뉴스 엔드포인트 (매체 선택)
 # -------------------------------
+def _source_key(source: str) -> Optional[str]:
+    """매체 이름 → 피드 캐시 키 (지원하지 않는 매체면 None)"""
+    source_lower = source.lower()
+    if source_lower == "bbc":
+        return "bbc"
+    if source_lower in ["reuters", "reuters (로이터)", "로이터"]:
+        return "reuters"
+    if source_lower == "cnn":
+        return "cnn"
+    return None
+
+
+_FEED_ENDPOINTS = {
+    "bbc": get_bbc_news,
+    "reuters": get_reuters_news,
+    "cnn": get_cnn_news,
+}
+
+
+# 통합 뉴스 엔드포인트에서 기사와 함께 받을 수 있는 부가 정보
+ENRICH_FIELDS = ("sentiment", "summary", "duplicates")
+# 다른 매체의 같은 기사로 볼 최소 유사도 (유사 기사 API와 같은 기준)
+DUPLICATE_THRESHOLD = 0.3
+
+# 매체별 중복 기사 계산 결과 ((매체, 피드 캐시 버전) → {url: [...]})
+_duplicates_cache = ResponseCache(32)
+
+
+def _find_duplicates(key: str) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    매체 피드의 기사마다 다른 매체에 실린 비슷한 기사 (최대 5개)
+    - 캐시된 피드 전체로 TF-IDF를 한 번만 계산하고, 피드 캐시가 갱신될 때까지 결과 재사용
+    """
+    cache_key = (key, feed_cache.version())
+    cached = _duplicates_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    targets = feed_cache.cached_articles(key)
+    others = [a for a in feed_cache.cached_articles() if a.get("source") != key]
+    result: Dict[str, List[Dict[str, Any]]] = {feed_cache.article_url(a): [] for a in targets}
+
+    if targets and others:
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        from sklearn.metrics.pairwise import cosine_similarity
+
+        texts = [f"{a.get('title', '')} {a.get('summary', '')}" for a in targets + others]
+        tfidf_matrix = TfidfVectorizer(stop_words='english', max_features=1000).fit_transform(texts)
+        similarities = cosine_similarity(tfidf_matrix[:len(targets)], tfidf_matrix[len(targets):])
+
+        for i, article in enumerate(targets):
+            result[feed_cache.article_url(article)] = [
+                {
+                    "title": others[j].get("title", ""),
+                    "url": feed_cache.article_url(others[j]),
+                    "source": others[j].get("source", ""),
+                    "similarity": round(float(similarities[i][j]), 2),
+                }
+                for j in similarities[i].argsort()[::-1][:5]
+                if similarities[i][j] >= DUPLICATE_THRESHOLD
+            ]
+
+    _duplicates_cache.set(cache_key, result)
+    return result
+
+
+def _enriched_feed(key: str, payload: Dict[str, Any], fields: List[str], version: Optional[str]) -> Dict[str, Any]:
+    """
+    피드 기사에 캐시된 부가 정보를 붙여서 반환 (기다리지 않음)
+    - 아직 처리되지 않은 항목은 pending에 표시하고 사전 처리 큐에 넣음
+    - 처리에 실패한 기사는 ENRICH_RETRY_SECONDS 동안 pending 없이 빈 채로 반환 (다시 시도할 때까지 기다리지 않도록)
+    - version: 응답 내용이 바뀔 때만 달라지는 토큰 (같은 토큰으로 다시 요청하면 본문 없이 changed=false)
+    """
+    articles = payload.get("articles") or []
+    entries = [enrichment.cached(feed_cache.article_url(a)) or {} for a in articles]
+
+    # 토큰: 피드를 가져온 시각 + 기사별로 채워진 항목 (+ 중복 기사는 다른 매체 피드 버전)
+    state = [f"{key}|{feed_cache.fetched_at(key)}|{','.join(fields)}"]
+    if "duplicates" in fields:
+        state.append(str(feed_cache.version()))
+    failed = [enrichment.recently_failed(feed_cache.article_url(a)) for a in articles]
+    for article, entry, article_failed in zip(articles, entries, failed):
+        ready = [field for field in fields if field in entry]
+        state.append(f"{feed_cache.article_url(article)}|{','.join(ready)}|{int(article_failed)}")
+    token = hashlib.sha1("\n".join(state).encode()).hexdigest()[:16]
+
+    if version == token:
+        return {"version": token, "changed": False}
+
+    duplicates = _find_duplicates(key) if "duplicates" in fields else {}
+    enriched, waiting = [], []
+    for article, entry, article_failed in zip(articles, entries, failed):
+        url = feed_cache.article_url(article)
+        extra: Dict[str, Any] = {}
+        pending = []
+        for field in ("sentiment", "summary"):
+            if field not in fields:
+                continue
+            if field in entry:
+                extra[field] = entry[field]
+            elif not article_failed:
+                # 처리에 실패한 기사는 다시 시도할 때까지 기다리지 않도록 pending에서 제외
+                pending.append(field)
+        if "duplicates" in fields:
+            extra["duplicates"] = duplicates.get(url, [])
+        if pending:
+            waiting.append(article)
+        enriched.append({**article, "enrichment": extra, "pending": pending})
+
+    enrichment.worker.enqueue(waiting, enrichment.PRIORITY_FEED)
+    return {**payload, "articles": enriched, "version": token, "changed": True, "pending": len(waiting)}
+
+
 @router.get("/news")
-def get_news(source: str = "BBC"):
+def get_news(response: Response, source: str = "BBC", enrich: Optional[str] = None, version: Optional[str] = None):
     """
     매체별 뉴스 가져오기
     source: BBC, Reuters (로이터), CNN
+    enrich: 기사별로 함께 받을 부가 정보 (sentiment, summary, duplicates 중 쉼표로 구분)
+        - 캐시된 것만 붙이고 나머지는 기사별 pending에 표시 (사전 처리가 끝나면 채워짐)
+    version: 이전 응답의 version (바뀐 게 없으면 기사 목록 없이 {"changed": false})
+    ETag는 피드 캐시 버전(enrich면 version 토큰)으로 만들어 본문을 해시하지 않고 304 판단
     """
     try:
-        source_lower = source.lower()
-        
-        if source_lower == "bbc":
-            return get_bbc_news()
-        elif source_lower in ["reuters", "reuters (로이터)", "로이터"]:
-            return get_reuters_news()
-        elif source_lower == "cnn":
-            return get_cnn_news()
-        else:
+        key = _source_key(source)
+        if key is None:
             raise HTTPException(
                 status_code=400,
                 detail=f"지원하지 않는 매체입니다: {source}. BBC, Reuters (로이터), CNN 중 하나를 선택하세요."
             )
+        payload = _FEED_ENDPOINTS[key]()
+        if not enrich:
+            payload_version = feed_cache.payload_version(key, payload)
+            if payload_version:
+                response.headers["ETag"] = f'"{payload_version}"'
+            return payload
+
+        fields = sorted({field.strip().lower() for field in enrich.split(",") if field.strip()})
+        unknown = [field for field in fields if field not in ENRICH_FIELDS]
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"지원하지 않는 부가 정보입니다: {', '.join(unknown)}. {', '.join(ENRICH_FIELDS)} 중에서 선택하세요."
+            )
+        result = _enriched_feed(key, payload, fields, version)
+        # 사전 처리가 끝나면 내용이 바뀌므로 CDN/브라우저가 매번 ETag로 재검증
+        response.headers["Cache-Control"] = "public, no-cache"
+        response.headers["ETag"] = f'"{result["version"]}"'
+        return result
             
     except HTTPException:
         raise
@@ -318,7 +519,7 @@ def _extract_article_text(final_url: str, html: str) -> str:
     - 기타: article 태그 → 전체 p 순으로 시도
     """
     domain = urlparse(final_url).netloc.lower()
-    soup = BeautifulSoup(html, "html.parser")
+    soup = _soup(html)
 
     paragraphs = []
 
@@ -368,34 +569,17 @@ def _extract_article_text(final_url: str, html: str) -> str:
 
     return content
 
-# -------------------------------
-# 2. 특정 기사 본문 가져오기
-# -------------------------------
-@router.get("/detail")
-def get_news_detail(url: str):
-    try:
-        # Google News URL인 경우 실제 기사 URL 추출
-        if "news.google.com" in url:
-            # Google News 리다이렉트 페이지 가져오기
-            res = requests.get(
-                url,
-                headers={"User-Agent": "Mozilla/5.0"},
-                timeout=10,
-                allow_redirects=True,
-            )
-
-            # HTML에서 실제 기사 링크 찾기
-            soup = BeautifulSoup(res.text, "html.parser")
-
-            # 방법 1: <a> 태그에서 실제 링크 찾기
-            link_tag = soup.find("a", href=True)
-            if link_tag and link_tag.get("href"):
-                actual_url = link_tag["href"]
-                # Google News 리다이렉트가 아닌 실제 뉴스 사이트 URL인지 확인
-                if not "google.com" in actual_url:
-                    url = actual_url
-                    logger.info(f"Google News에서 실제 URL 추출: {url}")
+def _fetch_article(url: str) -> Tuple[str, str]:
+    """
+    기사 페이지를 가져와 본문 추출 (상세/요약/사전 처리 공용)
+    - Google News URL이면 실제 기사 URL을 찾아서 요청
 
+    Returns:
+        (최종 URL, 본문)
+    """
+    # Google News URL인 경우 실제 기사 URL 추출
+    if "news.google.com" in url:
+        # Google News 리다이렉트 페이지 가져오기
         res = requests.get(
             url,
             headers={"User-Agent": "Mozilla/5.0"},
@@ -403,13 +587,49 @@ def get_news_detail(url: str):
             allow_redirects=True,
         )
 
-        final_url = res.url
-        html = res.text
+        # HTML에서 실제 기사 링크 찾기
+        soup = _soup(res.text)
+
+        # 방법 1: <a> 태그에서 실제 링크 찾기
+        link_tag = soup.find("a", href=True)
+        if link_tag and link_tag.get("href"):
+            actual_url = link_tag["href"]
+            # Google News 리다이렉트가 아닌 실제 뉴스 사이트 URL인지 확인
+            if not "google.com" in actual_url:
+                url = actual_url
+                logger.info(f"Google News에서 실제 URL 추출: {url}")
+
+    res = requests.get(
+        url,
+        headers={"User-Agent": "Mozilla/5.0"},
+        timeout=10,
+        allow_redirects=True,
+    )
+    return res.url, _extract_article_text(res.url, res.text)
+
+# -------------------------------
+# 2. 특정 기사 본문 가져오기
+# -------------------------------
+@router.get("/detail")
+def get_news_detail(url: str, response: Response):
+    try:
+        cached = enrichment.cached(url)
+        if cached and "content" in cached:
+            final_url, content = cached["final_url"], cached["content"]
+        elif enrichment.recently_failed(url):
+            # 방금 본문 추출에 실패한 기사는 잠시 다시 가져오지 않음
+            final_url, content = url, ""
+        else:
+            final_url, content = _fetch_article(url)
+            enrichment.store_content(url, final_url, content)
 
-        content = _extract_article_text(final_url, html)
+        # 팝업을 여는 동안 요약/감성 분석을 먼저 준비 (새 피드 기사보다 우선)
+        enrichment.worker.enqueue([{"link": url}], enrichment.PRIORITY_VIEWING)
 
         if not content or len(content.strip()) == 0:
             logger.warning("뉴스 본문이 비어 있습니다.")
+            # 일시적인 실패일 수 있으므로 안내 문구는 브라우저/CDN에 캐시하지 않음
+            response.headers["Cache-Control"] = "no-store"
             return {
                 "url": final_url,
                 "content": "본문을 가져올 수 없습니다. 내용이 너무 짧거나 접근할 수 없습니다.",
@@ -426,99 +646,127 @@ def get_news_detail(url: str):
 # -------------------------------
 # 3. 기사 요약하기 (Cloud Run AI 서비스)
 # -------------------------------
-@router.get("/summary")
-def summarize_news(url: str):
-    try:
-        logger.info(f"뉴스 요약 요청: {url}")
-
-        # Google News URL인 경우 실제 기사 URL 추출
-        if "news.google.com" in url:
-            # Google News 리다이렉트 페이지 가져오기
-            res = requests.get(
-                url,
-                headers={"User-Agent": "Mozilla/5.0"},
-                timeout=10,
-                allow_redirects=True,
-            )
+# 이보다 짧은 본문(한두 문장)은 요약하지 않고 그대로 사용
+SUMMARY_MIN_CHARS = 200
+# 요약 요청 시 같은 기사를 사전 처리 중이면 기다리는 최대 시간 (초)
+SUMMARY_WAIT_SECONDS = float(os.getenv("SUMMARY_WAIT_SECONDS", "10"))
+# 요약 대신 돌려주는 안내 문구 (HTTP 캐시에 남기지 않음)
+SUMMARY_EMPTY_MESSAGE = "본문을 요약할 수 없습니다. 내용이 너무 짧거나 접근할 수 없습니다."
+SUMMARY_FAILED_MESSAGE = "요약을 생성할 수 없습니다."
+
+
+def _local_summary(content: str) -> str:
+    """로컬 개발용 간단한 요약 (첫 3문장 추출)"""
+    # 문장 분리 (간단한 방법)
+    sentences = []
+    for delimiter in ['. ', '! ', '? ']:
+        if delimiter in content:
+            parts = content.split(delimiter)
+            for i, part in enumerate(parts[:-1]):
+                sentences.append(part + delimiter.strip())
+            if parts[-1]:
+                sentences.append(parts[-1])
+            break
 
-            # HTML에서 실제 기사 링크 찾기
-            soup = BeautifulSoup(res.text, "html.parser")
+    if not sentences:
+        # 문장 구분이 안 되면 첫 500자만 사용
+        return content[:500] + "..."
 
-            # 방법 1: <a> 태그에서 실제 링크 찾기
-            link_tag = soup.find("a", href=True)
-            if link_tag and link_tag.get("href"):
-                actual_url = link_tag["href"]
-                # Google News 리다이렉트가 아닌 실제 뉴스 사이트 URL인지 확인
-                if not "google.com" in actual_url:
-                    url = actual_url
-                    logger.info(f"Google News에서 실제 URL 추출: {url}")
+    # 첫 3문장 사용
+    summary_text = " ".join(sentences[:3])
+    if len(summary_text) > 500:
+        summary_text = summary_text[:500] + "..."
+    return summary_text
 
-        res = requests.get(
-            url,
-            headers={"User-Agent": "Mozilla/5.0"},
-            timeout=10,
-            allow_redirects=True,
-        )
-        final_url = res.url
-        html = res.text
 
-        content = _extract_article_text(final_url, html)
+def summarize_contents(contents: List[str]) -> List[Any]:
+    """
+    기사 본문 목록 요약 (요약 문자열 또는 Exception, 입력 순서)
+    - 빈 본문은 안내 문구, 짧은 본문은 그대로 사용
+    - AI 서비스가 있으면 1건은 /summarize, 여러 건은 /summarize/batch 한 번으로 요청
+    """
+    results: List[Any] = [None] * len(contents)
+    pending = []
+    for i, content in enumerate(contents):
         content = content.strip()
-
         if not content:
             logger.warning("뉴스 본문이 거의 없습니다.")
-            return {
-                "url": final_url,
-                "summary": "본문을 요약할 수 없습니다. 내용이 너무 짧거나 접근할 수 없습니다.",
-            }
-
-        # 아주 짧은 기사(한두 문장)는 그대로 summary로 사용
-        if len(content) < 200:
+            results[i] = SUMMARY_EMPTY_MESSAGE
+        elif len(content) < SUMMARY_MIN_CHARS:
+            # 아주 짧은 기사(한두 문장)는 그대로 summary로 사용
             logger.info("본문이 짧아서 그대로 요약 결과로 사용합니다.")
-            return {"url": final_url, "summary": content}
+            results[i] = content
+        else:
+            pending.append(i)
+
+    if not pending:
+        return results
+
+    # AI_SERVICE_URL이 설정되어 있으면 Cloud Run 사용
+    AI_SERVICE_URL = os.getenv("AI_SERVICE_URL")
+
+    if not AI_SERVICE_URL:
+        # 로컬 개발: 간단한 요약 생성 (첫 3문장 추출)
+        logger.info("📝 요약: 로컬 모드 (첫 3문장 추출)")
+        for i in pending:
+            results[i] = _local_summary(contents[i].strip())
+        logger.info("뉴스 요약 완료 (로컬 - 첫 3문장)")
+        return results
+
+    logger.info(f"☁️  요약: Cloud Run AI 서비스 사용 ({len(pending)}건)")
+    texts = [contents[i].strip()[:2048] for i in pending]
+    if len(texts) == 1:
+        payload = {"text": texts[0], "max_length": 130, "min_length": 30}
+        items = [call_ai_service("/summarize", payload, timeout=120)]
+    else:
+        payload = {"texts": texts, "max_length": 130, "min_length": 30}
+        items = call_ai_service("/summarize/batch", payload, timeout=300)["results"]
 
-        # AI_SERVICE_URL이 설정되어 있으면 Cloud Run 사용
-        AI_SERVICE_URL = os.getenv("AI_SERVICE_URL")
+    for i, item in zip(pending, items):
+        if "error" in item:
+            results[i] = RuntimeError(item["error"])
+        else:
+            results[i] = item.get("summary", "").strip() or SUMMARY_FAILED_MESSAGE
+    logger.info("뉴스 요약 완료 (Cloud Run AI)")
+    return results
 
-        if AI_SERVICE_URL:
-            # Cloud Run AI 서비스로 요약
-            logger.info("☁️  요약: Cloud Run AI 서비스 사용")
-            payload = {
-                "text": content[:2048],
-                "max_length": 130,
-                "min_length": 30,
-            }
-            result = call_ai_service("/summarize", payload, timeout=120)
-            summary_text = result.get("summary", "").strip() or "요약을 생성할 수 없습니다."
-            logger.info("뉴스 요약 완료 (Cloud Run AI)")
-            return {"url": final_url, "summary": summary_text}
+def is_placeholder_summary(summary_text: str) -> bool:
+    """요약 대신 돌려준 안내 문구인지 (서버 캐시/HTTP 캐시에 남기지 않음)"""
+    return summary_text in (SUMMARY_EMPTY_MESSAGE, SUMMARY_FAILED_MESSAGE)
 
-        else:
-            # 로컬 개발: 간단한 요약 생성 (첫 3문장 추출)
-            logger.info("📝 요약: 로컬 모드 (첫 3문장 추출)")
-
-            # 문장 분리 (간단한 방법)
-            sentences = []
-            for delimiter in ['. ', '! ', '? ']:
-                if delimiter in content:
-                    parts = content.split(delimiter)
-                    for i, part in enumerate(parts[:-1]):
-                        sentences.append(part + delimiter.strip())
-                    if parts[-1]:
-                        sentences.append(parts[-1])
-                    break
-
-            if not sentences:
-                # 문장 구분이 안 되면 첫 500자만 사용
-                summary_text = content[:500] + "..."
-            else:
-                # 첫 3문장 사용
-                summary_text = " ".join(sentences[:3])
-                if len(summary_text) > 500:
-                    summary_text = summary_text[:500] + "..."
 
-            logger.info("뉴스 요약 완료 (로컬 - 첫 3문장)")
-            return {"url": final_url, "summary": summary_text}
+def _summary_response(response: Response, final_url: str, summary_text: str) -> Dict[str, Any]:
+    """요약 응답 (안내 문구면 브라우저/CDN에 캐시하지 않도록 no-store)"""
+    if is_placeholder_summary(summary_text):
+        response.headers["Cache-Control"] = "no-store"
+    return {"url": final_url, "summary": summary_text}
+
+
+@router.get("/summary")
+def summarize_news(url: str, response: Response):
+    try:
+        logger.info(f"뉴스 요약 요청: {url}")
+
+        # 사전 처리 중인 기사면 끝날 때까지 잠시 기다렸다가 그 결과 사용
+        cached = enrichment.worker.wait(url, "summary", SUMMARY_WAIT_SECONDS)
+        if cached:
+            logger.info("뉴스 요약 캐시 적중 (사전 처리 결과)")
+            return _summary_response(response, cached["final_url"], cached["summary"])
+
+        cached = enrichment.cached(url)
+        if cached and "content" in cached:
+            final_url, content = cached["final_url"], cached["content"]
+        elif enrichment.recently_failed(url):
+            final_url, content = url, ""
+        else:
+            final_url, content = _fetch_article(url)
+            enrichment.store_content(url, final_url, content)
+
+        summary_text = summarize_contents([content])[0]
+        if isinstance(summary_text, Exception):
+            raise summary_text
+        enrichment.store_summary(url, summary_text, final_url=final_url)
+        return _summary_response(response, final_url, summary_text)
     except HTTPException:
         raise
     except Exception as e:
@@ -531,126 +779,142 @@ def summarize_news(url: str):
 # -------------------------------
 # 4. 감성 분석 API (Cloud Run AI 서비스)
 # -------------------------------
-@router.post("/sentiment")
-def analyze_sentiment(data: dict):
+def sentiment_for_text(text: str) -> Dict[str, Any]:
     """
-    텍스트의 감성을 분석합니다 (Cloud Run AI 서비스로 프록시)
+    텍스트 감성 분석 (감성 분석 API와 사전 처리 공용, 실패하면 예외)
+    - USE_LOCAL_AI=true: 로컬 모델 / AI_SERVICE_URL: Cloud Run / 둘 다 없으면 키워드 기반
     """
-    try:
-        text = data.get("text", "")
-        if not text or len(text.strip()) < 10:
-            return {"sentiment": "neutral", "score": 0.5, "label": "중립"}
-        
-        USE_LOCAL_AI = os.getenv("USE_LOCAL_AI", "false").lower() == "true"
-        
-        if USE_LOCAL_AI:
-            logger.info("🏠 감성 분석: 로컬 모델 사용")
-            analyzer = _get_sentiment_analyzer()
-            result = analyzer(text[:512])[0]
-            
-            sentiment_map = {
-                "POSITIVE": {"sentiment": "positive", "label": "긍정"},
-                "NEGATIVE": {"sentiment": "negative", "label": "부정"}
+    if not text or len(text.strip()) < 10:
+        return {"sentiment": "neutral", "score": 0.5, "label": "중립"}
+
+    USE_LOCAL_AI = os.getenv("USE_LOCAL_AI", "false").lower() == "true"
+
+    if USE_LOCAL_AI:
+        logger.info("🏠 감성 분석: 로컬 모델 사용")
+        analyzer = _get_sentiment_analyzer()
+        result = analyzer(text[:512])[0]
+
+        sentiment_map = {
+            "POSITIVE": {"sentiment": "positive", "label": "긍정"},
+            "NEGATIVE": {"sentiment": "negative", "label": "부정"}
+        }
+        sentiment_info = sentiment_map.get(result["label"], {"sentiment": "neutral", "label": "중립"})
+
+        return {
+            "sentiment": sentiment_info["sentiment"],
+            "label": sentiment_info["label"],
+            "score": round(result["score"], 2)
+        }
+    else:
+        # AI_SERVICE_URL이 설정되어 있으면 Cloud Run 사용
+        AI_SERVICE_URL = os.getenv("AI_SERVICE_URL")
+
+        if AI_SERVICE_URL:
+            logger.info("☁️  감성 분석: Cloud Run AI 서비스 사용")
+            payload = {"text": text}
+            result = call_ai_service("/sentiment", payload, timeout=30)
+            return result
+        else:
+            # 로컬 개발: 뉴스 특화 키워드 기반 감성 분석
+            logger.info("📊 감성 분석: 로컬 모드 (뉴스 특화 키워드)")
+
+            text_lower = text.lower()
+
+            # 긍정 키워드 (가중치 포함)
+            positive_keywords = {
+                # 성공/성취 (가중치 3)
+                'success': 3, 'successful': 3, 'achieve': 3, 'achieved': 3,
+                'accomplishment': 3, 'breakthrough': 3, 'triumph': 3,
+                # 승리/우승 (가중치 3)
+                'win': 3, 'wins': 3, 'won': 3, 'victory': 3, 'champion': 3,
+                # 긍정적 변화 (가중치 2)
+                'progress': 2, 'improve': 2, 'improved': 2, 'improvement': 2,
+                'growth': 2, 'rise': 2, 'rose': 2, 'rising': 2, 'increase': 2,
+                'gain': 2, 'surge': 2, 'boost': 2, 'recover': 2, 'recovery': 2,
+                'deal': 2, 'deals': 2, 'blockbuster': 2, 'record': 2, 'historic': 2,
+                # 긍정적 평가 (가중치 2)
+                'excellent': 2, 'outstanding': 2, 'remarkable': 2, 'impressive': 2,
+                'positive': 2, 'optimistic': 2, 'favorable': 2, 'promising': 2,
+                # 일반 긍정 (가중치 1)
+                'good': 1, 'great': 1, 'better': 1, 'best': 1, 'wonderful': 1,
+                'fantastic': 1, 'amazing': 1, 'happy': 1, 'pleased': 1, 'hope': 1,
+                'peace': 1, 'celebrate': 1, 'celebration': 1, 'joy': 1, 'love': 1,
+                'support': 1, 'help': 1, 'agreement': 1, 'cooperation': 1,
+                'agree': 1, 'agreed': 1, 'welcome': 1, 'welcomes': 1, 'welcomed': 1,
+                'benefit': 1, 'benefits': 1, 'opportunity': 1, 'opportunities': 1
             }
-            sentiment_info = sentiment_map.get(result["label"], {"sentiment": "neutral", "label": "중립"})
-            
-            return {
-                "sentiment": sentiment_info["sentiment"],
-                "label": sentiment_info["label"],
-                "score": round(result["score"], 2)
+
+            # 부정 키워드 (가중치 포함)
+            negative_keywords = {
+                # 폭력/재난 (가중치 3)
+                'kill': 3, 'killed': 3, 'death': 3, 'deaths': 3, 'die': 3, 'died': 3,
+                'attack': 3, 'attacked': 3, 'war': 3, 'bomb': 3, 'bombard': 3,
+                'explosion': 3, 'disaster': 3, 'tragedy': 3, 'crisis': 3,
+                'emergency': 3, 'terror': 3, 'terrorism': 3, 'violence': 3,
+                # 범죄/사고 (가중치 3)
+                'murder': 3, 'crash': 3, 'accident': 3, 'fire': 3, 'flood': 3,
+                'earthquake': 3, 'storm': 3, 'hurricane': 3, 'deadly': 3,
+                'shooting': 3, 'shot': 3, 'fighting': 3, 'fight': 3,
+                # 실패/손실 (가중치 2)
+                'fail': 2, 'failed': 2, 'failure': 2, 'loss': 2, 'lost': 2,
+                'lose': 2, 'defeat': 2, 'collapse': 2, 'decline': 2, 'fall': 2,
+                'drop': 2, 'decrease': 2, 'cut': 2, 'slash': 2,
+                # 부정적 평가 (가중치 2)
+                'bad': 2, 'terrible': 2, 'awful': 2, 'worst': 2, 'worse': 2,
+                'poor': 2, 'negative': 2, 'pessimistic': 2, 'concern': 2,
+                'worry': 2, 'fear': 2, 'threat': 2, 'risk': 2, 'danger': 2,
+                # 일반 부정 (가중치 1)
+                'problem': 1, 'issue': 1, 'difficult': 1, 'challenge': 1,
+                'trouble': 1, 'conflict': 1, 'dispute': 1, 'protest': 1,
+                'angry': 1, 'sad': 1, 'disappointed': 1, 'sorry': 1
             }
-        else:
-            # AI_SERVICE_URL이 설정되어 있으면 Cloud Run 사용
-            AI_SERVICE_URL = os.getenv("AI_SERVICE_URL")
-
-            if AI_SERVICE_URL:
-                logger.info("☁️  감성 분석: Cloud Run AI 서비스 사용")
-                payload = {"text": text}
-                result = call_ai_service("/sentiment", payload, timeout=30)
-                return result
+
+            # 가중치 적용하여 점수 계산
+            positive_score = sum(weight for word, weight in positive_keywords.items() if word in text_lower)
+            negative_score = sum(weight for word, weight in negative_keywords.items() if word in text_lower)
+
+            logger.info(f"긍정 점수: {positive_score}, 부정 점수: {negative_score}")
+
+            # 점수 차이가 2 이상이면 명확한 감성으로 판단
+            if positive_score > negative_score + 1:
+                sentiment = "positive"
+                label = "긍정"
+                # 점수 차이에 따라 신뢰도 계산
+                diff = positive_score - negative_score
+                score = min(0.55 + diff * 0.05, 0.95)
+            elif negative_score > positive_score + 1:
+                sentiment = "negative"
+                label = "부정"
+                diff = negative_score - positive_score
+                score = min(0.55 + diff * 0.05, 0.95)
             else:
-                # 로컬 개발: 뉴스 특화 키워드 기반 감성 분석
-                logger.info("📊 감성 분석: 로컬 모드 (뉴스 특화 키워드)")
-
-                text_lower = text.lower()
-
-                # 긍정 키워드 (가중치 포함)
-                positive_keywords = {
-                    # 성공/성취 (가중치 3)
-                    'success': 3, 'successful': 3, 'achieve': 3, 'achieved': 3,
-                    'accomplishment': 3, 'breakthrough': 3, 'triumph': 3,
-                    # 승리/우승 (가중치 3)
-                    'win': 3, 'wins': 3, 'won': 3, 'victory': 3, 'champion': 3,
-                    # 긍정적 변화 (가중치 2)
-                    'progress': 2, 'improve': 2, 'improved': 2, 'improvement': 2,
-                    'growth': 2, 'rise': 2, 'rose': 2, 'rising': 2, 'increase': 2,
-                    'gain': 2, 'surge': 2, 'boost': 2, 'recover': 2, 'recovery': 2,
-                    'deal': 2, 'deals': 2, 'blockbuster': 2, 'record': 2, 'historic': 2,
-                    # 긍정적 평가 (가중치 2)
-                    'excellent': 2, 'outstanding': 2, 'remarkable': 2, 'impressive': 2,
-                    'positive': 2, 'optimistic': 2, 'favorable': 2, 'promising': 2,
-                    # 일반 긍정 (가중치 1)
-                    'good': 1, 'great': 1, 'better': 1, 'best': 1, 'wonderful': 1,
-                    'fantastic': 1, 'amazing': 1, 'happy': 1, 'pleased': 1, 'hope': 1,
-                    'peace': 1, 'celebrate': 1, 'celebration': 1, 'joy': 1, 'love': 1,
-                    'support': 1, 'help': 1, 'agreement': 1, 'cooperation': 1,
-                    'agree': 1, 'agreed': 1, 'welcome': 1, 'welcomes': 1, 'welcomed': 1,
-                    'benefit': 1, 'benefits': 1, 'opportunity': 1, 'opportunities': 1
-                }
+                sentiment = "neutral"
+                label = "중립"
+                score = 0.5
 
-                # 부정 키워드 (가중치 포함)
-                negative_keywords = {
-                    # 폭력/재난 (가중치 3)
-                    'kill': 3, 'killed': 3, 'death': 3, 'deaths': 3, 'die': 3, 'died': 3,
-                    'attack': 3, 'attacked': 3, 'war': 3, 'bomb': 3, 'bombard': 3,
-                    'explosion': 3, 'disaster': 3, 'tragedy': 3, 'crisis': 3,
-                    'emergency': 3, 'terror': 3, 'terrorism': 3, 'violence': 3,
-                    # 범죄/사고 (가중치 3)
-                    'murder': 3, 'crash': 3, 'accident': 3, 'fire': 3, 'flood': 3,
-                    'earthquake': 3, 'storm': 3, 'hurricane': 3, 'deadly': 3,
-                    'shooting': 3, 'shot': 3, 'fighting': 3, 'fight': 3,
-                    # 실패/손실 (가중치 2)
-                    'fail': 2, 'failed': 2, 'failure': 2, 'loss': 2, 'lost': 2,
-                    'lose': 2, 'defeat': 2, 'collapse': 2, 'decline': 2, 'fall': 2,
-                    'drop': 2, 'decrease': 2, 'cut': 2, 'slash': 2,
-                    # 부정적 평가 (가중치 2)
-                    'bad': 2, 'terrible': 2, 'awful': 2, 'worst': 2, 'worse': 2,
-                    'poor': 2, 'negative': 2, 'pessimistic': 2, 'concern': 2,
-                    'worry': 2, 'fear': 2, 'threat': 2, 'risk': 2, 'danger': 2,
-                    # 일반 부정 (가중치 1)
-                    'problem': 1, 'issue': 1, 'difficult': 1, 'challenge': 1,
-                    'trouble': 1, 'conflict': 1, 'dispute': 1, 'protest': 1,
-                    'angry': 1, 'sad': 1, 'disappointed': 1, 'sorry': 1
-                }
+            return {
+                "sentiment": sentiment,
+                "label": label,
+                "score": round(score, 2)
+            }
 
-                # 가중치 적용하여 점수 계산
-                positive_score = sum(weight for word, weight in positive_keywords.items() if word in text_lower)
-                negative_score = sum(weight for word, weight in negative_keywords.items() if word in text_lower)
-
-                logger.info(f"긍정 점수: {positive_score}, 부정 점수: {negative_score}")
-
-                # 점수 차이가 2 이상이면 명확한 감성으로 판단
-                if positive_score > negative_score + 1:
-                    sentiment = "positive"
-                    label = "긍정"
-                    # 점수 차이에 따라 신뢰도 계산
-                    diff = positive_score - negative_score
-                    score = min(0.55 + diff * 0.05, 0.95)
-                elif negative_score > positive_score + 1:
-                    sentiment = "negative"
-                    label = "부정"
-                    diff = negative_score - positive_score
-                    score = min(0.55 + diff * 0.05, 0.95)
-                else:
-                    sentiment = "neutral"
-                    label = "중립"
-                    score = 0.5
-
-                return {
-                    "sentiment": sentiment,
-                    "label": label,
-                    "score": round(score, 2)
-                }
+
+@router.post("/sentiment")
+def analyze_sentiment(data: dict):
+    """
+    텍스트의 감성을 분석합니다 (Cloud Run AI 서비스로 프록시)
+    - url을 함께 보내면 사전 처리된 결과가 있을 때 그대로 반환
+    - 클라이언트가 보낸 텍스트로 분석한 결과는 캐시에 저장하지 않음
+      (URL로 저장하면 다른 텍스트를 보내 모든 사용자가 보는 결과를 바꿀 수 있음,
+       캐시는 사전 처리 워커가 서버에서 가져온 본문으로 만든 결과만 사용)
+    """
+    try:
+        url = data.get("url")
+        cached = enrichment.cached(url) if url else None
+        if cached and "sentiment" in cached:
+            return cached["sentiment"]
+
+        return sentiment_for_text(data.get("text", ""))
 
     except HTTPException:
         raise
@@ -681,6 +945,10 @@ def find_similar_articles(data: dict):
         if not target_text.strip():
             return []
         
+        # scikit-learn은 유사 기사 분석을 처음 요청할 때 import
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        from sklearn.metrics.pairwise import cosine_similarity
+
         all_texts = [target_text] + article_texts
         vectorizer = TfidfVectorizer(stop_words='english', max_features=1000)
         tfidf_matrix = vectorizer.fit_transform(all_texts)
@@ -710,46 +978,76 @@ def find_similar_articles(data: dict):
         )
 
 # -------------------------------
-# 6. 추천 뉴스 API (TOP 10 중 필터링)
+# 6. 추천 뉴스 API (사용자 프로필 기반)
 # -------------------------------
 class RecommendRequest(BaseModel):
     user_id: int
     topic: Optional[str] = None  # 사용자 관심 주제 (정치, 경제, 기술, 스포츠, 문화)
-    articles: List[Dict[str, Any]]  # TOP 10 뉴스 목록
+    source: Optional[str] = None  # 추천 후보 매체 (없으면 구독 매체 → BBC)
+    articles: Optional[List[Dict[str, Any]]] = None  # (하위 호환) 클라이언트가 보낸 후보 목록
+
+
+def _recommend_candidates(data: RecommendRequest, db: Session) -> List[Dict[str, Any]]:
+    """추천 후보 기사 (서버 피드 캐시 사용, 클라이언트 목록은 하위 호환용)"""
+    if data.articles:
+        return data.articles
+
+    source = data.source
+    if not source:
+        subscription = db.query(Subscription.source).filter(Subscription.user_id == data.user_id).first()
+        source = subscription[0] if subscription else "BBC"
+
+    key = _source_key(source) or "bbc"
+    _FEED_ENDPOINTS[key]()  # 캐시가 비었거나 만료되었으면 갱신
+    return feed_cache.cached_articles(key)
+
 
 @router.post("/recommend")
 def recommend_news(data: RecommendRequest, db: Session = Depends(get_db)):
     """
     사용자 맞춤 추천 뉴스 5개 반환 (관심사 기반 2개 + 인기 뉴스 3개)
+    - 관심사: 읽기 기록으로 만든 프로필 벡터와 캐시된 피드 기사의 내적 점수
+    - 프로필이 없으면 구독 주제 키워드로 대체
     """
     try:
         user_id = data.user_id
         topic = data.topic
-        articles = data.articles
+        articles = _recommend_candidates(data, db)
         
         if not articles or len(articles) == 0:
             return {"recommended": []}
-        
-        topic_keywords = {
-            "정치": ["election", "government", "politics", "minister", "president", "policy", "vote", "parliament", "congress"],
-            "경제": ["economy", "market", "finance", "stock", "trade", "business", "investment", "inflation", "GDP", "bank"],
-            "기술": ["technology", "AI", "software", "digital", "innovation", "tech", "smartphone", "computer", "cyber", "robot", "space"],
-            "스포츠": ["sports", "football", "soccer", "basketball", "olympic", "game", "player", "team", "match", "tournament"],
-            "문화": ["culture", "movie", "music", "art", "entertainment", "film", "celebrity", "festival", "book", "theater"]
+
+        # 이미 읽은 기사는 후보에서 제외 (모두 읽었으면 그대로 사용)
+        candidate_urls = [feed_cache.article_url(a) for a in articles]
+        read_urls = {
+            url for (url,) in db.query(ReadArticle.url).filter(
+                ReadArticle.user_id == user_id,
+                ReadArticle.url.in_(candidate_urls)
+            ).all()
         }
-        
+        unread = [a for a in articles if feed_cache.article_url(a) not in read_urls]
+        if unread:
+            articles = unread
+
         interest_based_articles = []
-        if topic and topic in topic_keywords:
-            keywords = topic_keywords[topic]
-            
+        profile = recommender.get_profile(db, user_id)
+        if profile.article_count > 0:
+            scores = recommender.rank_articles(profile, articles)
+            top = [int(i) for i in scores.argsort()[::-1][:2] if scores[i] > 0]
+            interest_based_articles = [
+                {
+                    **articles[i],
+                    "recommendation_reason": "interest"
+                }
+                for i in top
+            ]
+            # 새로 만든 프로필은 다음 요청부터 재사용
+            db.commit()
+
+        if not interest_based_articles and topic and topic in topic_classifier.TOPIC_KEYWORDS:
             scored_for_interest = []
             for article in articles:
-                title = article.get("title", "").lower()
-                summary = article.get("summary", "").lower()
-                content = f"{title} {summary}"
-                
-                matched_keywords = sum(1 for keyword in keywords if keyword.lower() in content)
-                interest_score = matched_keywords / len(keywords) if len(keywords) > 0 else 0.0
+                interest_score = recommender.article_categories(article).get(topic, 0.0)
                 
                 if interest_score > 0:
                     scored_for_interest.append({
@@ -780,31 +1078,30 @@ def recommend_news(data: RecommendRequest, db: Session = Depends(get_db)):
             ]
             interest_based_articles = [a for a in interest_based_articles if a is not None]
         
-        selected_urls = {article.get("url") for article in interest_based_articles}
+        selected_urls = {feed_cache.article_url(article) for article in interest_based_articles}
         
         popular_candidates = []
+        now_ts = int(time.time())
         for article in articles:
-            if article.get("url") in selected_urls:
+            if feed_cache.article_url(article) in selected_urls:
                 continue
             
             score = 0.0
             
-            published_str = article.get("published", "")
-            if published_str:
-                try:
-                    published_date = date_parser.parse(published_str)
-                    now = datetime.now(published_date.tzinfo) if published_date.tzinfo else datetime.now()
-                    time_diff_hours = (now - published_date).total_seconds() / 3600
-                    
-                    if time_diff_hours < 24:
-                        score += 10.0
-                    elif time_diff_hours < 48:
-                        score += 5.0
-                    elif time_diff_hours < 72:
-                        score += 2.0
-                    else:
-                        score += 1.0
-                except:
+            # 발행 시각은 피드 수집 시 epoch로 변환되어 있음 (클라이언트 목록만 여기서 파싱)
+            published_ts = article.get("published_ts")
+            if published_ts is None and "published_ts" not in article:
+                published_ts = _parse_published(article.get("published", ""))
+
+            if published_ts is not None:
+                age = now_ts - published_ts
+                if age < 24 * 3600:
+                    score += 10.0
+                elif age < 48 * 3600:
+                    score += 5.0
+                elif age < 72 * 3600:
+                    score += 2.0
+                else:
                     score += 1.0
             else:
                 score += 1.0
@@ -817,10 +1114,12 @@ def recommend_news(data: RecommendRequest, db: Session = Depends(get_db)):
             
             popular_candidates.append({
                 "article": article,
-                "score": score
+                "score": score,
+                "published_ts": published_ts or 0
             })
         
-        popular_candidates.sort(key=lambda x: x["score"], reverse=True)
+        # 같은 점수면 최신 기사 우선
+        popular_candidates.sort(key=lambda x: (x["score"], x["published_ts"]), reverse=True)
         popular_articles = [
             {
                 **item["article"],
@@ -834,7 +1133,7 @@ def recommend_news(data: RecommendRequest, db: Session = Depends(get_db)):
         seen_urls = set()
         unique_recommended = []
         for item in recommended:
-            url = item.get("url")
+            url = feed_cache.article_url(item)
             if url not in seen_urls:
                 unique_recommended.append(item)
                 seen_urls.add(url)
@@ -851,6 +1150,7 @@ def recommend_news(data: RecommendRequest, db: Session = Depends(get_db)):
         }
         
     except Exception as e:
+        db.rollback()
         logger.error(f"추천 뉴스 생성 실패: {e}")
         raise HTTPException(
             status_code=500,
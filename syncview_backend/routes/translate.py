@@ -5,6 +5,7 @@ import logging
 import os
 import requests
 from utils import call_ai_service
+import enrichment
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -62,6 +63,11 @@ def translate(req: TranslateReq):
 
         # Cloud Run AI 서비스가 설정되어 있으면 사용
         if AI_SERVICE_URL:
+            # 사전 처리(또는 이전 요청)에서 번역한 결과가 있으면 그대로 사용
+            cached = enrichment.cached_translation(req.text, req.target_lang)
+            if cached is not None:
+                return {"translated_text": cached}
+
             logger.info(f"🔄 번역 요청 (Cloud Run AI): {req.text[:50]}...")
             payload = {
                 "text": req.text,
@@ -70,6 +76,8 @@ def translate(req: TranslateReq):
             }
             result = call_ai_service("/translate", payload, timeout=120)
             logger.info(f"✅ 번역 완료 (Cloud Run AI)")
+            if "translated_text" in result:
+                enrichment.store_translation(req.text, result["translated_text"], req.target_lang)
             return {"translated_text": result.get("translated_text", req.text)}
 
         # 로컬 개발: Google Translate API 사용 (deep-translator)
@@ -0,0 +1,5 @@
+"""백엔드 모듈은 syncview_backend 디렉터리 기준으로 import (uvicorn main:app과 같은 방식)"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
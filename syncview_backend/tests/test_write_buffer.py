@@ -0,0 +1,138 @@
+"""
+쓰기 지연 버퍼 테스트
+- 잘못된 이벤트(없는 사용자)가 섞여 있어도 나머지 이벤트는 저장되고 잘못된 이벤트만 dead letter로 빠지는지
+- DB 테스트는 DATABASE_URL의 PostgreSQL에 접속할 수 있을 때만 실행
+"""
+import uuid
+
+import pytest
+from sqlalchemy.exc import IntegrityError, OperationalError
+
+from write_buffer import WriteBehindBuffer
+
+BAD_USER_ID = 999999
+
+
+class FakeStore:
+    """한 트랜잭션처럼 동작하는 저장소 (배치에 없는 사용자가 있으면 전체 실패)"""
+
+    def __init__(self, valid_users):
+        self.valid_users = set(valid_users)
+        self.rows = []
+        self.calls = 0
+
+    def flush(self, events):
+        self.calls += 1
+        for event in events:
+            if event["user_id"] not in self.valid_users:
+                raise IntegrityError("INSERT INTO read_articles", {}, Exception("foreign key violation"))
+        self.rows.extend(events)
+
+
+def _events(user_id, count, start=0):
+    return [{"user_id": user_id, "url": f"https://example.com/{user_id}/{i}"} for i in range(start, start + count)]
+
+
+def test_bad_event_is_dead_lettered_and_valid_events_are_saved():
+    store = FakeStore(valid_users={1, 2})
+    buffer = WriteBehindBuffer("test", store.flush, isolate_errors=(IntegrityError,))
+    good = _events(1, 10) + _events(2, 10)
+    bad = _events(BAD_USER_ID, 1)
+    buffer._events = good[:7] + bad + good[7:]
+
+    assert buffer.flush() is True
+    assert store.rows == good
+    stats = buffer.stats()
+    assert stats["depth"] == 0
+    assert stats["flushed_events"] == len(good)
+    assert stats["dead_lettered_events"] == 1
+    assert stats["failed_flushes"] == 0
+    assert buffer.dead_letters[0]["event"] == bad[0]
+
+    # 다음 flush가 막히지 않음
+    buffer._events = _events(1, 3, start=10)
+    assert buffer.flush() is True
+    assert len(store.rows) == len(good) + 3
+
+
+def test_transient_error_requeues_unsaved_events():
+    def fail(events):
+        raise OperationalError("INSERT INTO read_articles", {}, Exception("connection lost"))
+
+    buffer = WriteBehindBuffer("test", fail, isolate_errors=(IntegrityError,))
+    events = _events(1, 5)
+    buffer._events = list(events)
+
+    assert buffer.flush() is False
+    assert buffer._events == events
+    assert buffer.stats()["failed_flushes"] == 1
+    assert buffer.stats()["dead_lettered_events"] == 0
+
+
+def test_without_isolate_errors_integrity_error_requeues_batch():
+    store = FakeStore(valid_users={1})
+    buffer = WriteBehindBuffer("test", store.flush)
+    events = _events(1, 2) + _events(BAD_USER_ID, 1)
+    buffer._events = list(events)
+
+    assert buffer.flush() is False
+    assert buffer._events == events
+    assert store.rows == []
+
+
+@pytest.fixture
+def db_user():
+    from database import SessionLocal, engine
+    from models import User
+
+    try:
+        with engine.connect():
+            pass
+    except Exception as e:
+        pytest.skip(f"PostgreSQL에 접속할 수 없음: {e}")
+
+    import migrations
+    migrations.upgrade(engine)
+
+    db = SessionLocal()
+    name = f"buffer-test-{uuid.uuid4().hex[:8]}"
+    user = User(username=name, email=f"{name}@example.com", password="x")
+    db.add(user)
+    db.commit()
+    try:
+        yield user.id
+    finally:
+        from models import ReadArticle, ReadStatsDaily, AnalyticsVersion, UserProfile
+        for model in (ReadArticle, ReadStatsDaily, AnalyticsVersion, UserProfile):
+            db.query(model).filter(model.user_id == user.id).delete()
+        db.query(User).filter(User.id == user.id).delete()
+        db.commit()
+        db.close()
+
+
+def test_read_buffer_flush_with_unknown_user(db_user):
+    from datetime import datetime
+    from database import SessionLocal
+    from models import ReadArticle
+    from routes.analytics import _flush_read_events, read_buffer
+
+    def event(user_id, i):
+        return {
+            "user_id": user_id, "title": f"Article {i}", "url": f"https://example.com/{uuid.uuid4().hex}",
+            "source": "BBC", "category": None, "sentiment": "neutral", "sentiment_score": 0.5,
+            "read_at": datetime.utcnow(),
+        }
+
+    buffer = WriteBehindBuffer("read-articles-test", _flush_read_events, isolate_errors=read_buffer.isolate_errors)
+    buffer._events = [event(db_user, i) for i in range(5)] + [event(BAD_USER_ID, 5)] + [event(db_user, i) for i in range(6, 9)]
+
+    assert buffer.flush() is True
+    assert buffer.stats()["depth"] == 0
+    assert buffer.stats()["dead_lettered_events"] == 1
+    assert buffer.dead_letters[0]["event"]["user_id"] == BAD_USER_ID
+
+    db = SessionLocal()
+    try:
+        assert db.query(ReadArticle).filter(ReadArticle.user_id == db_user).count() == 8
+    finally:
+        db.close()
@@ -0,0 +1,60 @@
+"""
+주제(카테고리) 분류 모듈
+- 모든 주제 키워드를 하나의 정규식으로 컴파일해 텍스트를 한 번만 스캔
+- 피드 수집 시 기사마다 카테고리 점수를 태깅하고, 추천/통계는 이 태그를 재사용
+"""
+import re
+from typing import Dict, Any, Optional
+
+# 주제별 키워드 (구독 설정의 topic 값과 동일한 키 사용)
+TOPIC_KEYWORDS = {
+    "정치": ["election", "government", "politics", "minister", "president", "policy", "vote", "parliament", "congress"],
+    "경제": ["economy", "market", "finance", "stock", "trade", "business", "investment", "inflation", "GDP", "bank"],
+    "기술": ["technology", "AI", "software", "digital", "innovation", "tech", "smartphone", "computer", "cyber", "robot", "space"],
+    "스포츠": ["sports", "football", "soccer", "basketball", "olympic", "game", "player", "team", "match", "tournament"],
+    "문화": ["culture", "movie", "music", "art", "entertainment", "film", "celebrity", "festival", "book", "theater"]
+}
+CATEGORIES = list(TOPIC_KEYWORDS)
+
+_KEYWORD_CATEGORY = {
+    keyword.lower(): category
+    for category, keywords in TOPIC_KEYWORDS.items()
+    for keyword in keywords
+}
+_KEYWORD_COUNT = {category: len(keywords) for category, keywords in TOPIC_KEYWORDS.items()}
+
+# 긴 키워드를 먼저 두어 접두어가 겹치는 경우(tech/technology)에도 정확히 매칭, 복수형 허용
+_MATCHER = re.compile(
+    r"\b("
+    + "|".join(re.escape(k) for k in sorted(_KEYWORD_CATEGORY, key=len, reverse=True))
+    + r")(?:s|es)?\b",
+    re.IGNORECASE,
+)
+
+
+def classify(text: str) -> Dict[str, float]:
+    """
+    카테고리별 점수 계산 (매칭된 키워드 수 / 해당 카테고리 키워드 수)
+
+    Returns:
+        점수가 0보다 큰 카테고리만 담은 dict (예: {"정치": 0.33})
+    """
+    matched = {m.group(1).lower() for m in _MATCHER.finditer(text)}
+    counts: Dict[str, int] = {}
+    for keyword in matched:
+        category = _KEYWORD_CATEGORY[keyword]
+        counts[category] = counts.get(category, 0) + 1
+    return {category: round(n / _KEYWORD_COUNT[category], 4) for category, n in counts.items()}
+
+
+def top_category(scores: Dict[str, float]) -> Optional[str]:
+    """가장 점수가 높은 카테고리 (없으면 None)"""
+    if not scores:
+        return None
+    return max(scores.items(), key=lambda x: x[1])[0]
+
+
+def tag(text: str) -> Dict[str, Any]:
+    """피드 기사에 붙일 태그 ({"categories": {...}, "category": "정치"})"""
+    scores = classify(text)
+    return {"categories": scores, "category": top_category(scores)}
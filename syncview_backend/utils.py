@@ -2,12 +2,22 @@
 공통 유틸리티 함수 모듈
 """
 import os
+import time
 import logging
 import requests
 from fastapi import HTTPException
 
+from metrics import registry
+
 logger = logging.getLogger(__name__)
 
+ai_request_duration = registry.histogram(
+    "ai_service_request_duration_seconds", "AI 서비스 호출 시간 (경로별)", ("path",)
+)
+ai_request_errors = registry.counter(
+    "ai_service_errors", "AI 서비스 호출 실패 수 (경로, 응답 코드별)", ("path", "status")
+)
+
 
 def call_ai_service(path: str, payload: dict, timeout: int = 120) -> dict:
     """
@@ -34,6 +44,7 @@ def call_ai_service(path: str, payload: dict, timeout: int = 120) -> dict:
         )
 
     full_url = f"{AI_SERVICE_URL.rstrip('/')}{path}"
+    started = time.perf_counter()
 
     try:
         logger.info(f"🔄 Cloud Run AI 서비스 호출: {path}")
@@ -65,23 +76,29 @@ def call_ai_service(path: str, payload: dict, timeout: int = 120) -> dict:
         logger.info(f"✅ Cloud Run AI 서비스 응답 완료: {path}")
         return result
 
+    except HTTPException as e:
+        ai_request_errors.inc(path=path, status=e.status_code)
+        raise
     except requests.exceptions.Timeout:
+        ai_request_errors.inc(path=path, status=504)
         logger.error(f"⏱️ Cloud Run AI 서비스 타임아웃: {path}")
         raise HTTPException(
             status_code=504,
             detail=f"AI 서비스 요청 시간 초과 ({timeout}초)"
         )
     except requests.exceptions.RequestException as e:
+        ai_request_errors.inc(path=path, status=503)
         logger.error(f"❌ Cloud Run AI 서비스 호출 실패: {e}")
         raise HTTPException(
             status_code=503,
             detail=f"AI 서비스에 연결할 수 없습니다: {str(e)}"
         )
-    except HTTPException:
-        raise
     except Exception as e:
+        ai_request_errors.inc(path=path, status=500)
         logger.error(f"❌ 예상치 못한 오류: {e}")
         raise HTTPException(
             status_code=500,
             detail=f"AI 서비스 호출 중 오류 발생: {str(e)}"
         )
+    finally:
+        ai_request_duration.observe(time.perf_counter() - started, path=path)
@@ -0,0 +1,61 @@
+"""
+무거운 의존성 백그라운드 워밍업 모듈
+- 라우트 모듈은 bs4, feedparser, numpy, scikit-learn을 처음 사용할 때 import
+- 서버가 요청을 받기 시작한 뒤 백그라운드 스레드에서 미리 import 해서
+  첫 뉴스/추천 요청이 import 비용을 떠안지 않도록 함
+- WARMUP_IMPORTS=false로 끌 수 있음 (짧게 떴다 내려가는 인스턴스 등)
+"""
+import os
+import time
+import logging
+import importlib
+import threading
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+WARMUP_IMPORTS = os.getenv("WARMUP_IMPORTS", "true").lower() == "true"
+
+# 워밍업 대상 (사용 빈도가 높은 것부터)
+HEAVY_MODULES = [
+    "feedparser",
+    "bs4",
+    "numpy",
+    "sklearn.feature_extraction.text",
+    "sklearn.metrics.pairwise",
+]
+
+# 모듈별 import 시간 (ms), /health 등에서 확인용
+import_times: Dict[str, float] = {}
+_thread: Optional[threading.Thread] = None
+
+
+def _run() -> None:
+    started = time.perf_counter()
+    for name in HEAVY_MODULES:
+        t = time.perf_counter()
+        try:
+            importlib.import_module(name)
+        except ImportError as e:
+            logger.warning(f"⚠️  워밍업 import 실패: {name} ({e})")
+            continue
+        import_times[name] = round((time.perf_counter() - t) * 1000, 1)
+    logger.info(f"🔥 의존성 워밍업 완료: {(time.perf_counter() - started) * 1000:.0f}ms {import_times}")
+
+
+def start() -> None:
+    """백그라운드 워밍업 시작 (이미 시작했거나 비활성화면 무시)"""
+    global _thread
+    if not WARMUP_IMPORTS or _thread is not None:
+        return
+    _thread = threading.Thread(target=_run, name="import-warmup", daemon=True)
+    _thread.start()
+
+
+def status() -> Dict[str, object]:
+    """워밍업 진행 상태"""
+    return {
+        "enabled": WARMUP_IMPORTS,
+        "done": _thread is not None and not _thread.is_alive(),
+        "import_ms": dict(import_times),
+    }
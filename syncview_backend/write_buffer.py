@@ -0,0 +1,219 @@
+"""
+쓰기 지연(write-behind) 버퍼 모듈
+- 이벤트를 메모리에 모았다가 N개가 쌓이거나 T밀리초가 지나면 한 번에 flush
+- flush는 백그라운드 스레드에서 실행되어 요청 처리 시간에 포함되지 않음
+- 서버 종료 시 남은 이벤트를 모두 flush
+- 특정 이벤트 때문에 저장이 실패하면(예: 없는 사용자 FK) 배치를 나눠 다시 저장하고,
+  혼자서도 실패하는 이벤트는 dead letter로 빼서 나머지 이벤트가 막히지 않게 함
+"""
+import time
+import logging
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Type
+
+logger = logging.getLogger(__name__)
+
+
+class WriteBehindBuffer:
+    """이벤트를 모아서 일괄 저장하는 버퍼"""
+
+    def __init__(
+        self,
+        name: str,
+        flush_fn: Callable[[List[Any]], None],
+        max_events: int = 100,
+        max_delay_ms: int = 500,
+        max_buffered: int = 10000,
+        isolate_errors: Tuple[Type[BaseException], ...] = (),
+        max_dead_letters: int = 100,
+    ):
+        """
+        Args:
+            name: 로그/지표에 표시할 이름
+            flush_fn: 이벤트 목록을 저장하는 함수 (실패 시 예외)
+            max_events: 이 개수가 쌓이면 즉시 flush
+            max_delay_ms: 첫 이벤트 이후 이 시간이 지나면 flush
+            max_buffered: 저장 실패가 계속될 때 메모리에 보관할 최대 이벤트 수
+            isolate_errors: 이벤트 자체가 잘못되어 생기는 예외 (무결성 위반 등)
+                - 이 예외로 실패하면 배치를 반으로 나눠 재시도, 1건만 남아도 실패하면 dead letter
+                - 그 밖의 예외(DB 연결 끊김 등)는 배치 전체를 버퍼에 되돌려 다음 flush에서 재시도
+            max_dead_letters: 확인용으로 보관할 최근 dead letter 수
+        """
+        self.name = name
+        self.max_events = max_events
+        self.max_delay = max_delay_ms / 1000
+        self.max_buffered = max_buffered
+        self._flush_fn = flush_fn
+        self.isolate_errors = isolate_errors
+        # 저장할 수 없는 이벤트 (최근 것만 보관, 로그에도 남김)
+        self.dead_letters: Deque[Dict[str, Any]] = deque(maxlen=max_dead_letters)
+
+        self._events: List[Any] = []
+        self._first_event_at: Optional[float] = None
+        self._cond = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+
+        # 지표
+        self.flush_count = 0
+        self.flushed_events = 0
+        self.failed_flushes = 0
+        self.dropped_events = 0
+        self.dead_lettered_events = 0
+        self.last_flush_ms = 0.0
+        self.max_flush_ms = 0.0
+        self._total_flush_ms = 0.0
+
+    def start(self) -> None:
+        """백그라운드 flush 스레드 시작 (이미 실행 중이면 무시)"""
+        with self._cond:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name=f"{self.name}-flusher", daemon=True)
+            self._thread.start()
+        logger.info(f"✅ 쓰기 버퍼 시작: {self.name} (N={self.max_events}, T={int(self.max_delay * 1000)}ms)")
+
+    def stop(self) -> None:
+        """스레드 종료 후 남은 이벤트 flush"""
+        with self._cond:
+            self._stopping = True
+            self._cond.notify()
+        if self._thread:
+            self._thread.join(timeout=10)
+        self.flush()
+        logger.info(f"쓰기 버퍼 종료: {self.name}")
+
+    def add(self, events: List[Any]) -> int:
+        """
+        이벤트 추가
+
+        Returns:
+            추가 후 버퍼에 쌓인 이벤트 수
+        """
+        if not self._thread or not self._thread.is_alive():
+            self.start()
+        with self._cond:
+            was_empty = not self._events
+            if was_empty:
+                self._first_event_at = time.monotonic()
+            self._events.extend(events)
+            depth = len(self._events)
+            # 첫 이벤트면 T 타이머 시작, N개가 차면 즉시 flush
+            if was_empty or depth >= self.max_events:
+                self._cond.notify()
+        return depth
+
+    def _take(self) -> List[Any]:
+        events, self._events = self._events, []
+        self._first_event_at = None
+        return events
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._stopping:
+                    if len(self._events) >= self.max_events:
+                        break
+                    if self._events:
+                        remaining = self.max_delay - (time.monotonic() - self._first_event_at)
+                        if remaining <= 0:
+                            break
+                        self._cond.wait(remaining)
+                    else:
+                        self._cond.wait()
+                if self._stopping:
+                    return
+            if not self.flush():
+                # 저장 실패 시 바로 재시도하지 않고 T만큼 대기
+                with self._cond:
+                    if not self._stopping:
+                        self._cond.wait(self.max_delay)
+
+    def flush(self) -> bool:
+        """
+        현재 쌓인 이벤트를 저장
+        - isolate_errors로 실패한 이벤트는 나눠서 저장하고 혼자 실패하는 이벤트만 dead letter로 제외
+        - 그 밖의 오류면 아직 저장하지 못한 이벤트를 버퍼 앞쪽에 되돌려 다음 flush에서 재시도
+
+        Returns:
+            저장 성공 여부 (저장할 이벤트가 없으면 True, dead letter가 생겨도 나머지를 저장했으면 True)
+        """
+        with self._flush_lock:
+            with self._cond:
+                events = self._take()
+            if not events:
+                return True
+
+            started = time.perf_counter()
+            saved = 0
+            # 저장할 조각 스택 (맨 뒤가 가장 앞쪽 이벤트)
+            pending = [events]
+            while pending:
+                chunk = pending.pop()
+                try:
+                    self._flush_fn(chunk)
+                    saved += len(chunk)
+                except self.isolate_errors as e:
+                    if len(chunk) == 1:
+                        self._dead_letter(chunk[0], e)
+                    else:
+                        # 앞쪽 절반부터 다시 시도
+                        mid = len(chunk) // 2
+                        pending.append(chunk[mid:])
+                        pending.append(chunk[:mid])
+                except Exception as e:
+                    remaining = chunk + [event for part in reversed(pending) for event in part]
+                    self.failed_flushes += 1
+                    self.flushed_events += saved
+                    logger.error(f"❌ 쓰기 버퍼 flush 실패 ({self.name}, {len(remaining)}건): {e}")
+                    self._requeue(remaining)
+                    return False
+
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self.flush_count += 1
+            self.flushed_events += saved
+            self.last_flush_ms = elapsed_ms
+            self.max_flush_ms = max(self.max_flush_ms, elapsed_ms)
+            self._total_flush_ms += elapsed_ms
+            logger.info(f"쓰기 버퍼 flush: {self.name}, {saved}건, {elapsed_ms:.1f}ms")
+            return True
+
+    def _requeue(self, events: List[Any]) -> None:
+        """저장하지 못한 이벤트를 버퍼 앞쪽에 되돌림"""
+        with self._cond:
+            self._events = events + self._events
+            overflow = len(self._events) - self.max_buffered
+            if overflow > 0:
+                # 저장이 계속 실패하면 가장 오래된 이벤트부터 버림
+                del self._events[:overflow]
+                self.dropped_events += overflow
+                logger.error(f"⚠️  쓰기 버퍼 초과로 이벤트 {overflow}건 폐기 ({self.name})")
+            self._first_event_at = time.monotonic()
+
+    def _dead_letter(self, event: Any, error: BaseException) -> None:
+        """혼자서도 저장에 실패하는 이벤트를 버퍼에서 제외"""
+        self.dead_lettered_events += 1
+        self.dead_letters.append({"event": event, "error": str(error).split("\n", 1)[0]})
+        logger.error(f"❌ 저장할 수 없는 이벤트 제외 ({self.name}): {event} ({type(error).__name__})")
+
+    def stats(self) -> Dict[str, Any]:
+        """버퍼 깊이와 flush 지연 시간 지표"""
+        with self._cond:
+            depth = len(self._events)
+        return {
+            "name": self.name,
+            "depth": depth,
+            "max_events": self.max_events,
+            "max_delay_ms": int(self.max_delay * 1000),
+            "flush_count": self.flush_count,
+            "flushed_events": self.flushed_events,
+            "failed_flushes": self.failed_flushes,
+            "dropped_events": self.dropped_events,
+            "dead_lettered_events": self.dead_lettered_events,
+            "last_flush_ms": round(self.last_flush_ms, 2),
+            "avg_flush_ms": round(self._total_flush_ms / self.flush_count, 2) if self.flush_count else 0.0,
+            "max_flush_ms": round(self.max_flush_ms, 2),
+        }
@@ -8,14 +8,17 @@ export default function Bookmark({ user }) {
   const [bookmarks, setBookmarks] = useState([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState(null);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   // ✅ 북마크 목록 가져오기
   useEffect(() => {
     if (user && user.id) {
       setLoading(true);
       getUserBookmarks(user.id)
-        .then((data) => {
-          setBookmarks(data);
+        .then(({ items, nextCursor }) => {
+          setBookmarks(items);
+          setNextCursor(nextCursor);
           setError(null);
         })
         .catch((err) => {
@@ -40,9 +43,8 @@ export default function Bookmark({ user }) {
     try {
       await deleteBookmark(bookmarkId, user.id);
       
-      // 북마크 목록 다시 가져오기
-      const updatedBookmarks = await getUserBookmarks(user.id);
-      setBookmarks(updatedBookmarks);
+      // 이미 불러온 페이지에서만 제거 (다음 페이지 커서는 그대로 유효)
+      setBookmarks((prev) => prev.filter((b) => b.id !== bookmarkId));
       
       alert("북마크가 삭제되었습니다!");
     } catch (err) {
@@ -51,6 +53,23 @@ export default function Bookmark({ user }) {
     }
   };
 
+  // ✅ 다음 페이지 북마크 더 불러오기
+  const handleLoadMore = async () => {
+    if (!user || !user.id || !nextCursor) return;
+
+    setLoadingMore(true);
+    try {
+      const { items, nextCursor: cursor } = await getUserBookmarks(user.id, nextCursor);
+      setBookmarks((prev) => [...prev, ...items]);
+      setNextCursor(cursor);
+    } catch (err) {
+      console.error("북마크 더 불러오기 실패:", err);
+      alert("북마크를 더 불러오는 중 오류가 발생했습니다.");
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   // ✅ 북마크 소스별 색상
   const getSourceColor = (source) => {
     const colors = {
@@ -212,6 +231,19 @@ export default function Bookmark({ user }) {
                 </div>
               );
             })}
+
+            {nextCursor && (
+              <div className="text-center">
+                <button
+                  type="button"
+                  onClick={handleLoadMore}
+                  disabled={loadingMore}
+                  className="px-6 py-3 bg-white/90 text-blue-600 rounded-lg shadow hover:bg-white transition font-semibold disabled:opacity-50"
+                >
+                  {loadingMore ? "불러오는 중..." : "더 보기"}
+                </button>
+              </div>
+            )}
           </div>
         )}
       </main>
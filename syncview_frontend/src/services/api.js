@@ -240,14 +240,20 @@ export async function createBookmark(data) {
   return res.json();
 }
 
-export async function getUserBookmarks(userId) {
-  const res = await fetch(`${API_URL}/bookmarks/${userId}`);
+// 커서 페이지네이션: 다음 페이지 커서는 X-Next-Cursor 헤더로 전달됨 (마지막 페이지면 null)
+export async function getUserBookmarks(userId, cursor = null, limit = 50) {
+  const params = new URLSearchParams({ limit });
+  if (cursor) params.set("cursor", cursor);
+  const res = await fetch(`${API_URL}/bookmarks/${userId}?${params}`);
 
   if (!res.ok) {
     throw new Error(`HTTP ${res.status}: ${res.statusText}`);
   }
 
-  return res.json();
+  return {
+    items: await res.json(),
+    nextCursor: res.headers.get("X-Next-Cursor"),
+  };
 }
 
 export async function deleteBookmark(bookmarkId, userId) {
@@ -324,6 +330,21 @@ export async function recordReadArticle(data) {
   return res.json();
 }
 
+export async function recordReadArticles(items) {
+  const res = await fetch(`${API_URL}/analytics/read-articles`, {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify(items),
+  });
+
+  if (!res.ok) {
+    const err = await res.json().catch(() => ({}));
+    throw new Error(err.detail || "읽기 기록 실패");
+  }
+
+  return res.json();
+}
+
 export async function getUserStats(userId) {
   const res = await fetch(`${API_URL}/analytics/stats/${userId}`);
 
@@ -334,9 +355,11 @@ export async function getUserStats(userId) {
   return res.json();
 }
 
-export async function getReadHistory(userId, limit = 50) {
+export async function getReadHistory(userId, limit = 50, cursor = null) {
+  const params = new URLSearchParams({ limit });
+  if (cursor) params.set("cursor", cursor);
   const res = await fetch(
-    `${API_URL}/analytics/history/${userId}?limit=${limit}`
+    `${API_URL}/analytics/history/${userId}?${params}`
   );
 
   if (!res.ok) {
@@ -346,14 +369,15 @@ export async function getReadHistory(userId, limit = 50) {
   return res.json();
 }
 
-export async function getRecommendedNews(userId, topic, articles) {
+// 추천 후보는 서버의 피드 캐시에서 가져오므로 기사 목록을 보낼 필요 없음
+export async function getRecommendedNews(userId, topic, source) {
   const res = await fetch(`${API_URL}/news/recommend`, {
     method: "POST",
     headers: { "Content-Type": "application/json" },
     body: JSON.stringify({
       user_id: userId,
       topic,
-      articles,
+      source,
     }),
   });
 